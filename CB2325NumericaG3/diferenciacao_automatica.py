@@ -0,0 +1,261 @@
+"""
+Módulo de diferenciação automática no modo direto (forward mode) com números duais.
+
+Um número dual a + b·ε, com ε² = 0, carrega o valor de uma expressão e a sua
+derivada: se x = Dual(x0, 1), então f(x) = Dual(f(x0), f'(x0)) para qualquer f
+escrita com a aritmética do Python e as ufuncs do NumPy (np.sin, np.exp, ...).
+Assim f e f' saem de uma única avaliação, sem o erro de truncamento das
+diferenças finitas. Aninhando duais obtêm-se derivadas de ordem mais alta.
+
+Funções de `math` (math.sin, math.exp, ...) não aceitam números duais; para
+elas é preciso usar as equivalentes do NumPy.
+"""
+
+import numpy as np
+
+
+class Dual:
+    """
+    Número dual valor + derivada·ε, com ε² = 0.
+
+    `valor` e `derivada` podem ser números, arrays do NumPy (para derivar
+    muitos pontos de uma vez) ou outros números duais (para derivadas de
+    ordem mais alta). Comparações usam apenas o valor, de modo que funções
+    definidas por partes (com if/else) continuam funcionando.
+
+    Parameters
+    ----------
+    valor : float, np.ndarray ou Dual
+        Valor da expressão.
+    derivada : float, np.ndarray ou Dual, optional
+        Derivada da expressão (padrão: 0.0, uma constante).
+
+    Exemplos
+    --------
+    >>> x = Dual(2.0, 1.0)
+    >>> y = x**3 + np.sin(x)
+    >>> print(f"{y.valor:.6f} {y.derivada:.6f}")
+    8.909297 11.583853
+    """
+
+    __slots__ = ("valor", "derivada")
+
+    def __init__(self, valor, derivada=0.0):
+        self.valor = valor
+        self.derivada = derivada
+
+    def __repr__(self):
+        return f"Dual({self.valor!r}, {self.derivada!r})"
+
+    # Aritmética
+
+    def __neg__(self):
+        return Dual(-self.valor, -self.derivada)
+
+    def __pos__(self):
+        return self
+
+    def __abs__(self):
+        return np.absolute(self)
+
+    def __add__(self, outro):
+        if isinstance(outro, Dual):
+            return Dual(self.valor + outro.valor, self.derivada + outro.derivada)
+        return Dual(self.valor + outro, self.derivada)
+
+    __radd__ = __add__
+
+    def __sub__(self, outro):
+        if isinstance(outro, Dual):
+            return Dual(self.valor - outro.valor, self.derivada - outro.derivada)
+        return Dual(self.valor - outro, self.derivada)
+
+    def __rsub__(self, outro):
+        return Dual(outro - self.valor, -self.derivada)
+
+    def __mul__(self, outro):
+        if isinstance(outro, Dual):
+            return Dual(self.valor * outro.valor,
+                        self.valor * outro.derivada + self.derivada * outro.valor)
+        return Dual(self.valor * outro, self.derivada * outro)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, outro):
+        if isinstance(outro, Dual):
+            return Dual(self.valor / outro.valor,
+                        (self.derivada * outro.valor - self.valor * outro.derivada) / (outro.valor * outro.valor))
+        return Dual(self.valor / outro, self.derivada / outro)
+
+    def __rtruediv__(self, outro):
+        return Dual(outro / self.valor, -outro * self.derivada / (self.valor * self.valor))
+
+    def __pow__(self, expoente):
+        if isinstance(expoente, Dual):
+            # d(u^v) = u^v (v' ln u + v u'/u)
+            potencia = self.valor ** expoente.valor
+            return Dual(potencia, potencia * (expoente.derivada * np.log(self.valor)
+                                              + expoente.valor * self.derivada / self.valor))
+        if np.ndim(expoente) == 0 and expoente == 0:
+            return Dual(self.valor ** 0, 0.0 * self.derivada)
+        return Dual(self.valor ** expoente, expoente * self.valor ** (expoente - 1) * self.derivada)
+
+    def __rpow__(self, base):
+        potencia = base ** self.valor
+        return Dual(potencia, potencia * np.log(base) * self.derivada)
+
+    # Comparações (só pelo valor)
+
+    def __lt__(self, outro):
+        return self.valor < _valor(outro)
+
+    def __le__(self, outro):
+        return self.valor <= _valor(outro)
+
+    def __gt__(self, outro):
+        return self.valor > _valor(outro)
+
+    def __ge__(self, outro):
+        return self.valor >= _valor(outro)
+
+    def __eq__(self, outro):
+        return self.valor == _valor(outro)
+
+    def __ne__(self, outro):
+        return self.valor != _valor(outro)
+
+    __hash__ = None
+
+    # Ufuncs do NumPy
+
+    def __array_ufunc__(self, ufunc, method, *entradas, **kwargs):
+        if method != "__call__" or kwargs:
+            return NotImplemented
+        if len(entradas) == 2 and ufunc in _BINARIAS:
+            return _BINARIAS[ufunc](*entradas)
+        if len(entradas) == 1:
+            u = entradas[0]
+            if ufunc in _DERIVADAS:
+                return Dual(ufunc(u.valor), _DERIVADAS[ufunc](u.valor) * u.derivada)
+            if ufunc in _CONSTANTES_POR_PARTES:
+                return Dual(ufunc(u.valor), 0.0 * u.derivada)
+        return NotImplemented
+
+
+def _valor(x):
+    """Parte real de x (o próprio x se não for dual)."""
+    return x.valor if isinstance(x, Dual) else x
+
+
+def _derivada(x):
+    """Parte dual de x (zero se x for uma constante)."""
+    return x.derivada if isinstance(x, Dual) else 0.0
+
+
+# Derivada de cada ufunc unária, em função do argumento
+_DERIVADAS = {
+    np.negative: lambda u: -1.0,
+    np.positive: lambda u: 1.0,
+    np.absolute: np.sign,
+    np.square: lambda u: 2.0 * u,
+    np.sqrt: lambda u: 0.5 / np.sqrt(u),
+    np.cbrt: lambda u: 1.0 / (3.0 * np.cbrt(u) ** 2),
+    np.reciprocal: lambda u: -1.0 / (u * u),
+    np.exp: np.exp,
+    np.exp2: lambda u: np.log(2.0) * np.exp2(u),
+    np.expm1: np.exp,
+    np.log: lambda u: 1.0 / u,
+    np.log2: lambda u: 1.0 / (u * np.log(2.0)),
+    np.log10: lambda u: 1.0 / (u * np.log(10.0)),
+    np.log1p: lambda u: 1.0 / (1.0 + u),
+    np.sin: np.cos,
+    np.cos: lambda u: -np.sin(u),
+    np.tan: lambda u: 1.0 / np.cos(u) ** 2,
+    np.arcsin: lambda u: 1.0 / np.sqrt(1.0 - u * u),
+    np.arccos: lambda u: -1.0 / np.sqrt(1.0 - u * u),
+    np.arctan: lambda u: 1.0 / (1.0 + u * u),
+    np.sinh: np.cosh,
+    np.cosh: np.sinh,
+    np.tanh: lambda u: 1.0 / np.cosh(u) ** 2,
+    np.arcsinh: lambda u: 1.0 / np.sqrt(u * u + 1.0),
+    np.arccosh: lambda u: 1.0 / np.sqrt(u * u - 1.0),
+    np.arctanh: lambda u: 1.0 / (1.0 - u * u),
+}
+
+# Ufuncs constantes por partes: derivada nula onde existe
+_CONSTANTES_POR_PARTES = {np.sign, np.floor, np.ceil, np.trunc, np.rint}
+
+# Ufuncs binárias, que recaem nos operadores de Dual
+_BINARIAS = {
+    np.add: lambda u, v: u + v if isinstance(u, Dual) else v + u,
+    np.subtract: lambda u, v: u - v if isinstance(u, Dual) else v.__rsub__(u),
+    np.multiply: lambda u, v: u * v if isinstance(u, Dual) else v * u,
+    np.true_divide: lambda u, v: u / v if isinstance(u, Dual) else v.__rtruediv__(u),
+    np.power: lambda u, v: u ** v if isinstance(u, Dual) else v.__rpow__(u),
+    np.arctan2: lambda u, v: Dual(np.arctan2(_valor(u), _valor(v)),
+                                  (_valor(v) * _derivada(u) - _valor(u) * _derivada(v))
+                                  / (_valor(u) * _valor(u) + _valor(v) * _valor(v))),
+    np.hypot: lambda u, v: np.sqrt(u * u + v * v),
+}
+
+
+def derivadas(f, x, ordem=1):
+    """
+    Calcula f(x) e as suas derivadas até a ordem pedida em uma única avaliação.
+
+    f é chamada uma vez sobre números duais aninhados (um nível por ordem de
+    derivada). x pode ser um número ou um array do NumPy; neste caso f deve
+    aceitar arrays e as derivadas são calculadas ponto a ponto.
+
+    Parameters
+    ----------
+    f : callable
+        Função escrita com a aritmética do Python e ufuncs do NumPy.
+    x : float ou np.ndarray
+        Ponto (ou pontos) de avaliação.
+    ordem : int, optional
+        Maior ordem de derivada desejada (padrão: 1).
+
+    Returns
+    -------
+    tuple
+        (f(x), f'(x), ..., f^(ordem)(x)).
+
+    Raises
+    ------
+    TypeError
+        Se `ordem` não for um inteiro não negativo ou se f devolver algo
+        que não seja um número dual nem uma constante numérica (por
+        exemplo, por usar funções de `math`).
+
+    Exemplos
+    --------
+    >>> f = lambda x: x**3 - 2*x
+    >>> derivadas(f, 2.0, ordem=2)
+    (4.0, 10.0, 12.0)
+    """
+    if not isinstance(ordem, (int, np.integer)) or isinstance(ordem, bool) or ordem < 0:
+        raise TypeError("A ordem da derivada deve ser um inteiro não negativo.")
+
+    # x com um nível de dual por ordem: Dual(Dual(x, 1), 1), ...
+    variavel = x
+    for _ in range(ordem):
+        variavel = Dual(variavel, 1.0)
+
+    resultado = f(variavel)
+    if not isinstance(resultado, Dual) and np.asarray(resultado).dtype.kind not in "biuf":
+        raise TypeError("A função não devolveu um número dual; use funções do NumPy em vez de `math`.")
+
+    # A k-ésima derivada é a parte "derivada" tomada k vezes e depois a parte
+    # "valor" nos níveis restantes; não duais são constantes (derivada nula)
+    valores = []
+    for k in range(ordem + 1):
+        termo = resultado
+        for _ in range(k):
+            termo = _derivada(termo) if isinstance(termo, Dual) else 0.0 * termo
+        while isinstance(termo, Dual):
+            termo = termo.valor
+        if np.ndim(termo) == 0:
+            termo = float(termo)
+        valores.append(termo)
+    return tuple(valores)
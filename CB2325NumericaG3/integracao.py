@@ -1,43 +1,686 @@
-"""Métodos numéricos de integração: trapézio, ponto médio e Simpson, com visualização."""
+"""Métodos numéricos de integração: trapézio, ponto médio, Simpson (fixo e
+adaptativo), Gauss-Legendre, Romberg, tanh-sinh, Clenshaw-Curtis, Filon
+(oscilatória), em lote, assíncrona, acumulada, de amostras tabeladas, de
+interpolantes, multidimensional (produto tensorial e Smolyak) e Monte Carlo
+(Sobol', Halton), com visualização."""
 
+import asyncio
+import inspect
 import math
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 import matplotlib.pyplot as plt
+from matplotlib.collections import PolyCollection
 import numpy as np
+from CB2325NumericaG3.soma_de_kahan import soma_de_kahan_array, soma_de_kahan_lista, soma_de_kahan_acumulada
 
-def poligono4(ponto, ponto2, *, cor='skyblue', alpha=0.7):
+
+class ResultadoIntegral(float):
+
+    """
+    Valor aproximado de ∫_a^b f(x) dx devolvido por 'integral'.
+
+    Comporta-se como um float comum (pode ser somado, comparado e
+    impresso) e guarda informações sobre o cálculo. O gráfico não é
+    gerado durante a integração: 'plotar()' o desenha sob demanda a
+    partir dos nós já avaliados, sem chamar f novamente.
+
+    Atributos:
+      n_avaliacoes : int
+        Número de abscissas distintas em que f foi avaliada.
+
+      metodo : string ou None
+        Regra usada no cálculo.
+
+      nos : np.ndarray ou None
+        Abscissas em que f foi avaliada.
+
+      valores : np.ndarray ou None
+        Valores de f em 'nos'.
+
+      delta_x : float ou None
+        Largura dos subintervalos da partição (None se não for uniforme).
+
+      erro_estimado : float ou None
+        Estimativa do erro absoluto, quando o método a fornece.
+    """
+
+    def __new__(cls, valor, n_avaliacoes=0, metodo=None, nos=None, valores=None, delta_x=None, erro_estimado=None):
+        obj = super().__new__(cls, valor)
+        obj.n_avaliacoes = n_avaliacoes
+        obj.metodo = metodo
+        obj.nos = nos
+        obj.valores = valores
+        obj.delta_x = delta_x
+        obj.erro_estimado = erro_estimado
+        return obj
+
+    def plotar(self, suavidade = 500, cor_grafico = '#1f77b4', opacidade_grafico = 1, cor_area = 'skyblue', opacidade_area = 0.7, grade = True):
+
+        """
+        Desenha a função e as áreas aproximadas usando os nós já avaliados.
+
+        Parametres:
+          suavidade : int, optional
+            Densidade de pontos p/ desenhar as parábolas de Simpson.
+
+          cor_grafico : string, optional
+            Cor da curva f(x).
+
+          opacidade_grafico : float, optional
+            Opacidade da curva f(x).
+
+          cor_area : string, optional
+            Cor do preenchimento das áreas.
+
+          opacidade_area : float, optional
+            Opacidade do preenchimento das áreas.
+
+          grade : bool, optional
+            Se True, exibe grade no gráfico.
+        """
+        if self.nos is None:
+            raise ValueError("O resultado não guarda nós avaliados para desenhar.")
+
+        _desenhar_areas(self.metodo, self.nos, self.valores, self.delta_x, suavidade, cor_area, opacidade_area)
+        plt.plot(self.nos, self.valores, color = cor_grafico, alpha=opacidade_grafico)
+        plt.title(f'Gráfico da função abaixo')
+        if grade:
+            plt.grid()
+        plt.xlabel('Eixo X')
+        plt.ylabel('Eixo Y')
+        plt.show()
+
+
+def _validar_entrada(f, a, b):
+
+    """
+    Valida f e os limites de integração, comuns a todas as regras.
+
+    Returns:
+      a, b : float
+        Limites convertidos para float.
+    """
+    if not callable(f):
+      raise TypeError("O argumento 'funcao' deve ser uma função chamável (callable).")
+
+    # Conversão e validação dos limites
+    try:
+      a = float(a)
+      b = float(b)
+    except Exception:
+      raise TypeError("Os limites de integração devem ser números reais.")
+    
+    # Casos de borda: NaN e infinito
+    if any(math.isnan(x) for x in [a, b]):
+      raise TypeError("Limites de integração não podem ser NaN.")
     
+    if any(math.isinf(x) for x in [a, b]):
+      raise OverflowError("Limites infinitos não são suportados.")
+
+    return a, b
+
+
+def _validar_tol(tol):
+
+    """Garante que a tolerância seja um número real positivo."""
+    if isinstance(tol, bool) or not isinstance(tol, (int, float, np.integer, np.floating)) or not tol > 0:
+        raise ValueError("A tolerância deve ser um número positivo.")
+
+
+def _validar_valores(y, formato):
+
+    """
+    Converte os valores de f para um array de floats e os valida.
+
+    Parametres:
+      y : array_like
+        Valores retornados por f.
+
+      formato : tuple
+        Formato esperado (o mesmo do array de nós).
+
+    Returns:
+      y : np.ndarray
+        Valores como floats.
+    """
+    try:
+        y = np.asarray(y)
+    except ValueError:
+        raise TypeError("A função deve retornar um número real para cada ponto.")
+    if y.dtype.kind == 'c':
+        raise TypeError("A função retornou valor complexo, o que não é suportado.")
+    if y.shape != formato or y.dtype.kind not in 'biuf':
+        raise TypeError("A função deve retornar um número real para cada ponto.")
+
+    y = y.astype(float)
+    if np.isnan(y).any():
+        raise TypeError("A função retornou NaN, o que não é permitido.")
+    if np.isinf(y).any():
+        raise OverflowError("A função retornou infinito, o que não é permitido.")
+    return y
+
+
+def _avaliar_vetorizado(f, x, estrito=False):
+
+    """
+    Avalia f uma única vez sobre o array de nós x.
+
+    Se f não aceitar arrays (lança exceção ou devolve algo com formato
+    diferente de x), retorna None para que o chamador use o caminho
+    escalar. Com 'estrito=True' essa falha vira TypeError.
+
+    Parametres:
+      f : callable
+        Função a ser avaliada.
+
+      x : np.ndarray
+        Nós da partição.
+
+      estrito : bool, optional
+        Se True, não aceita o retorno ao caminho escalar.
+
+    Returns:
+      y : np.ndarray ou None
+        Valores f(x) como floats, no mesmo formato de x.
+    """
+    try:
+        with np.errstate(all='ignore'):
+            y = np.asarray(f(x))
+        if y.shape != x.shape:
+            raise TypeError("Retorno incompatível com o array de nós.")
+    except Exception:
+        if estrito:
+            raise TypeError("A função não pôde ser avaliada sobre um array de nós (vetorizado=True).")
+        return None
+
+    return _validar_valores(y, x.shape)
+
+
+def _avaliar(f, x, vetorizado=None):
+
+    """
+    Avalia f exatamente uma vez em cada nó de x.
+
+    Tenta primeiro a avaliação vetorizada (ver '_avaliar_vetorizado');
+    se f só aceitar escalares, percorre os nós um a um.
+
+    Parametres:
+      f : callable
+        Função a ser avaliada.
+
+      x : np.ndarray
+        Nós distintos onde f será avaliada.
+
+      vetorizado : bool ou None, optional
+        Mesmo significado do argumento de 'integral'.
+
+    Returns:
+      y : np.ndarray
+        Valores f(x) como floats, no mesmo formato de x.
+    """
+    if vetorizado is not False:
+        y = _avaliar_vetorizado(f, x, estrito=vetorizado is True)
+        if y is not None:
+            return y
+
+    valores = []
+    for x_i in x.ravel():
+        try:
+            valores.append(f(float(x_i)))
+        except Exception as erro:
+            raise TypeError("A função fornecida não pôde ser avaliada.") from erro
+    return _validar_valores(valores, (x.size,)).reshape(x.shape)
+
+
+def _resolver_vetorizado(f, x, vetorizado=None):
+
+    """
+    Como '_avaliar', mas devolve também a decisão sobre a vetorização.
+
+    Com 'vetorizado=None', se f não aceitar arrays a decisão devolvida é
+    False: as avaliações seguintes da mesma chamada (níveis, blocos,
+    lotes) vão direto ao caminho escalar, sem repetir a tentativa com o
+    array, que custaria uma chamada de f a mais a cada vez.
+
+    Returns:
+      y : np.ndarray
+        Valores f(x) como floats, no mesmo formato de x.
+
+      vetorizado : bool ou None
+        Valor a ser usado nas próximas avaliações.
+    """
+    if vetorizado is not False:
+        y = _avaliar_vetorizado(f, x, estrito=vetorizado is True)
+        if y is not None:
+            return y, vetorizado
+    return _avaliar(f, x, False), False
+
+
+# Códigos de status de 'integral_lote', um por problema do lote.
+STATUS_LOTE = {
+    0: "ok",
+    1: "limites de integração inválidos (NaN ou infinito)",
+    2: "a função retornou NaN ou infinito",
+    3: "a função não pôde ser avaliada",
+}
+
+# Nós e pesos de Gauss-Legendre em [-1, 1], calculados uma vez por ordem.
+_CACHE_GAUSS = {}
+
+
+def _nos_gauss_legendre(ordem):
+
     """
-    Preenche um quadrilátero com base em y=0 entre duas abscissas.
+    Nós e pesos da regra de Gauss-Legendre com 'ordem' pontos em [-1, 1].
 
-    Desenha um polígono de 4 lados cuja base está em y=0, com vértices
-    x = ponto[0] e x = ponto2[0], e topos em y = ponto[1] e y = ponto2[1].
+    Usa o algoritmo de Golub-Welsch: os nós são os autovalores da matriz
+    de Jacobi (tridiagonal simétrica com beta_k = k / sqrt(4k² - 1)) e
+    os pesos são 2 * v_0², onde v_0 é a primeira componente de cada
+    autovetor normalizado. O resultado fica guardado em '_CACHE_GAUSS',
+    então chamadas repetidas com a mesma ordem não refazem o cálculo.
+
+    Returns:
+      t, w : np.ndarray
+        Nós (crescentes) e pesos, somente leitura.
+    """
+    if ordem not in _CACHE_GAUSS:
+        k = np.arange(1, ordem)
+        beta = k / np.sqrt(4.0*k**2 - 1.0)
+        autovalores, autovetores = np.linalg.eigh(np.diag(beta, 1) + np.diag(beta, -1))
+        t = autovalores
+        w = 2.0 * autovetores[0, :]**2
+        t.setflags(write=False)
+        w.setflags(write=False)
+        _CACHE_GAUSS[ordem] = (t, w)
+    return _CACHE_GAUSS[ordem]
+
+
+class CacheAvaliacoes:
+
+    """
+    Guarda os valores de f já calculados, indexados pela abscissa.
+
+    Um objeto desta classe é chamável como f e pode ser passado no lugar
+    dela para uma sequência de chamadas de 'integral' (por exemplo, com
+    n, 2n, 4n, ...): os nós já avaliados em chamadas anteriores são
+    lidos do cache e f só é chamada nos nós novos. Quando o cache passa
+    de 'max_itens' valores, os usados há mais tempo são descartados (LRU).
+
+    Os valores novos são obtidos e validados como em 'integral' (uma
+    única chamada sobre o array de nós faltantes, se f aceitar arrays).
+    O cache pode ser compartilhado entre threads, mas não entre
+    processos: cada processo teria a sua cópia.
 
     Parametres:
-      ponto : tuple 
-        (x_esq, y_esq).
+      f : callable
+        Função a ser guardada em cache.
+
+      max_itens : int, optional
+        Número máximo de abscissas guardadas.
+
+      vetorizado : bool ou None, optional
+        Mesmo significado do argumento de 'integral', para as chamadas
+        de f feitas pelo cache.
+
+    Atributos:
+      acertos : int
+        Número de abscissas pedidas que já estavam no cache.
+
+      falhas : int
+        Número de abscissas que precisaram ser avaliadas por f.
+
+    Exemplos:
+      >>> g = CacheAvaliacoes(lambda x: np.exp(-x**2))
+      >>> areas = [integral(g, 0, 1, n, plotar=False) for n in (100, 200, 400)]
+      >>> g.falhas   # 401 avaliações no total, em vez de 101 + 201 + 401
+      401
+    """
 
-      ponto2 : tuple
-        (x_dir, y_dir).
+    def __init__(self, f, max_itens = 10**6, vetorizado = None):
+        if not callable(f):
+          raise TypeError("O argumento 'funcao' deve ser uma função chamável (callable).")
+        if not isinstance(max_itens, (int, np.integer)) or max_itens <= 0:
+          raise TypeError("O tamanho máximo do cache deve ser um inteiro positivo.")
 
-      cor : string
-        Cor do preenchimento.
+        self.f = f
+        self.max_itens = max_itens
+        self.vetorizado = vetorizado
+        self.acertos = 0
+        self.falhas = 0
+        self._valores = OrderedDict()
+        self._trava = threading.Lock()
 
-      alpha : float 
-        Opacidade do preenchimento.
+    def __len__(self):
+        return len(self._valores)
+
+    @property
+    def taxa_acertos(self):
+        """Fração das abscissas pedidas que foram atendidas pelo cache."""
+        total = self.acertos + self.falhas
+        return self.acertos / total if total else 0.0
+
+    def limpar(self):
+        """Esvazia o cache e zera as estatísticas."""
+        with self._trava:
+            self._valores.clear()
+            self.acertos = 0
+            self.falhas = 0
+
+    def __call__(self, x):
+        x_array = np.asarray(x, dtype=float)
+        chaves = x_array.ravel().tolist()
+        y = np.empty(len(chaves))
+
+        # Índices das posições de cada abscissa que ainda não está no cache.
+        faltando = {}
+        with self._trava:
+            for i, chave in enumerate(chaves):
+                if chave in self._valores:
+                    self._valores.move_to_end(chave)
+                    y[i] = self._valores[chave]
+                else:
+                    faltando.setdefault(chave, []).append(i)
+
+        if faltando:
+            novos, self.vetorizado = _resolver_vetorizado(self.f, np.array(list(faltando)), self.vetorizado)
+            with self._trava:
+                for (chave, indices), valor in zip(faltando.items(), novos):
+                    y[indices] = valor
+                    self._valores[chave] = valor
+                while len(self._valores) > self.max_itens:
+                    self._valores.popitem(last=False)
+
+        with self._trava:
+            self.falhas += len(faltando)
+            self.acertos += len(chaves) - len(faltando)
+
+        if x_array.ndim == 0:
+            return float(y[0])
+        return y.reshape(x_array.shape)
+
+
+# Número fixo de blocos em que os nós são divididos na avaliação paralela.
+# Não depende do número de workers, então o resultado também não depende.
+_BLOCOS_PARALELOS = 128
+
+
+def _preparar_executor(workers, executor):
+
+    """
+    Interpreta os argumentos 'workers' e 'executor' de 'integral'.
+
+    Returns:
+      executor : Executor ou None
+        Pool a ser usado (None para avaliação sequencial).
+
+      criado : bool
+        Se o pool foi criado aqui (e deve ser encerrado pelo chamador).
+    """
+    if workers is not None and (not isinstance(workers, (int, np.integer)) or workers <= 0):
+      raise TypeError("O número de workers deve ser um inteiro positivo.")
+
+    if isinstance(executor, Executor):
+        return executor, False
+    if executor not in (None, 'processos', 'threads'):
+        raise NameError("O executor deve ser 'processos', 'threads' ou um concurrent.futures.Executor")
+    if workers is None or workers == 1:
+        return None, False
+    if executor == 'threads':
+        return ThreadPoolExecutor(max_workers=workers), True
+    return ProcessPoolExecutor(max_workers=workers), True
+
+
+def _avaliar_paralelo(f, x, vetorizado=None, executor=None):
+
+    """
+    Avalia f nos nós x dividindo-os em blocos contíguos entre os workers.
+
+    Cada bloco é avaliado por '_avaliar' em 'executor' e os valores são
+    reunidos na ordem original, de modo que as somas feitas depois são
+    idênticas às do caminho sequencial. Sem executor, equivale a
+    '_resolver_vetorizado'.
+
+    Com 'vetorizado=None', o primeiro bloco é avaliado aqui mesmo e
+    decide a vetorização dos demais, para que cada worker não repita a
+    tentativa com arrays.
+
+    Returns:
+      y, vetorizado : como em '_resolver_vetorizado'
+    """
+    if executor is None or x.size < 2:
+        return _resolver_vetorizado(f, x, vetorizado)
+
+    blocos = np.array_split(x.ravel(), min(_BLOCOS_PARALELOS, x.size))
+    primeiro = []
+    if vetorizado is None:
+        y, vetorizado = _resolver_vetorizado(f, blocos[0])
+        primeiro, blocos = [y], blocos[1:]
+    futuros = [executor.submit(_avaliar, f, bloco, vetorizado) for bloco in blocos]
+    return np.concatenate(primeiro + [futuro.result() for futuro in futuros]).reshape(x.shape), vetorizado
+
+
+def _nos_particao(metodo, a, b, n, ordem=None):
+
+    """
+    Abscissas distintas usadas por cada regra composta.
+
+    'trapezio' usa os n+1 extremos dos subintervalos, 'ponto_medio' os
+    n pontos médios e 'simpson' os 2n+1 pontos formados pelos extremos
+    e pontos médios intercalados. Nós compartilhados entre subintervalos
+    vizinhos aparecem uma única vez. 'gauss' usa os 'ordem' nós de
+    Gauss-Legendre de cada subintervalo, em sequência (n * ordem nós).
+
+    a e b podem ser arrays de mesmo formato (vários intervalos): os nós
+    de cada intervalo ficam no último eixo.
+    """
+    if metodo == 'trapezio':
+        return np.linspace(a, b, n + 1, axis=-1)
+    if metodo == 'simpson':
+        return np.linspace(a, b, 2*n + 1, axis=-1)
+
+    delta_x = np.asarray((b - a) / n)[..., None]
+    a = np.asarray(a)[..., None]
+    if metodo == 'ponto_medio':
+        return a + (np.arange(n) + 0.5) * delta_x
+    t, _ = _nos_gauss_legendre(ordem)
+    return a + delta_x * (np.arange(n)[:, None] + (t + 1.0) / 2.0).ravel()
+
+
+def _termos_regra(metodo, valores, delta_x, ordem=None):
+
+    """
+    Área de cada subintervalo a partir dos valores nos nós de
+    '_nos_particao' (ao longo do último eixo de 'valores').
+    """
+    delta_x = np.asarray(delta_x)[..., None]
+    if metodo == 'trapezio':
+        return (valores[..., :-1] + valores[..., 1:]) * (delta_x / 2.0)
+    if metodo == 'ponto_medio':
+        return delta_x * valores
+    if metodo == 'gauss':
+        _, w = _nos_gauss_legendre(ordem)
+        return valores.reshape(*valores.shape[:-1], -1, ordem) @ w * (delta_x / 2.0)
+    return (valores[..., :-1:2] + 4.0*valores[..., 1::2] + valores[..., 2::2]) * (delta_x / 6.0)
+
+
+def _aplicar_regra(metodo, valores, delta_x, ordem=None, compensada=False):
+
+    """
+    Soma as áreas de cada subintervalo dadas por '_termos_regra'.
+
+    Com 'compensada=True' (apenas para 'valores' unidimensional), as
+    áreas são acumuladas por 'soma_de_kahan_array' em vez da soma usual.
+    """
+    termos = _termos_regra(metodo, valores, delta_x, ordem)
+    if compensada:
+        return soma_de_kahan_array(termos)
+    return termos.sum(axis=-1)
+
+
+def _simpson_adaptativo(f, a, b, n, tol, vetorizado=None, executor=None, compensada=False, max_niveis=50, max_avaliacoes=10**7):
+
+    """
+    Simpson adaptativo: subdivide apenas os subintervalos cujo erro
+    local estimado ainda é grande.
+
+    Parte de n subintervalos. Em cada nível, todos os subintervalos
+    ainda ativos são divididos ao meio de uma só vez: só os dois pontos
+    a 1/4 e 3/4 de cada um são novos (extremos e ponto médio vêm do
+    nível anterior) e são avaliados numa única chamada de
+    '_avaliar_paralelo'.
+    Um subintervalo de largura h é aceito quando
+    |S_esq + S_dir - S| <= 15 * tol * h / |b - a|, com a correção de
+    Richardson (S_esq + S_dir - S) / 15 somada ao valor aceito.
+
+    Returns:
+      soma, erro, nos, valores, n_avaliacoes
+    """
+    x = np.linspace(a, b, 2*n + 1)
+    y, vetorizado = _avaliar_paralelo(f, x, vetorizado, executor)
+    nos, valores = [x], [y]
+
+    esq, meio, dir = x[:-1:2], x[1::2], x[2::2]
+    f_esq, f_meio, f_dir = y[:-1:2], y[1::2], y[2::2]
+    S = (dir - esq) / 6.0 * (f_esq + 4.0*f_meio + f_dir)
+    tols = np.full(n, tol / n)
+
+    partes, erros = [], []
+    n_avaliacoes = x.size
+    for _ in range(max_niveis):
+        n_avaliacoes += 2 * esq.size
+        if n_avaliacoes > max_avaliacoes:
+            raise RuntimeError(f"Simpson adaptativo não atingiu tol={tol} com até {max_avaliacoes} avaliações.")
+        q = np.concatenate(((esq + meio) / 2.0, (meio + dir) / 2.0))
+        f_q, vetorizado = _avaliar_paralelo(f, q, vetorizado, executor)
+        nos.append(q)
+        valores.append(f_q)
+        q1, q3 = q[:esq.size], q[esq.size:]
+        f_q1, f_q3 = f_q[:esq.size], f_q[esq.size:]
+
+        S_esq = (meio - esq) / 6.0 * (f_esq + 4.0*f_q1 + f_meio)
+        S_dir = (dir - meio) / 6.0 * (f_meio + 4.0*f_q3 + f_dir)
+        diferenca = S_esq + S_dir - S
+
+        aceito = np.abs(diferenca) <= 15.0 * tols
+        partes.append(S_esq[aceito] + S_dir[aceito] + diferenca[aceito] / 15.0)
+        erros.append(np.abs(diferenca[aceito]) / 15.0)
+
+        r = ~aceito
+        if not r.any():
+            break
+
+        # Cada subintervalo rejeitado vira dois filhos que herdam as avaliações do pai.
+        esq, meio, dir = (np.concatenate((esq[r], meio[r])), np.concatenate((q1[r], q3[r])),
+                          np.concatenate((meio[r], dir[r])))
+        f_esq, f_meio, f_dir = (np.concatenate((f_esq[r], f_meio[r])), np.concatenate((f_q1[r], f_q3[r])),
+                                np.concatenate((f_meio[r], f_dir[r])))
+        S = np.concatenate((S_esq[r], S_dir[r]))
+        tols = np.concatenate((tols[r], tols[r])) / 2.0
+    else:
+        raise RuntimeError(f"Simpson adaptativo não atingiu tol={tol} após {max_niveis} níveis de subdivisão.")
+
+    nos, valores = np.concatenate(nos), np.concatenate(valores)
+    ordem = np.argsort(nos)
+    partes = np.concatenate(partes)
+    return (soma_de_kahan_array(partes) if compensada else partes.sum(), np.concatenate(erros).sum(),
+            nos[ordem], valores[ordem], n_avaliacoes)
+
+
+_MAX_AREAS = 1000          # acima disso, subintervalos vizinhos são agrupados
+_MAX_VERTICES_AREA = 32    # vértices do topo de cada área agrupada
+
+
+def _desenhar_areas(metodo, x, y, delta_x, suavidade, cor, alpha):
+
+    """
+    Desenha as áreas aproximadas a partir dos nós já avaliados.
+
+    Os arrays seguem a disposição de '_nos_particao'.
+    Em 'adaptativo' e 'gauss' os nós não são uniformes; neles e em
+    'romberg' as áreas são desenhadas como trapézios entre nós
+    consecutivos.
+
+    O topo de todas as áreas é calculado de uma vez com operações de
+    array e tudo é desenhado numa única PolyCollection. Com mais de
+    '_MAX_AREAS' subintervalos (que já não se distinguem na tela),
+    subintervalos vizinhos são agrupados em uma só área, cujo topo é
+    amostrado com no máximo '_MAX_VERTICES_AREA' vértices; assim o custo
+    do desenho não cresce com n.
     """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    if x.size == 0:
+        return
 
-    x_vertices = [ponto[0], ponto2[0], ponto2[0], ponto[0]]
-    y_vertices = [ponto[1], ponto2[1], 0,        0       ]
-    plt.fill(x_vertices, y_vertices, color=cor, alpha=alpha)
+    # topos[i] = vértices (x, y) do topo da i-ésima área, da esquerda para a direita
+    if metodo == 'ponto_medio':
+        metade = delta_x / 2.0
+        topos = np.stack((np.stack((x - metade, x + metade), axis=-1),
+                          np.stack((y, y), axis=-1)), axis=-1)
+    elif metodo == 'simpson':
+        k = max(math.floor(abs(delta_x)*suavidade), 3)
+        s_ = np.linspace(0.0, 2.0, k)
+        y0, y1, y2 = y[:-1:2, None], y[1::2, None], y[2::2, None]
+        parabola = y0*(s_ - 1)*(s_ - 2)/2 - y1*s_*(s_ - 2) + y2*s_*(s_ - 1)/2
+        topos = np.stack((x[:-1:2, None] + s_*(delta_x/2.0), parabola), axis=-1)
+    else:
+        if x.size < 2:
+            return
+        topos = np.stack((np.stack((x[:-1], x[1:]), axis=-1),
+                          np.stack((y[:-1], y[1:]), axis=-1)), axis=-1)
+
+    m, k, _ = topos.shape
+    if m > _MAX_AREAS:
+        grupo = -(-m // _MAX_AREAS)
+        blocos = -(-m // grupo)
+        # o último grupo é completado repetindo o último vértice
+        resto = np.repeat(topos[-1:, -1:], (blocos*grupo - m)*k, axis=1).reshape(-1, k, 2)
+        topos = np.concatenate((topos, resto)).reshape(blocos, grupo*k, 2)
+        passo = -(-grupo*k // _MAX_VERTICES_AREA)
+        indices = np.unique(np.r_[np.arange(0, grupo*k, passo), grupo*k - 1])
+        topos = topos[:, indices]
+
+    base = np.zeros((topos.shape[0], 1, 2))
+    esquerda, direita = base.copy(), base.copy()
+    esquerda[:, 0, 0] = topos[:, 0, 0]
+    direita[:, 0, 0] = topos[:, -1, 0]
+    vertices = np.concatenate((esquerda, topos, direita), axis=1)
+
+    ax = plt.gca()
+    ax.add_collection(PolyCollection(vertices, facecolors=cor, edgecolors=cor, linewidths=0.5, alpha=alpha))
+    ax.autoscale_view()
 
 
-def integral(f, a, b, n, plotar = True, metodo = "trapezio", suavidade = 500, cor_grafico = '#1f77b4', opacidade_grafico = 1, cor_area = 'skyblue', opacidade_area = 0.7, grade =True):
+def integral(f, a, b, n, plotar = True, metodo = "trapezio", suavidade = 500, cor_grafico = '#1f77b4', opacidade_grafico = 1, cor_area = 'skyblue', opacidade_area = 0.7, grade =True, vetorizado = None, tol = 1e-8, ordem = 5, workers = None, executor = None, compensada = False):
     
     """
-    Aproxima ∫_a^b f(x) dx por trapézio, ponto_medio ou simpson.
+    Aproxima ∫_a^b f(x) dx por trapézio, ponto_medio, simpson, gauss ou adaptativo.
+
+    A partição é uniforme: delta_x = (b - a) / n. O gráfico é desenhado
+    apenas com os nós usados na quadratura: nenhuma avaliação extra de f
+    é feita para plotar, e com 'plotar=False' o custo é só o da regra.
+    O gráfico também pode ser gerado depois, com 'resultado.plotar()'.
+
+    Cada abscissa distinta da partição é avaliada uma única vez: n+1
+    pontos no trapézio, n no ponto médio e 2n+1 em Simpson.
+
+    Com metodo='gauss', cada subintervalo usa a regra de Gauss-Legendre
+    com 'ordem' pontos, exata para polinômios de grau até 2*ordem - 1.
+    Os nós e pesos de cada ordem são calculados uma única vez e ficam
+    guardados para as chamadas seguintes.
+
+    Com metodo='adaptativo', n é só a partição inicial: os subintervalos
+    são divididos (Simpson adaptativo) apenas onde o erro local estimado
+    excede a parcela de 'tol' que lhes cabe, até o erro total ficar
+    abaixo de 'tol'.
 
-    A partição é uniforme: delta_x = (b - a) / n. Para 'plotar=True',
-    a função é amostrada com 'suavidade' pontos por unidade de comprimento.
+    Se f aceitar arrays do NumPy (ex.: lambda x: np.sin(x) * x**2), ela é
+    chamada uma única vez sobre todos os nós da partição e as somas são
+    feitas com operações de array. Funções apenas escalares continuam
+    sendo avaliadas ponto a ponto.
 
     Parametres:
       f : callable
@@ -56,10 +699,10 @@ def integral(f, a, b, n, plotar = True, metodo = "trapezio", suavidade = 500, co
         Se True, desenha função e áreas aproximadas.
 
       metodo : string, optional
-        'trapezio', 'ponto_medio' ou 'simpson'.
+        'trapezio', 'ponto_medio', 'simpson', 'gauss' ou 'adaptativo'.
 
       suavidade : int, optional
-        Densidade de pontos p/ desenhar a curva (plot).
+        Densidade de pontos p/ desenhar as parábolas de Simpson (plot).
 
       cor_grafico : string, optional
         Cor da curva f(x).
@@ -76,118 +719,1760 @@ def integral(f, a, b, n, plotar = True, metodo = "trapezio", suavidade = 500, co
       grade : bool, optional
         Se True, exibe grade no gráfico.
 
-    Returns:
-      soma : float 
-        Aproximação numérica de ∫_a^b f(x) dx.
-    """
-    if not callable(f):
-      raise TypeError("O argumento 'funcao' deve ser uma função chamável (callable).")
-    
-    try:
-        # Testa se a função pode ser avaliada
-        teste = f((a + b) / 2)
-    except Exception:
-        raise TypeError("A função fornecida não pôde ser avaliada.")
+      vetorizado : bool ou None, optional
+        None (padrão) tenta avaliar f sobre o array de nós e, se não for
+        possível, usa o caminho escalar. True exige a avaliação vetorizada
+        (TypeError se f não aceitar arrays); False força o caminho escalar,
+        com exatamente uma chamada de f por nó.
 
-    # Checa se o retorno é válido
-    if isinstance(teste, complex):
-        raise TypeError("A função retornou valor complexo, o que não é suportado.")
+      tol : float, optional
+        Tolerância do erro absoluto para metodo='adaptativo'.
 
-    if math.isnan(teste):
-        raise TypeError("A função retornou NaN, o que não é permitido.")
+      ordem : int, optional
+        Número de pontos de Gauss-Legendre por subintervalo (metodo='gauss').
 
-    if math.isinf(teste):
-        raise OverflowError("A função retornou infinito, o que não é permitido.")
-        # Conversão e validação dos limites
-    try:
-      a = float(a)
-      b = float(b)
-    except Exception:
-      raise TypeError("Os limites de integração devem ser números reais.")
-    
-    # Casos de borda: NaN e infinito
-    if any(math.isnan(x) for x in [a, b]):
-      raise TypeError("Limites de integração não podem ser NaN.")
-    
-    if any(math.isinf(x) for x in [a, b]):
-      raise OverflowError("Limites infinitos não são suportados.")
+      workers : int, optional
+        Se maior que 1, os nós são divididos em blocos contíguos avaliados
+        em paralelo por um pool com esse número de workers. O resultado
+        é o mesmo para qualquer número de workers.
+
+      executor : string ou concurrent.futures.Executor, optional
+        'processos' (padrão, para f lenta em Python puro; f precisa ser
+        serializável com pickle, ou seja, definida no nível de módulo),
+        'threads' (para f limitada por E/S ou que libera o GIL) ou um
+        Executor já existente, que é usado sem ser encerrado.
+
+      compensada : bool, optional
+        Se True, as áreas dos subintervalos são acumuladas com soma
+        compensada ('soma_de_kahan_array'), processada em blocos de
+        arrays. Indicado para n muito grande, quando o erro de
+        arredondamento da soma passa a dominar o erro de discretização.
+
+    Returns:
+      soma : ResultadoIntegral
+        Aproximação numérica de ∫_a^b f(x) dx (um float), com o número
+        de avaliações de f em 'soma.n_avaliacoes' e os nós avaliados
+        para o gráfico sob demanda ('soma.plotar()'). No método
+        adaptativo, 'soma.erro_estimado' traz o erro estimado atingido.
+
+    Raises:
+      RuntimeError
+        Se o método adaptativo não atingir 'tol' no limite de subdivisões.
+    """
+    a, b = _validar_entrada(f, a, b)
     
     # Validação de partições
     if not isinstance(n, (int, np.integer)) or n <= 0:
       raise TypeError("O número de partições deve ser um inteiro positivo.")
     
     if a == b:
-      return 0
+      return ResultadoIntegral(0.0)
 
-    if metodo not in ['trapezio', 'simpson', 'ponto_medio']:
-      raise NameError('O método deve ser trapezio, simpson ou ponto_medio')
+    if metodo not in ['trapezio', 'simpson', 'ponto_medio', 'gauss', 'adaptativo']:
+      raise NameError('O método deve ser trapezio, simpson, ponto_medio, gauss ou adaptativo')
+
+    if metodo == 'gauss' and (not isinstance(ordem, (int, np.integer)) or ordem <= 0):
+      raise TypeError("A ordem de Gauss-Legendre deve ser um inteiro positivo.")
     
     delta_x = (b - a) / n
-    soma = 0.0
-    tamanho_intervalo = abs(b-a)
-    n_pontos_f = max(1, round(tamanho_intervalo*suavidade))
-    delta_x_funçao = (b-a)/n_pontos_f
-
-    F = []
-    X = []
 
-    for i in range(n_pontos_f+1):
-        x_i = a+i*delta_x_funçao
-        X.append(x_i)
-        F.append(f(x_i))
+    if metodo == 'adaptativo':
+        _validar_tol(tol)
 
-    if metodo == 'trapezio':
-        for i in range(n):
-            x_esq = a + i * delta_x
-            x_dir = x_esq + delta_x
-            f_esq = f(x_esq)
-            f_dir = f(x_dir)
-            f_xm = (f_esq+f_dir)/2
-            soma += f_xm * delta_x
-            if plotar:
-                poligono4((x_esq, f_esq), (x_dir, f_dir),cor=cor_area, alpha=opacidade_area)
-    elif metodo == 'ponto_medio':
-        for i in range(n):
-            x_esq = a + i * delta_x
-            x_dir = x_esq + delta_x
-            x_med = (x_esq + x_dir) / 2.0
-            f_xm = f(x_med)
-            soma += f_xm * delta_x
-            if plotar:
-                poligono4((x_esq, f_xm), (x_dir, f_xm),cor=cor_area, alpha=opacidade_area)
+    executor, criado = _preparar_executor(workers, executor)
+    try:
+        if metodo == 'adaptativo':
+            valor, erro, nos, valores, n_avaliacoes = _simpson_adaptativo(f, a, b, n, tol, vetorizado, executor, compensada)
+            soma = ResultadoIntegral(valor, n_avaliacoes=n_avaliacoes, metodo=metodo,
+                                     nos=nos, valores=valores, erro_estimado=erro)
+        else:
+            # Cada nó distinto é avaliado uma única vez; os valores também
+            # servem para validar o retorno de f (NaN, infinito, complexo...).
+            nos = _nos_particao(metodo, a, b, n, ordem)
+            valores, _ = _avaliar_paralelo(f, nos, vetorizado, executor)
+            soma = ResultadoIntegral(_aplicar_regra(metodo, valores, delta_x, ordem, compensada), n_avaliacoes=nos.size,
+                                     metodo=metodo, nos=nos, valores=valores, delta_x=delta_x)
+    finally:
+        if criado:
+            executor.shutdown()
 
-    elif metodo == 'simpson':
-        for i in range(n):
-            x_esq = a + i * delta_x
-            x_dir = x_esq + delta_x
-            x_med = (x_esq + x_dir) / 2.0
-
-            f_esq = f(x_esq)
-            f_dir = f(x_dir)
-            f_xm = f(x_med)
-            
-            if plotar:
-                x_pontos = np.array([x_esq,x_med,x_dir])
-                y_pontos = np.array([f_esq,f_xm,f_dir])
-
-                a_p,b_p,c_p = np.polyfit(x_pontos,y_pontos,2)
-                g = lambda t: a_p*t**2+b_p*t+c_p 
-                n_pontos_g = math.floor(delta_x*suavidade)
-
-                X_G = np.linspace(x_esq, x_dir, n_pontos_g)
-                G = g(X_G)
-
-                plt.fill_between(X_G, G, color=cor_area, alpha=opacidade_area)
-
-            soma += (f_esq + 4.0*f_xm + f_dir) * (delta_x / 6.0)
-               
     if plotar:
-        plt.plot(X,F,color = cor_grafico, alpha=opacidade_grafico)
-        plt.title(f'Gráfico da função abaixo')
-        if grade:
-            plt.grid()
-        plt.xlabel('Eixo X')
-        plt.ylabel('Eixo Y')
-        plt.show()
+        soma.plotar(suavidade=suavidade, cor_grafico=cor_grafico, opacidade_grafico=opacidade_grafico,
+                    cor_area=cor_area, opacidade_area=opacidade_area, grade=grade)
+
+    return soma
+
+
+def integral_cumulativa(f, a, b, n, metodo = "trapezio", ordem = 5, vetorizado = None, compensada = True):
+
+    """
+    Calcula F(x_k) = integral de f de a até x_k em todos os pontos da partição.
+
+    Os nós são avaliados uma única vez, como em 'integral', e as áreas
+    de cada subintervalo são acumuladas por somas parciais (O(n), em vez
+    de uma chamada de 'integral' por ponto). F[k] coincide com
+    integral(f, a, x_k, k, metodo=metodo) a menos de arredondamento.
+
+    Parametres:
+      f : function
+        Função a ser integrada.
+
+      a, b : float
+        Limites de integração.
+
+      n : int
+        Número de subintervalos.
+
+      metodo : string, optional
+        'trapezio', 'simpson', 'ponto_medio' ou 'gauss'.
+
+      ordem : int, optional
+        Número de pontos por subintervalo no método 'gauss'.
+
+      vetorizado : bool or None, optional
+        Igual a 'integral'.
+
+      compensada : bool, optional
+        Se True (padrão), as somas parciais são feitas com
+        'soma_de_kahan_acumulada'; se False, com np.cumsum.
+
+    Returns:
+      x : np.ndarray
+        Os n+1 pontos da partição, x_k = a + k*(b-a)/n.
+
+      F : np.ndarray
+        Integral acumulada em cada x_k, com F[0] = 0.
+
+    Exemplos:
+      >>> x, F = integral_cumulativa(np.cos, 0, np.pi, 100, metodo="simpson")
+      >>> seno = linear_interp(x, F, plot=False)   # tabela de consulta
+    """
+    a, b = _validar_entrada(f, a, b)
+
+    if not isinstance(n, (int, np.integer)) or n <= 0:
+      raise TypeError("O número de subintervalos deve ser um inteiro positivo.")
+
+    if metodo not in ['trapezio', 'simpson', 'ponto_medio', 'gauss']:
+      raise NameError('O método deve ser trapezio, simpson, ponto_medio ou gauss')
+
+    if metodo == 'gauss' and (not isinstance(ordem, (int, np.integer)) or ordem <= 0):
+      raise TypeError("A ordem da quadratura de Gauss deve ser um inteiro positivo.")
+
+    x = np.linspace(a, b, n + 1)
+    if a == b:
+      return x, np.zeros(n + 1)
+
+    delta_x = (b - a) / n
+    nos = _nos_particao(metodo, a, b, n, ordem)
+    valores = _avaliar(f, nos, vetorizado)
+    termos = _termos_regra(metodo, valores, delta_x, ordem)
+
+    F = np.empty(n + 1)
+    F[0] = 0.0
+    F[1:] = soma_de_kahan_acumulada(termos) if compensada else np.cumsum(termos)
+    return x, F
+
+
+async def _avaliar_async(f, x, concorrencia):
+
+    """
+    Avalia f em cada nó de x concorrentemente, com no máximo
+    'concorrencia' avaliações em andamento ao mesmo tempo.
+
+    f pode ser uma função 'async def' (ou retornar um awaitable) ou uma
+    função comum.
+    """
+    semaforo = asyncio.Semaphore(concorrencia)
+
+    async def avaliar_no(x_i):
+        async with semaforo:
+            try:
+                y_i = f(float(x_i))
+                if inspect.isawaitable(y_i):
+                    y_i = await y_i
+            except Exception as erro:
+                raise TypeError("A função fornecida não pôde ser avaliada.") from erro
+            return y_i
+
+    valores = await asyncio.gather(*(avaliar_no(x_i) for x_i in x.ravel()))
+    return _validar_valores(valores, (x.size,)).reshape(x.shape)
+
+
+async def integral_async(f, a, b, n, metodo = "trapezio", ordem = 5, concorrencia = 32, compensada = False, plotar = False):
+
+    """
+    Versão assíncrona de 'integral' para funções 'async def'.
+
+    Os nós da partição são os mesmos de 'integral' e são avaliados
+    concorrentemente (até 'concorrencia' chamadas de f em andamento ao
+    mesmo tempo, controladas por um asyncio.Semaphore). Com f lenta por
+    latência (por exemplo, consultas a um serviço), o tempo total passa
+    a depender da concorrência do serviço, e não da soma das latências.
+    O resultado é o mesmo de 'integral' com o mesmo método e partição.
+
+    Parametres:
+      f : callable
+        Função escalar, 'async def' ou comum.
+
+      a, b : float
+        Limites de integração.
+
+      n : int
+        Número de subintervalos.
+
+      metodo : string, optional
+        'trapezio', 'simpson', 'ponto_medio' ou 'gauss'.
+
+      ordem : int, optional
+        Número de pontos por subintervalo no método 'gauss'.
+
+      concorrencia : int, optional
+        Número máximo de avaliações simultâneas de f.
+
+      compensada : bool, optional
+        Igual a 'integral'.
+
+      plotar : bool, optional
+        Se True, desenha o gráfico como 'integral'. O padrão é False
+        porque 'plt.show()' bloqueia o laço de eventos; prefira chamar
+        'soma.plotar()' depois de sair da corrotina.
+
+    Returns:
+      soma : ResultadoIntegral
+        Aproximação da integral.
+
+    Exemplos:
+      >>> async def f(x):
+      ...     return await servico.consultar(x)
+      >>> area = asyncio.run(integral_async(f, 0, 1, 100, concorrencia=16))
+      >>> area.plotar()
+    """
+    a, b = _validar_entrada(f, a, b)
+
+    if not isinstance(n, (int, np.integer)) or n <= 0:
+      raise TypeError("O número de partições deve ser um inteiro positivo.")
+
+    if not isinstance(concorrencia, (int, np.integer)) or concorrencia <= 0:
+      raise TypeError("A concorrência deve ser um inteiro positivo.")
+
+    if a == b:
+      return ResultadoIntegral(0.0)
+
+    if metodo not in ['trapezio', 'simpson', 'ponto_medio', 'gauss']:
+      raise NameError('O método deve ser trapezio, simpson, ponto_medio ou gauss')
+
+    if metodo == 'gauss' and (not isinstance(ordem, (int, np.integer)) or ordem <= 0):
+      raise TypeError("A ordem de Gauss-Legendre deve ser um inteiro positivo.")
+
+    delta_x = (b - a) / n
+    nos = _nos_particao(metodo, a, b, n, ordem)
+    valores = await _avaliar_async(f, nos, concorrencia)
+    soma = ResultadoIntegral(_aplicar_regra(metodo, valores, delta_x, ordem, compensada), n_avaliacoes=nos.size,
+                             metodo=metodo, nos=nos, valores=valores, delta_x=delta_x)
+
+    if plotar:
+        soma.plotar()
+
+    return soma
+
+
+def integral_romberg(f, a, b, tol = 1e-12, max_niveis = 20, plotar = True, vetorizado = None):
+
+    """
+    Aproxima ∫_a^b f(x) dx pelo método de Romberg.
+
+    Constrói a sequência de trapézios T(h), T(h/2), T(h/4), ... dobrando
+    o número de subintervalos a cada nível. Cada nível avalia f apenas
+    nos novos pontos médios: todos os valores anteriores são
+    reaproveitados. A extrapolação de Richardson é aplicada na tabela
+
+      R[k][j] = R[k][j-1] + (R[k][j-1] - R[k-1][j-1]) / (4^j - 1)
+
+    e o cálculo para quando dois elementos diagonais consecutivos
+    diferem menos que 'tol' (a partir do 4º nível, para evitar falsas
+    convergências em funções que se anulam nos primeiros nós; com
+    'max_niveis' < 4, o critério vale no último nível permitido).
+
+    Parametres:
+      f : callable
+        Função escalar (f(x) -> float), ou que aceite arrays.
+
+      a : float
+        Extremo esquerdo do intervalo.
+
+      b : float
+        Extremo direito do intervalo.
+
+      tol : float, optional
+        Tolerância entre elementos diagonais consecutivos.
+
+      max_niveis : int, optional
+        Número máximo de refinamentos (até 2^max_niveis subintervalos).
+
+      plotar : bool, optional
+        Se True, desenha a função e os trapézios do último nível.
+
+      vetorizado : bool ou None, optional
+        Mesmo significado do argumento de 'integral'.
+
+    Returns:
+      soma : ResultadoIntegral
+        Último elemento diagonal da tabela. 'soma.tabela' guarda a
+        tabela de Romberg completa (lista de linhas, a linha k com k+1
+        elementos) e 'soma.erro_estimado' a diferença diagonal final.
+
+    Raises:
+      RuntimeError
+        Se a tolerância não for atingida em 'max_niveis' níveis.
+    """
+    a, b = _validar_entrada(f, a, b)
+    _validar_tol(tol)
+    if not isinstance(max_niveis, (int, np.integer)) or max_niveis <= 0:
+      raise TypeError("O número máximo de níveis deve ser um inteiro positivo.")
+
+    if a == b:
+      return ResultadoIntegral(0.0)
+
+    nos = [np.array([a, b])]
+    y, vetorizado = _resolver_vetorizado(f, nos[0], vetorizado)
+    valores = [y]
+    h = b - a
+    tabela = [[h / 2.0 * (valores[0][0] + valores[0][1])]]
+
+    for k in range(1, max_niveis + 1):
+        h /= 2.0
+        novos = a + h * (2.0 * np.arange(2**(k-1)) + 1.0)
+        f_novos = _avaliar(f, novos, vetorizado)
+        nos.append(novos)
+        valores.append(f_novos)
+
+        linha = [tabela[-1][0] / 2.0 + h * f_novos.sum()]
+        for j in range(1, k + 1):
+            linha.append(linha[j-1] + (linha[j-1] - tabela[-1][j-1]) / (4**j - 1))
+        erro = abs(linha[-1] - tabela[-1][-1])
+        tabela.append(linha)
+
+        if (k >= 4 or k == max_niveis) and erro <= tol:
+            break
+    else:
+        raise RuntimeError(f"Método de Romberg não convergiu após {max_niveis} níveis. "
+                           f"Última diferença: {erro:.3e}")
+
+    nos, valores = np.concatenate(nos), np.concatenate(valores)
+    ordem = np.argsort(nos)
+    soma = ResultadoIntegral(tabela[-1][-1], n_avaliacoes=nos.size, metodo='romberg',
+                             nos=nos[ordem], valores=valores[ordem], delta_x=h, erro_estimado=erro)
+    soma.tabela = tabela
+
+    if plotar:
+        soma.plotar()
+
+    return soma
+
+
+_CACHE_TANH_SINH = {}
+_T_MAX_TANH_SINH = {'tanh_sinh': 6.0, 'exp_sinh': 5.0, 'sinh_sinh': 5.0}
+
+
+def _nivel_tanh_sinh(transformacao, nivel):
+
+    """
+    Parâmetros t_j = j*h (h = 2^-nivel) que o nível acrescenta e os
+    valores das transformações duplamente exponenciais neles. O nível 0
+    tem t = 0, ±1, ±2, ...; o nível k > 0, apenas os múltiplos ímpares de
+    2^-k, de modo que cada nível reaproveita os nós dos anteriores.
+    O resultado fica guardado em '_CACHE_TANH_SINH'.
+
+    Returns:
+      t, s, w : np.ndarray
+        Para 'tanh_sinh', s = 1 - |tanh(π/2 sinh t)| (distância ao
+        extremo, calculada sem cancelamento) e w = (π/2) cosh t /
+        cosh²(π/2 sinh t). Para 'exp_sinh', s = exp(π/2 sinh t) e
+        w = (π/2) cosh t * s. Para 'sinh_sinh', s = sinh(π/2 sinh t) e
+        w = (π/2) cosh t * cosh(π/2 sinh t).
+    """
+    chave = (transformacao, nivel)
+    if chave not in _CACHE_TANH_SINH:
+        t_max = _T_MAX_TANH_SINH[transformacao]
+        if nivel == 0:
+            j = np.arange(-math.floor(t_max), math.floor(t_max) + 1)
+        else:
+            m = math.floor(t_max * 2**nivel)
+            j = np.arange(-m + (m + 1) % 2, m + 1, 2)
+        t = j * 2.0**-nivel
+        u = math.pi / 2.0 * np.sinh(t)
+        if transformacao == 'tanh_sinh':
+            e = np.exp(-2.0 * np.abs(u))
+            s = 2.0 * e / (1.0 + e)
+            w = math.pi / 2.0 * np.cosh(t) * 4.0 * e / (1.0 + e)**2
+        elif transformacao == 'exp_sinh':
+            s = np.exp(u)
+            w = math.pi / 2.0 * np.cosh(t) * s
+        else:
+            s = np.sinh(u)
+            w = math.pi / 2.0 * np.cosh(t) * np.cosh(u)
+        for v in (t, s, w):
+            v.setflags(write=False)
+        _CACHE_TANH_SINH[chave] = (t, s, w)
+    return _CACHE_TANH_SINH[chave]
+
+
+def _avaliar_com_distancias(f, x, da, db, vetorizado=None):
+
+    """
+    Avalia f(x, x - a, b - x) em cada nó, com as distâncias aos extremos
+    já calculadas (ver 'integral_tanh_sinh').
+
+    Returns:
+      y, vetorizado : como em '_resolver_vetorizado'
+    """
+    if vetorizado is not False:
+        y = _avaliar_vetorizado(lambda nos: f(nos, da, db), x, estrito=vetorizado is True)
+        if y is not None:
+            return y, vetorizado
+
+    valores = []
+    for x_i, da_i, db_i in zip(x, da, db):
+        try:
+            valores.append(f(float(x_i), float(da_i), float(db_i)))
+        except Exception as erro:
+            raise TypeError("A função fornecida não pôde ser avaliada.") from erro
+    return _validar_valores(valores, (x.size,)), False
+
+
+def integral_tanh_sinh(f, a, b, tol = 1e-12, max_niveis = 10, plotar = True, vetorizado = None, distancias = False):
+
+    """
+    Aproxima ∫_a^b f(x) dx por quadratura duplamente exponencial (tanh-sinh).
+
+    A mudança de variável x = φ(t) concentra os nós perto dos extremos
+    tão rapidamente que singularidades integráveis nos extremos (como
+    1/sqrt(x) ou log(x) em x = 0) não atrapalham a convergência, e a
+    regra do trapézio em t converge quase exponencialmente com o número
+    de nós. Os extremos nunca são avaliados.
+
+    - [a, b] finito: x = c + (b-a)/2 * tanh(π/2 sinh t) (tanh-sinh);
+    - [a, ∞) ou (-∞, b]: x = a + exp(π/2 sinh t) (exp-sinh);
+    - (-∞, ∞): x = sinh(π/2 sinh t) (sinh-sinh).
+
+    Cada nível divide o passo em t ao meio e avalia f só nos nós novos.
+    Os nós e pesos de cada nível são calculados uma única vez e ficam
+    guardados para as chamadas seguintes. O cálculo para quando dois
+    níveis consecutivos diferem menos que 'tol' (a partir do 2º nível;
+    com 'max_niveis' = 1, já no primeiro).
+
+    Perto de um extremo a distante de zero, x - a calculado dentro de f
+    perde dígitos (e nós que arredondam para o próprio extremo são
+    descartados), então uma singularidade como 1/sqrt(x - 1) em a = 1 só
+    é resolvida até ~1e-8. Com 'distancias=True', f recebe também as
+    distâncias x - a e b - x, calculadas sem cancelamento a partir da
+    transformação, e deve usá-las no lugar de x - a e b - x.
+
+    Parametres:
+      f : callable
+        Função escalar (f(x) -> float), ou que aceite arrays.
+
+      a, b : float
+        Limites de integração; podem ser math.inf ou -math.inf.
+
+      tol : float, optional
+        Tolerância entre dois níveis consecutivos.
+
+      max_niveis : int, optional
+        Número máximo de refinamentos do passo em t.
+
+      plotar : bool, optional
+        Se True, desenha a função e os nós usados (apenas em intervalos finitos).
+
+      vetorizado : bool ou None, optional
+        Mesmo significado do argumento de 'integral'.
+
+      distancias : bool, optional
+        Se True, f é chamada como f(x, x - a, b - x) (distâncias
+        infinitas para extremos infinitos).
+
+    Returns:
+      soma : ResultadoIntegral
+        Aproximação da integral, com 'erro_estimado' (diferença entre os
+        dois últimos níveis).
+
+    Raises:
+      RuntimeError
+        Se a tolerância não for atingida em 'max_niveis' níveis.
+
+    Exemplos:
+      >>> integral_tanh_sinh(lambda x: 1 / np.sqrt(x), 0, 1, plotar=False)
+      >>> integral_tanh_sinh(lambda x: np.exp(-x) / np.sqrt(x), 0, math.inf, plotar=False)
+      >>> integral_tanh_sinh(lambda x, da, db: 1 / np.sqrt(da), 1, 2, distancias=True, plotar=False)
+    """
+    if not callable(f):
+      raise TypeError("O primeiro argumento deve ser uma função.")
+    try:
+      a, b = float(a), float(b)
+    except (TypeError, ValueError):
+      raise TypeError("Os limites de integração devem ser números reais.")
+    if math.isnan(a) or math.isnan(b):
+      raise TypeError("Os limites de integração não podem ser NaN.")
+    _validar_tol(tol)
+    if not isinstance(max_niveis, (int, np.integer)) or max_niveis <= 0:
+      raise TypeError("O número máximo de níveis deve ser um inteiro positivo.")
+
+    if a == b:
+      return ResultadoIntegral(0.0)
+
+    sinal = 1.0
+    if a > b:
+        a, b, sinal = b, a, -1.0
+
+    if math.isinf(a) and math.isinf(b):
+        transformacao = 'sinh_sinh'
+    elif math.isinf(a) or math.isinf(b):
+        transformacao = 'exp_sinh'
+    else:
+        transformacao = 'tanh_sinh'
+        centro, metade = (a + b) / 2.0, (b - a) / 2.0
+
+    def nos_do_nivel(nivel):
+        t, s, w = _nivel_tanh_sinh(transformacao, nivel)
+        infinito = np.full(t.shape, math.inf)
+        if transformacao == 'tanh_sinh':
+            x = np.where(t < 0, a + metade * s, np.where(t > 0, b - metade * s, centro))
+            w = metade * w
+            # distâncias aos extremos sem cancelamento: metade * s para o
+            # extremo mais próximo, o complemento para o outro
+            perto, longe = metade * s, 2.0 * metade - metade * s
+            da = np.where(t < 0, perto, np.where(t > 0, longe, metade))
+            db = np.where(t > 0, perto, np.where(t < 0, longe, metade))
+        elif transformacao == 'exp_sinh':
+            x = a + s if math.isinf(b) else b - s
+            da, db = (s, infinito) if math.isinf(b) else (infinito, s)
+        else:
+            x = s
+            da = db = infinito
+        if distancias:
+            validos = (da > 0) & (db > 0) & np.isfinite(x) & np.isfinite(w) & (w > 0)
+        else:
+            validos = (x > a) & (x < b) & np.isfinite(w) & (w > 0)
+        return x[validos], w[validos], da[validos], db[validos]
+
+    nos, valores = [], []
+    soma_ponderada = 0.0
+    anterior = None
+    for nivel in range(max_niveis + 1):
+        x, w, da, db = nos_do_nivel(nivel)
+        if distancias:
+            y, vetorizado = _avaliar_com_distancias(f, x, da, db, vetorizado)
+        else:
+            y, vetorizado = _resolver_vetorizado(f, x, vetorizado)
+        nos.append(x)
+        valores.append(y)
+        soma_ponderada += np.dot(w, y)
+        atual = soma_ponderada * 2.0**-nivel
+        if anterior is not None:
+            erro = abs(atual - anterior)
+            if (nivel >= 2 or nivel == max_niveis) and erro <= tol:
+                break
+        anterior = atual
+    else:
+        raise RuntimeError(f"A quadratura tanh-sinh não convergiu após {max_niveis} níveis. "
+                           f"Última diferença: {erro:.3e}. Para singularidades em extremos distantes de zero, "
+                           f"use distancias=True.")
+
+    nos, valores = np.concatenate(nos), np.concatenate(valores)
+    finito = transformacao == 'tanh_sinh'
+    ordem = np.argsort(nos)
+    soma = ResultadoIntegral(sinal * atual, n_avaliacoes=nos.size, metodo='tanh_sinh',
+                             nos=nos[ordem] if finito else None, valores=valores[ordem] if finito else None,
+                             erro_estimado=erro)
+
+    if plotar and finito:
+        soma.plotar()
+
+    return soma
+
+
+_CACHE_CLENSHAW_CURTIS = {}
+
+
+def _pesos_clenshaw_curtis(n):
+
+    """
+    Pesos da regra de Clenshaw-Curtis com n+1 nós x_k = cos(kπ/n) em [-1, 1].
+
+    Calculados em O(n log n) por uma única FFT (algoritmo de Waldvogel,
+    2006) e guardados em '_CACHE_CLENSHAW_CURTIS'.
+
+    Returns:
+      w : np.ndarray
+        Pesos na ordem dos nós (somente leitura).
+    """
+    if n not in _CACHE_CLENSHAW_CURTIS:
+        impares = np.arange(1, n, 2)
+        l = impares.size
+        m = n - l
+        v0 = np.concatenate((2.0 / impares / (impares - 2), [1.0 / impares[-1]], np.zeros(m)))
+        v2 = -v0[:-1] - v0[:0:-1]
+        g0 = -np.ones(n)
+        g0[l] += n
+        g0[m] += n
+        g = g0 / (n**2 - 1 + n % 2)
+        w = np.fft.ifft(v2 + g).real
+        w = np.concatenate((w, w[:1]))
+        w.setflags(write=False)
+        _CACHE_CLENSHAW_CURTIS[n] = w
+    return _CACHE_CLENSHAW_CURTIS[n]
+
+
+def integral_clenshaw_curtis(f, a, b, tol = 1e-12, max_niveis = 20, plotar = True, vetorizado = None):
+
+    """
+    Aproxima ∫_a^b f(x) dx pela regra de Clenshaw-Curtis.
+
+    Os nós são os pontos de Chebyshev x_k = c + h*cos(kπ/n), com
+    c = (a+b)/2 e h = (b-a)/2, e os pesos integram exatamente o
+    interpolante polinomial de f nesses nós; para f suave (analítica) o
+    erro decai exponencialmente com n. Os pesos vêm de uma FFT, em
+    O(n log n), e ficam guardados para as chamadas seguintes.
+
+    Os conjuntos de nós são aninhados: ao passar de n para 2n, os nós
+    antigos são os de índice par, e f só é avaliada nos n novos nós de
+    índice ímpar. A diferença entre as regras com n e 2n nós é a
+    estimativa de erro, e o cálculo para quando ela fica abaixo de 'tol'
+    (a partir do 2º refinamento; com 'max_niveis' = 1, já no primeiro).
+
+    Parametres:
+      f : callable
+        Função escalar (f(x) -> float), ou que aceite arrays.
+
+      a : float
+        Extremo esquerdo do intervalo.
+
+      b : float
+        Extremo direito do intervalo.
+
+      tol : float, optional
+        Tolerância entre duas regras consecutivas.
+
+      max_niveis : int, optional
+        Número máximo de refinamentos (até 2^max_niveis + 1 nós).
+
+      plotar : bool, optional
+        Se True, desenha a função e os nós do último nível.
+
+      vetorizado : bool ou None, optional
+        Mesmo significado do argumento de 'integral'.
+
+    Returns:
+      soma : ResultadoIntegral
+        Regra do último nível, com 'erro_estimado' (diferença para o
+        nível anterior).
+
+    Raises:
+      RuntimeError
+        Se a tolerância não for atingida em 'max_niveis' níveis.
+
+    Exemplos:
+      >>> area = integral_clenshaw_curtis(lambda x: np.exp(-x**2), 0, 2, plotar=False)
+      >>> print(area, area.n_avaliacoes)
+    """
+    a, b = _validar_entrada(f, a, b)
+    _validar_tol(tol)
+    if not isinstance(max_niveis, (int, np.integer)) or max_niveis <= 0:
+      raise TypeError("O número máximo de níveis deve ser um inteiro positivo.")
+
+    if a == b:
+      return ResultadoIntegral(0.0)
+
+    centro, metade = (a + b) / 2.0, (b - a) / 2.0
+    n = 2
+    nos = centro + metade * np.cos(np.arange(n + 1) * math.pi / n)
+    nos[[0, -1]] = b, a
+    valores, vetorizado = _resolver_vetorizado(f, nos, vetorizado)
+    anterior = metade * np.dot(_pesos_clenshaw_curtis(n), valores)
+
+    for k in range(1, max_niveis + 1):
+        n *= 2
+        novos = centro + metade * np.cos(np.arange(1, n, 2) * math.pi / n)
+        f_novos = _avaliar(f, novos, vetorizado)
+
+        todos_nos, todos_valores = np.empty(n + 1), np.empty(n + 1)
+        todos_nos[0::2], todos_nos[1::2] = nos, novos
+        todos_valores[0::2], todos_valores[1::2] = valores, f_novos
+        nos, valores = todos_nos, todos_valores
+
+        atual = metade * np.dot(_pesos_clenshaw_curtis(n), valores)
+        erro = abs(atual - anterior)
+        anterior = atual
+        if (k >= 2 or k == max_niveis) and erro <= tol:
+            break
+    else:
+        raise RuntimeError(f"A regra de Clenshaw-Curtis não convergiu após {max_niveis} níveis. "
+                           f"Última diferença: {erro:.3e}")
+
+    soma = ResultadoIntegral(atual, n_avaliacoes=nos.size, metodo='clenshaw_curtis',
+                             nos=nos[::-1], valores=valores[::-1], erro_estimado=erro)
+
+    if plotar:
+        soma.plotar()
+
+    return soma
+
+
+def _momentos_oscilatorios(theta, grau):
+
+    """
+    Momentos M_k = ∫_{-1}^{1} s^k e^{iθs} ds, k = 0, ..., grau.
+
+    Para |θ| pequeno, a fórmula fechada sofre cancelamento; os momentos
+    são então calculados por Gauss-Legendre com 48 pontos (o integrando
+    é suave e pouco oscilante). Para |θ| > 20 (> grau), usa a recorrência
+    M_k = (e^{iθ} - (-1)^k e^{-iθ}) / (iθ) - k/(iθ) * M_(k-1), estável
+    nessa faixa.
+    """
+    k = np.arange(grau + 1)
+    if abs(theta) <= 20.0:
+        s, w = _nos_gauss_legendre(48)
+        return (s[:, None]**k * (w * np.exp(1j * theta * s))[:, None]).sum(axis=0)
+
+    M = np.empty(grau + 1, dtype=complex)
+    M[0] = 2.0 * math.sin(theta) / theta
+    for j in range(1, grau + 1):
+        M[j] = (np.exp(1j*theta) - (-1)**j * np.exp(-1j*theta) - j * M[j-1]) / (1j * theta)
+    return M
+
+
+def integral_oscilatoria(g, a, b, omega, n = 16, oscilador = "cos", grau = 8, vetorizado = None):
+
+    """
+    Aproxima ∫_a^b g(x)·cos(ωx) dx ou ∫_a^b g(x)·sin(ωx) dx por uma regra de Filon.
+
+    Só a parte suave g é interpolada: em cada um dos n subintervalos, g
+    é substituída pelo polinômio de grau 'grau' que a interpola nos nós
+    de Chebyshev-Lobatto do subintervalo, e o produto desse polinômio
+    por e^{iωx} é integrado exatamente (momentos oscilatórios). Assim n
+    só precisa resolver g, e não as oscilações: o custo, n*grau + 1
+    avaliações de g, não depende de ω, e o erro não piora quando ω
+    cresce (na prática diminui).
+
+    Como os subintervalos têm o mesmo tamanho, os pesos complexos da
+    regra são calculados uma única vez por chamada.
+
+    Parametres:
+      g : callable
+        Parte suave do integrando (f(x) -> float), ou que aceite arrays.
+
+      a, b : float
+        Limites de integração.
+
+      omega : float
+        Frequência ω.
+
+      n : int, optional
+        Número de subintervalos.
+
+      oscilador : string, optional
+        'cos' ou 'sin'.
+
+      grau : int, optional
+        Grau do polinômio que interpola g em cada subintervalo (1 a 16).
+
+      vetorizado : bool ou None, optional
+        Mesmo significado do argumento de 'integral'.
+
+    Returns:
+      soma : ResultadoIntegral
+        Aproximação da integral, com 'n_avaliacoes'.
+
+    Exemplos:
+      >>> integral_oscilatoria(lambda x: np.exp(-x), 0, 1, omega=5000, n=8)
+    """
+    a, b = _validar_entrada(g, a, b)
+
+    try:
+      omega = float(omega)
+    except (TypeError, ValueError):
+      raise TypeError("A frequência deve ser um número real.")
+    if math.isnan(omega):
+      raise TypeError("A frequência não pode ser NaN.")
+    if math.isinf(omega):
+      raise OverflowError("A frequência deve ser finita.")
+
+    if not isinstance(n, (int, np.integer)) or n <= 0:
+      raise TypeError("O número de partições deve ser um inteiro positivo.")
+
+    if not isinstance(grau, (int, np.integer)) or not 1 <= grau <= 16:
+      raise TypeError("O grau deve ser um inteiro entre 1 e 16.")
+
+    if oscilador not in ['cos', 'sin']:
+      raise NameError("O oscilador deve ser cos ou sin")
+
+    if a == b:
+      return ResultadoIntegral(0.0, metodo='filon')
+
+    metade = (b - a) / (2.0 * n)
+    s = -np.cos(np.arange(grau + 1) * math.pi / grau)
+    if grau % 2 == 0:
+        s[grau // 2] = 0.0
+    M = _momentos_oscilatorios(omega * metade, grau)
+    pesos = np.linalg.solve(np.vander(s, increasing=True).T, M)
+
+    # nós compartilhados entre subintervalos vizinhos são avaliados uma única vez
+    centros = a + metade * (2.0 * np.arange(n) + 1.0)
+    nos = np.concatenate(((centros[:, None] + metade * s[:-1]).ravel(), [b]))
+    valores = _avaliar(g, nos, vetorizado)
+    por_subintervalo = np.lib.stride_tricks.sliding_window_view(valores, grau + 1)[::grau]
+
+    termos = metade * np.exp(1j * omega * centros) * (por_subintervalo @ pesos)
+    soma = termos.sum()
+    return ResultadoIntegral(soma.real if oscilador == 'cos' else soma.imag, n_avaliacoes=nos.size, metodo='filon')
+
+
+def integral_interpolante(p, a, b):
+
+    """
+    Integra exatamente um interpolante de 'interpolacao' sobre [a, b].
+
+    Os interpolantes retornados por linear_interp, poly_interp e
+    hermite_interp são polinômios (por partes); 'p.pecas()' devolve
+    as quebras q_0 < ... < q_k e os coeficientes de cada parte em
+    potências de (x - q_i). A primitiva de cada parte é calculada a
+    partir desses coeficientes, sem reavaliar p. Os valores acumulados
+    nas quebras são somados uma única vez (somas parciais compensadas),
+    e cada intervalo custa uma busca binária: O(k + m log k) para m
+    intervalos.
+
+    Fora de [q_0, q_k], as partes extremas são estendidas, como na
+    avaliação do próprio interpolante.
+
+    Parametres:
+      p : callable
+        Interpolante retornado por linear_interp, poly_interp ou hermite_interp.
+
+      a, b : float ou array_like
+        Limites de integração; arrays (de formatos compatíveis) dão a
+        integral em vários intervalos de uma vez.
+
+    Returns:
+      soma : float ou np.ndarray
+        ∫_a^b p(x) dx, com o formato de a e b.
+
+    Exemplos:
+      >>> p = linear_interp(x, y, plot=False)
+      >>> integral_interpolante(p, 0, 10)
+      >>> integral_interpolante(p, np.arange(10), np.arange(1, 11))   # cada [i, i+1]
+    """
+    if not callable(p) or not hasattr(p, 'pecas'):
+      raise TypeError("O interpolante deve ser retornado por linear_interp, poly_interp ou hermite_interp.")
+
+    try:
+      a = np.asarray(a, dtype=float)
+      b = np.asarray(b, dtype=float)
+    except (TypeError, ValueError):
+      raise TypeError("Os limites de integração devem ser números reais.")
+    if np.isnan(a).any() or np.isnan(b).any():
+      raise TypeError("Os limites de integração não podem ser NaN.")
+    if np.isinf(a).any() or np.isinf(b).any():
+      raise OverflowError("Os limites de integração devem ser finitos.")
+
+    quebras, coeficientes = p.pecas()
+    k, g = coeficientes.shape
+    # primitiva de cada parte: sum c_j (x - q_i)^(j+1) / (j+1)
+    primitivas = coeficientes / np.arange(1, g + 1)
+
+    def primitiva_local(i, d):
+        resultado = np.zeros(np.shape(d))
+        for j in range(g - 1, -1, -1):
+            resultado = (resultado + primitivas[i, j]) * d
+        return resultado
+
+    acumulada = np.zeros(k + 1)
+    acumulada[1:] = soma_de_kahan_acumulada(primitiva_local(np.arange(k), np.diff(quebras)))
+
+    def primitiva(x):
+        i = np.clip(np.searchsorted(quebras, x, side='right') - 1, 0, k - 1)
+        return acumulada[i] + primitiva_local(i, x - quebras[i])
+
+    soma = primitiva(b) - primitiva(a)
+    return float(soma) if soma.ndim == 0 else soma
+
+
+def integral_lote(f, a, b, n, metodo = "trapezio", parametros = None, ordem = 5, vetorizado = None):
+
+    """
+    Aproxima várias integrais ∫_a^b f(x) dx (ou ∫_a^b f(x, p) dx) de uma vez.
+
+    Os nós de todos os problemas formam um único array de formato
+    (m, N), com os N nós de cada problema numa linha, e f é chamada uma
+    só vez sobre ele. Erros de um problema não interrompem o lote: cada
+    um recebe um código de status (ver 'STATUS_LOTE') e resultado NaN.
+
+    Parametres:
+      f : callable
+        f(x) ou, se 'parametros' for dado, f(x, p).
+
+      a : float ou array_like
+        Extremos esquerdos (um por problema, ou um único para todos).
+
+      b : float ou array_like
+        Extremos direitos (um por problema, ou um único para todos).
+
+      n : int
+        Número de subintervalos, o mesmo para todos os problemas.
+
+      metodo : string, optional
+        'trapezio', 'ponto_medio', 'simpson' ou 'gauss'.
+
+      parametros : array_like, optional
+        Parâmetros de cada problema: formato (m,) para um parâmetro ou
+        (m, k) para k parâmetros. Na chamada vetorizada, p tem formato
+        (m, 1) no primeiro caso e p[j] é a coluna (m, 1) do j-ésimo
+        parâmetro no segundo; no caminho escalar, p é o parâmetro (ou a
+        linha de parâmetros) do problema. Assim, p[j] funciona nos dois.
+
+      ordem : int, optional
+        Número de pontos de Gauss-Legendre por subintervalo (metodo='gauss').
+
+      vetorizado : bool ou None, optional
+        Mesmo significado do argumento de 'integral'. No caminho escalar,
+        erros de avaliação são atribuídos ao problema em que ocorreram.
+
+    Returns:
+      resultados : np.ndarray
+        Aproximação de cada integral (NaN nos problemas com falha).
+
+      status : np.ndarray
+        Código de status de cada problema (0 = ok).
+
+    Exemplos:
+      >>> resultados, status = integral_lote(lambda x, p: np.sin(p*x), 0, np.pi, 100,
+      ...                                    parametros=[1.0, 2.0, 3.0])
+    """
+    if not callable(f):
+      raise TypeError("O argumento 'funcao' deve ser uma função chamável (callable).")
+
+    if not isinstance(n, (int, np.integer)) or n <= 0:
+      raise TypeError("O número de partições deve ser um inteiro positivo.")
+
+    if metodo not in ['trapezio', 'simpson', 'ponto_medio', 'gauss']:
+      raise NameError('O método deve ser trapezio, simpson, ponto_medio ou gauss')
+
+    if metodo == 'gauss' and (not isinstance(ordem, (int, np.integer)) or ordem <= 0):
+      raise TypeError("A ordem de Gauss-Legendre deve ser um inteiro positivo.")
+
+    try:
+      a = np.asarray(a, dtype=float)
+      b = np.asarray(b, dtype=float)
+      p = None if parametros is None else np.asarray(parametros, dtype=float)
+    except (TypeError, ValueError):
+      raise TypeError("Limites e parâmetros devem ser números reais.")
+
+    formatos = [a.shape, b.shape] + ([] if p is None else [p.shape[:1]])
+    try:
+      formato = np.broadcast_shapes(*formatos)
+    except ValueError:
+      raise ValueError("Limites e parâmetros têm tamanhos incompatíveis.")
+    if len(formato) > 1 or (p is not None and p.ndim not in (1, 2)):
+      raise ValueError("Os limites devem ser escalares ou vetores, e os parâmetros vetores ou matrizes (m, k).")
+
+    m = formato[0] if formato else 1
+    a = np.broadcast_to(a, formato).reshape(m)
+    b = np.broadcast_to(b, formato).reshape(m)
+
+    resultados = np.full(m, np.nan)
+    status = np.zeros(m, dtype=int)
+
+    finitos = np.isfinite(a) & np.isfinite(b)
+    status[~finitos] = 1
+    resultados[finitos & (a == b)] = 0.0
+    ativos = np.flatnonzero(finitos & (a != b))
+    if ativos.size == 0:
+      return resultados, status
+
+    x = _nos_particao(metodo, a[ativos], b[ativos], n, ordem)
+
+    y = None
+    if vetorizado is not False:
+        if p is None:
+            argumentos = ()
+        elif p.ndim == 1:
+            argumentos = (p[ativos][:, None],)
+        else:
+            argumentos = (p[ativos].T[..., None],)
+        try:
+            with np.errstate(all='ignore'):
+                y = np.asarray(f(x, *argumentos))
+            if y.shape != x.shape or y.dtype.kind not in 'biuf':
+                raise TypeError("Retorno incompatível com o array de nós.")
+            y = y.astype(float)
+        except Exception:
+            if vetorizado is True:
+                raise TypeError("A função não pôde ser avaliada sobre o array de nós do lote (vetorizado=True).")
+            y = None
+
+    if y is None:
+        y = np.full(x.shape, np.nan)
+        for linha, i in enumerate(ativos):
+            argumentos = () if p is None else (p[i],)
+            try:
+                y[linha] = [f(float(x_j), *argumentos) for x_j in x[linha]]
+            except Exception:
+                status[i] = 3
+
+    validos = np.isfinite(y).all(axis=-1)
+    status[ativos[~validos & (status[ativos] == 0)]] = 2
+    ok = validos & (status[ativos] == 0)
+    delta_x = (b[ativos] - a[ativos]) / n
+    resultados[ativos[ok]] = _aplicar_regra(metodo, y[ok], delta_x[ok], ordem)
+
+    return resultados, status
+
+
+def _blocos_amostras(y, x, tamanho_bloco):
+
+    """
+    Percorre as amostras de 'integral_amostras' em blocos.
+
+    Gera pares (x_bloco, y_bloco), com x_bloco None para amostras
+    uniformes. Arrays e np.memmap são fatiados sem cópia; caminhos de
+    arquivos .npy são abertos com np.load(mmap_mode='r'). Uma lista (ou
+    tupla) de números é um vetor de amostras; uma lista de arrays ou de
+    pares (x, y) é percorrida como um iterável de blocos.
+    """
+    if isinstance(y, (str, os.PathLike)):
+        y = np.load(y, mmap_mode='r')
+    if isinstance(x, (str, os.PathLike)):
+        x = np.load(x, mmap_mode='r')
+
+    lista_de_blocos = isinstance(y, (list, tuple)) and any(isinstance(v, (list, tuple, np.ndarray)) for v in y)
+    if isinstance(y, np.ndarray) or (isinstance(y, (list, tuple)) and not lista_de_blocos):
+        if not isinstance(y, np.ndarray):
+            y = np.asarray(y)
+        if y.ndim != 1:
+            raise ValueError("As amostras devem formar um vetor unidimensional.")
+        if x is not None:
+            if not isinstance(x, np.ndarray):
+                x = np.asarray(x)
+            if x.shape != y.shape:
+                raise ValueError("x e y devem ter o mesmo número de amostras.")
+        for i in range(0, y.size, tamanho_bloco):
+            yield (None if x is None else x[i:i + tamanho_bloco]), y[i:i + tamanho_bloco]
+        return
+
+    if x is not None:
+        raise ValueError("Com um iterador de blocos, passe abscissas irregulares como pares (x, y).")
+    try:
+        blocos = iter(y)
+    except TypeError:
+        raise TypeError("As amostras devem ser um array, um np.memmap, um arquivo .npy ou um iterador de blocos.")
+    for bloco in blocos:
+        if isinstance(bloco, tuple):
+            if len(bloco) != 2:
+                raise ValueError("Cada bloco irregular deve ser um par (x, y).")
+            yield bloco
+        else:
+            yield None, bloco
+
+
+def _validar_amostras(v):
+
+    """Converte um bloco de amostras para floats e rejeita NaN e infinitos."""
+    try:
+        v = np.asarray(v, dtype=float)
+    except (TypeError, ValueError):
+        raise TypeError("As amostras devem ser números reais.")
+    if v.ndim != 1:
+        raise ValueError("Cada bloco de amostras deve ser unidimensional.")
+    if np.isnan(v).any():
+        raise TypeError("As amostras contêm NaN, o que não é permitido.")
+    if np.isinf(v).any():
+        raise OverflowError("As amostras contêm infinito, o que não é permitido.")
+    return v
+
+
+def _simpson_pares(y, h):
+
+    """
+    Simpson composto (espaçamento possivelmente irregular) sobre pares
+    de subintervalos consecutivos: y tem 2k+1 amostras e h os 2k
+    espaçamentos entre elas.
+    """
+    h0, h1 = h[0::2], h[1::2]
+    return ((h0 + h1) / 6.0 * ((2.0 - h1/h0) * y[0:-1:2]
+                               + (h0 + h1)**2 / (h0*h1) * y[1::2]
+                               + (2.0 - h0/h1) * y[2::2])).sum()
+
+
+def integral_amostras(y, x = None, dx = 1.0, metodo = "trapezio", tamanho_bloco = 2**20):
+
+    """
+    Aproxima a integral de dados amostrados, sem carregá-los inteiros na memória.
+
+    As amostras são processadas em blocos de até 'tamanho_bloco'
+    valores. Entre um bloco e o seguinte, apenas as últimas amostras
+    ainda não usadas (uma no trapézio, até duas em Simpson) são
+    guardadas, então a memória usada não depende do número total de
+    amostras. As somas parciais de cada bloco são acumuladas com
+    'soma_de_kahan_lista'.
+
+    Em Simpson, os subintervalos são agrupados em pares (a fórmula vale
+    também para espaçamento irregular). Se o número total de
+    subintervalos for ímpar, o último é integrado pela parábola que
+    passa pelas três últimas amostras.
+
+    Parametres:
+      y : array_like, np.memmap, string ou iterável
+        Amostras f(x_i). Pode ser um array (ou np.memmap, por exemplo
+        de um arquivo binário bruto), o caminho de um arquivo .npy (aberto
+        com mmap_mode='r') ou um iterável de blocos (gerador, iterador ou
+        lista de arrays). Cada bloco do iterável é um array de amostras
+        uniformes ou um par (x, y) de arrays para amostras irregulares.
+
+      x : array_like, np.memmap ou string, optional
+        Abscissas das amostras, se não forem uniformes. Deve ter o mesmo
+        tamanho de y.
+
+      dx : float, optional
+        Espaçamento entre amostras uniformes (ignorado se houver x).
+
+      metodo : string, optional
+        'trapezio' ou 'simpson'.
+
+      tamanho_bloco : int, optional
+        Número de amostras processadas por vez.
+
+    Returns:
+      soma : float
+        Aproximação da integral. Com menos de duas amostras, 0.0.
+
+    Exemplos:
+      >>> sinal = np.load("traco.npy", mmap_mode="r")
+      >>> area = integral_amostras(sinal, dx=1e-6, metodo="simpson")
+    """
+    if metodo not in ['trapezio', 'simpson']:
+      raise NameError('O método deve ser trapezio ou simpson')
+
+    if not isinstance(tamanho_bloco, (int, np.integer)) or tamanho_bloco <= 0:
+      raise TypeError("O tamanho do bloco deve ser um inteiro positivo.")
+
+    try:
+      dx = float(dx)
+    except Exception:
+      raise TypeError("O espaçamento dx deve ser um número real.")
+    if not math.isfinite(dx) or dx == 0:
+      raise ValueError("O espaçamento dx deve ser finito e diferente de zero.")
+
+    Y_resto = np.empty(0)   # amostras ainda não usadas
+    H_resto = np.empty(0)   # espaçamentos entre elas
+    x_ultimo = None         # última abscissa vista (amostras irregulares)
+    anterior = None         # (y, h) da amostra anterior ao resto, para fechar Simpson
+    irregular = None
+    partes = []
+
+    for x_bloco, y_bloco in _blocos_amostras(y, x, tamanho_bloco):
+        y_bloco = _validar_amostras(y_bloco)
+        if irregular is None:
+            irregular = x_bloco is not None
+        elif irregular != (x_bloco is not None):
+            raise ValueError("Não é possível misturar blocos uniformes e irregulares.")
+
+        if irregular:
+            x_bloco = _validar_amostras(x_bloco)
+            if x_bloco.shape != y_bloco.shape:
+                raise ValueError("x e y devem ter o mesmo número de amostras.")
+            if y_bloco.size == 0:
+                continue
+            novos_h = np.diff(x_bloco if x_ultimo is None else np.concatenate(([x_ultimo], x_bloco)))
+            x_ultimo = x_bloco[-1]
+        else:
+            if y_bloco.size == 0:
+                continue
+            novos_h = np.full(y_bloco.size - (Y_resto.size == 0), dx)
+
+        Y = np.concatenate((Y_resto, y_bloco))
+        H = np.concatenate((H_resto, novos_h))
+
+        if metodo == 'trapezio':
+            partes.append(((Y[:-1] + Y[1:]) * (H / 2.0)).sum())
+            Y_resto, H_resto = Y[-1:], H[:0]
+        else:
+            m = Y.size - 1
+            k = m - m % 2
+            if k > 0:
+                partes.append(_simpson_pares(Y[:k+1], H[:k]))
+                anterior = (Y[k-1], H[k-1])
+            Y_resto, H_resto = Y[k:], H[k:]
+
+    if metodo == 'simpson' and Y_resto.size == 2:
+        y1, y2 = Y_resto
+        h2 = H_resto[0]
+        if anterior is None:
+            partes.append((y1 + y2) / 2.0 * h2)
+        else:
+            y0, h1 = anterior
+            partes.append(y2 * (2*h2**2 + 3*h1*h2) / (6*(h1 + h2))
+                          + y1 * (h2**2 + 3*h1*h2) / (6*h1)
+                          - y0 * h2**3 / (6*h1*(h1 + h2)))
+
+    return soma_de_kahan_lista(partes)
+
+
+# Números de direção de Sobol' (Joe e Kuo, 2008) para as dimensões 2 a 21:
+# (grau s do polinômio primitivo, coeficientes a, m_1 ... m_s).
+# A primeira dimensão usa m_i = 1.
+_SOBOL_DIRECOES = (
+    (1, 0, (1,)),
+    (2, 1, (1, 3)),
+    (3, 1, (1, 3, 1)),
+    (3, 2, (1, 1, 1)),
+    (4, 1, (1, 1, 3, 3)),
+    (4, 4, (1, 3, 5, 13)),
+    (5, 2, (1, 1, 5, 5, 17)),
+    (5, 4, (1, 1, 5, 5, 5)),
+    (5, 7, (1, 1, 7, 11, 19)),
+    (5, 11, (1, 1, 5, 1, 1)),
+    (5, 13, (1, 1, 1, 3, 11)),
+    (5, 14, (1, 3, 5, 5, 31)),
+    (6, 1, (1, 3, 3, 9, 7, 49)),
+    (6, 13, (1, 1, 1, 15, 21, 21)),
+    (6, 16, (1, 3, 1, 13, 27, 49)),
+    (6, 19, (1, 1, 1, 15, 7, 5)),
+    (6, 22, (1, 3, 1, 15, 13, 25)),
+    (6, 25, (1, 1, 5, 5, 19, 61)),
+    (7, 1, (1, 3, 7, 11, 23, 15, 103)),
+    (7, 4, (1, 3, 7, 13, 13, 15, 69)),
+)
+
+_BITS_SOBOL = 32
+_CACHE_SOBOL = {}
+
+
+def _direcoes_sobol(d):
+
+    """
+    Números de direção v_(j,i) = m_i * 2^(32-i) das d primeiras dimensões,
+    como array uint64 de formato (32, d). Calculados uma vez por d.
+    """
+    if d not in _CACHE_SOBOL:
+        V = np.zeros((_BITS_SOBOL, d), dtype=np.uint64)
+        V[:, 0] = [1 << (_BITS_SOBOL - i) for i in range(1, _BITS_SOBOL + 1)]
+        for j, (s, coef, m) in enumerate(_SOBOL_DIRECOES[:d - 1], start=1):
+            v = [m_i << (_BITS_SOBOL - i) for i, m_i in enumerate(m, start=1)]
+            for i in range(s, _BITS_SOBOL):
+                novo = v[i - s] ^ (v[i - s] >> s)
+                for k in range(1, s):
+                    if (coef >> (s - 1 - k)) & 1:
+                        novo ^= v[i - k]
+                v.append(novo)
+            V[:, j] = v
+        _CACHE_SOBOL[d] = V
+    return _CACHE_SOBOL[d]
+
+
+def _pontos_sobol(inicio, m, d):
+
+    """
+    Pontos inicio, ..., inicio+m-1 da sequência de Sobol' (ordem de Gray),
+    como inteiros de 32 bits de formato (m, d).
+    """
+    V = _direcoes_sobol(d)
+    indices = np.arange(inicio, inicio + m, dtype=np.uint64)
+    gray = indices ^ (indices >> np.uint64(1))
+    pontos = np.zeros((m, d), dtype=np.uint64)
+    for bit in range(_BITS_SOBOL):
+        ativos = ((gray >> np.uint64(bit)) & np.uint64(1)).astype(bool)
+        pontos[ativos] ^= V[bit]
+    return pontos
+
+
+def _primos(k):
+
+    """Os k primeiros números primos."""
+    primos = []
+    candidato = 2
+    while len(primos) < k:
+        if all(candidato % p for p in primos if p*p <= candidato):
+            primos.append(candidato)
+        candidato += 1
+    return primos
+
+
+def _pontos_halton(inicio, m, d):
+
+    """
+    Pontos inicio+1, ..., inicio+m da sequência de Halton (inverso radical
+    na base do j-ésimo primo em cada dimensão), de formato (m, d).
+    """
+    indices = np.arange(inicio + 1, inicio + m + 1, dtype=np.int64)
+    pontos = np.empty((m, d))
+    for j, base in enumerate(_primos(d)):
+        n = indices.copy()
+        fator = 1.0 / base
+        u = np.zeros(m)
+        while n.any():
+            n, digito = np.divmod(n, base)
+            u += digito * fator
+            fator /= base
+        pontos[:, j] = u
+    return pontos
+
+
+def _validar_caixa(f, a, b):
+
+    """
+    Valida f e os limites de um retângulo [a_1, b_1] x ... x [a_d, b_d].
+
+    Returns:
+      a, b : np.ndarray
+        Limites como arrays de floats de tamanho d.
+    """
+    if not callable(f):
+      raise TypeError("O primeiro argumento deve ser uma função.")
+
+    try:
+      a = np.atleast_1d(np.asarray(a, dtype=float))
+      b = np.atleast_1d(np.asarray(b, dtype=float))
+    except (TypeError, ValueError):
+      raise TypeError("Os limites de integração devem ser números reais.")
+    if a.ndim != 1 or a.shape != b.shape or a.size == 0:
+      raise TypeError("a e b devem ter um limite para cada dimensão.")
+    if np.isnan(a).any() or np.isnan(b).any():
+      raise TypeError("Os limites de integração não podem ser NaN.")
+    if np.isinf(a).any() or np.isinf(b).any():
+      raise OverflowError("Os limites de integração devem ser finitos.")
+    return a, b
+
+
+def _avaliar_pontos(f, X, vetorizado=None):
+
+    """
+    Avalia f em m pontos de R^d.
+
+    X tem formato (m,) em uma dimensão (como em '_avaliar') ou (m, d);
+    nesse caso f recebe o array (m, d) inteiro e deve devolver m valores,
+    ou, no caminho escalar, cada linha de X como um array de tamanho d.
+
+    Returns:
+      y, vetorizado : como em '_resolver_vetorizado'
+    """
+    if X.ndim == 1:
+        return _resolver_vetorizado(f, X, vetorizado)
+
+    m = X.shape[0]
+    if vetorizado is not False:
+        try:
+            with np.errstate(all='ignore'):
+                y = np.asarray(f(X))
+            if y.shape != (m,):
+                raise TypeError("Retorno incompatível com o array de pontos.")
+        except Exception as erro:
+            if vetorizado:
+                raise TypeError("A função não pôde ser avaliada sobre um array de pontos (vetorizado=True).") from erro
+        else:
+            return _validar_valores(y, (m,)), vetorizado
+
+    valores = []
+    for x_i in X:
+        try:
+            valores.append(f(x_i))
+        except Exception as erro:
+            raise TypeError("A função fornecida não pôde ser avaliada.") from erro
+    return _validar_valores(valores, (m,)), False
+
+
+def _tamanhos_dos_lotes(restante, fluxos, lote):
+
+    """
+    Divide 'restante' pontos entre os fluxos de uma rodada, com no máximo
+    'lote' por fluxo, para que o orçamento nunca seja ultrapassado.
+    Fluxos sem pontos ficam de fora da rodada.
+    """
+    if restante >= fluxos * lote:
+        return [lote] * fluxos
+    base, sobra = divmod(restante, fluxos)
+    return [base + (j < sobra) for j in range(fluxos) if base + (j < sobra) > 0]
+
+
+def _lote_monte_carlo(f, semente, m, a, largura, vetorizado):
+
+    """
+    Avalia f em m pontos uniformes do retângulo, sorteados pelo gerador
+    de 'semente' (np.random.SeedSequence).
+
+    Returns:
+      m, media, M2 : estatísticas do lote (M2 = soma dos quadrados dos desvios)
+
+      vetorizado : decisão para os próximos lotes (ver '_resolver_vetorizado')
+    """
+    U = np.random.default_rng(semente).random((m, a.size))
+    X = a + largura * U
+    y, vetorizado = _avaliar_pontos(f, X[:, 0] if a.size == 1 else X, vetorizado)
+    media = y.mean()
+    return m, media, ((y - media)**2).sum(), vetorizado
+
+
+def _lote_quasi_monte_carlo(f, metodo, inicio, m, a, largura, deslocamentos, vetorizado):
+
+    """
+    Avalia f nos pontos inicio, ..., inicio+m-1 da sequência de baixa
+    discrepância, uma vez para cada deslocamento aleatório (réplica).
+
+    Returns:
+      somas : np.ndarray
+        Soma dos valores de f em cada réplica.
+
+      vetorizado : decisão para os próximos lotes (ver '_resolver_vetorizado')
+    """
+    R, d = deslocamentos.shape
+    if metodo == 'sobol':
+        inteiros = _pontos_sobol(inicio, m, d)
+        U = (inteiros[None] ^ deslocamentos[:, None, :]) * 2.0**-_BITS_SOBOL
+    else:
+        U = (_pontos_halton(inicio, m, d)[None] + deslocamentos[:, None, :]) % 1.0
+    X = (a + largura * U).reshape(R * m, d)
+    y, vetorizado = _avaliar_pontos(f, X[:, 0] if d == 1 else X, vetorizado)
+    return y.reshape(R, m).sum(axis=1), vetorizado
+
+
+def integral_monte_carlo(f, a, b, metodo = "monte_carlo", tol = None, n_max = 10**6, lote = 2**12, semente = None, replicas = 8, workers = None, executor = None, vetorizado = None):
+
+    """
+    Aproxima a integral de f sobre o retângulo [a_1, b_1] x ... x [a_d, b_d]
+    por Monte Carlo ou quasi-Monte Carlo (Sobol' ou Halton).
+
+    Os pontos são gerados em lotes de 'lote' pontos e f é avaliada sobre
+    cada lote de uma vez. A cada lote o erro padrão estimado é
+    atualizado, e o cálculo para assim que ele fica abaixo de 'tol'.
+
+    - 'monte_carlo': pontos uniformes; o erro padrão vem da variância
+      amostral de f, acumulada lote a lote.
+    - 'sobol' e 'halton': sequências de baixa discrepância, com erro
+      típico próximo de 1/N em vez de 1/sqrt(N). Para estimar o erro,
+      a sequência é usada 'replicas' vezes com deslocamentos aleatórios
+      independentes (XOR digital em Sobol', soma módulo 1 em Halton); o
+      resultado é a média das réplicas e o erro, o desvio padrão dessa
+      média.
+
+    Reprodutibilidade e paralelismo: np.random.SeedSequence(semente) é
+    dividida (spawn) em um fluxo independente por worker. Em cada
+    rodada, cada fluxo avalia um lote e as estatísticas são combinadas
+    sempre na mesma ordem, então, para a mesma 'semente' e o mesmo
+    número de workers, o resultado é idêntico bit a bit, seja a execução
+    sequencial, com threads ou com processos.
+
+    Parametres:
+      f : callable
+        Função a ser integrada. Em uma dimensão recebe um array de
+        abscissas (ou um float, no caminho escalar); em d dimensões
+        recebe um array (m, d) e devolve m valores (ou uma linha de
+        tamanho d por vez, no caminho escalar).
+
+      a, b : float ou sequência de floats
+        Limites de integração em cada dimensão.
+
+      metodo : string, optional
+        'monte_carlo', 'sobol' ou 'halton'.
+
+      tol : float ou None, optional
+        Erro padrão desejado. Se None, usa todas as n_max avaliações.
+
+      n_max : int, optional
+        Número máximo de avaliações de f; a última rodada é reduzida
+        para não ultrapassá-lo. Nos métodos quasi-Monte Carlo cada ponto
+        custa 'replicas' avaliações, então é preciso n_max >= replicas.
+
+      lote : int, optional
+        Pontos por lote (e por fluxo) em cada rodada.
+
+      semente : int ou None, optional
+        Semente de np.random.SeedSequence.
+
+      replicas : int, optional
+        Número de deslocamentos aleatórios nos métodos quasi-Monte Carlo.
+
+      workers : int ou None, optional
+        Número de fluxos independentes e de workers (ver 'integral').
+
+      executor : string ou concurrent.futures.Executor, optional
+        Igual a 'integral'.
+
+      vetorizado : bool ou None, optional
+        Igual a 'integral'.
+
+    Returns:
+      soma : ResultadoIntegral
+        Aproximação da integral, com 'erro_estimado' (erro padrão) e
+        'n_avaliacoes'.
+
+    Exemplos:
+      >>> f = lambda x: np.exp(-np.sum(x**2, axis=1))
+      >>> area = integral_monte_carlo(f, [0]*5, [1]*5, metodo="sobol", tol=1e-5, semente=42)
+      >>> print(area, area.erro_estimado)
+    """
+    a, b = _validar_caixa(f, a, b)
+
+    if metodo not in ['monte_carlo', 'sobol', 'halton']:
+      raise NameError('O método deve ser monte_carlo, sobol ou halton')
+
+    d = a.size
+    if metodo == 'sobol' and d > len(_SOBOL_DIRECOES) + 1:
+      raise ValueError(f"A sequência de Sobol' está disponível até {len(_SOBOL_DIRECOES) + 1} dimensões.")
+
+    for nome, valor in (("n_max", n_max), ("lote", lote), ("replicas", replicas)):
+      if not isinstance(valor, (int, np.integer)) or valor <= 0:
+        raise TypeError(f"O argumento {nome} deve ser um inteiro positivo.")
+    if metodo != 'monte_carlo' and replicas < 2:
+      raise TypeError("São necessárias ao menos 2 réplicas para estimar o erro.")
+    if metodo != 'monte_carlo' and n_max < replicas:
+      raise TypeError("O argumento n_max deve permitir ao menos uma avaliação por réplica.")
+    if tol is not None:
+      _validar_tol(tol)
+
+    largura = b - a
+    volume = float(np.prod(largura))
+    if volume == 0:
+      return ResultadoIntegral(0.0, metodo=metodo, erro_estimado=0.0)
+
+    sementes = np.random.SeedSequence(semente)
+    fluxos = sementes.spawn(workers or 1)
+    executor, criado = _preparar_executor(workers, executor)
+
+    def executar(tarefas):
+        if executor is None:
+            return [funcao(*argumentos) for funcao, *argumentos in tarefas]
+        futuros = [executor.submit(*tarefa) for tarefa in tarefas]
+        return [futuro.result() for futuro in futuros]
+
+    n_avaliacoes = 0
+    rodada = 0
+    try:
+        if metodo == 'monte_carlo':
+            n, media, M2 = 0, 0.0, 0.0
+            while n_avaliacoes < n_max:
+                tamanhos = _tamanhos_dos_lotes(n_max - n_avaliacoes, len(fluxos), lote)
+                tarefas = [(_lote_monte_carlo, f,
+                            np.random.SeedSequence(fluxo.entropy, spawn_key=fluxo.spawn_key + (rodada,)),
+                            m, a, largura, vetorizado) for fluxo, m in zip(fluxos, tamanhos)]
+                # combinação de médias e variâncias (Chan et al.), na ordem dos fluxos
+                for n_b, media_b, M2_b, vetorizado_b in executar(tarefas):
+                    vetorizado = False if vetorizado_b is False else vetorizado
+                    total = n + n_b
+                    delta = media_b - media
+                    media += delta * n_b / total
+                    M2 += M2_b + delta**2 * n * n_b / total
+                    n = total
+                n_avaliacoes = n
+                rodada += 1
+                valor = volume * media
+                erro = volume * math.sqrt(M2 / (n - 1) / n) if n > 1 else math.inf
+                if tol is not None and erro <= tol:
+                    break
+        else:
+            gerador = np.random.default_rng(sementes.spawn(1)[0])
+            if metodo == 'sobol':
+                deslocamentos = gerador.integers(0, 2**_BITS_SOBOL, size=(replicas, d), dtype=np.uint64)
+            else:
+                deslocamentos = gerador.random((replicas, d))
+            somas = np.zeros(replicas)
+            inicio = 0
+            while n_max - n_avaliacoes >= replicas:
+                tamanhos = _tamanhos_dos_lotes((n_max - n_avaliacoes) // replicas, len(fluxos), lote)
+                inicios = inicio + np.cumsum([0] + tamanhos[:-1])
+                tarefas = [(_lote_quasi_monte_carlo, f, metodo, int(i), m, a, largura, deslocamentos, vetorizado)
+                           for i, m in zip(inicios, tamanhos)]
+                for somas_b, vetorizado_b in executar(tarefas):
+                    vetorizado = False if vetorizado_b is False else vetorizado
+                    somas += somas_b
+                inicio += sum(tamanhos)
+                n_avaliacoes = inicio * replicas
+                rodada += 1
+                estimativas = volume * somas / inicio
+                valor = estimativas.mean()
+                erro = estimativas.std(ddof=1) / math.sqrt(replicas)
+                if tol is not None and erro <= tol:
+                    break
+    finally:
+        if criado:
+            executor.shutdown()
+
+    if tol is not None and erro > tol:
+        raise RuntimeError(f"O erro padrão estimado ({erro:.3e}) não ficou abaixo de tol em {n_max} avaliações; "
+                           f"estimativa atual: {valor}.")
+
+    return ResultadoIntegral(valor, n_avaliacoes=n_avaliacoes, metodo=metodo, erro_estimado=erro)
+
+
+def _regra_1d(metodo, a, b, n, ordem=None):
+
+    """
+    Nós e pesos da regra composta unidimensional em [a, b], na mesma
+    disposição de '_nos_particao': sum(w * f(x)) coincide com a regra.
+    """
+    delta_x = (b - a) / n
+    x = _nos_particao(metodo, a, b, n, ordem)
+    if metodo == 'trapezio':
+        w = np.full(n + 1, delta_x)
+        w[[0, -1]] /= 2.0
+    elif metodo == 'simpson':
+        w = np.tile([2.0, 4.0], n + 1)[:2*n + 1] * (delta_x / 6.0)
+        w[[0, -1]] = delta_x / 6.0
+    else:
+        _, w_gauss = _nos_gauss_legendre(ordem)
+        w = np.tile(w_gauss * (delta_x / 2.0), n)
+    return x, w
+
+
+def _pecas_tensoriais(nos, pesos, fator, tamanho_bloco):
+
+    """
+    Percorre a grade produto tensorial dos nós unidimensionais em blocos
+    de até 'tamanho_bloco' pontos, gerando (X, W) com X de formato (m, d)
+    e W = fator * produto dos pesos unidimensionais.
+    """
+    formato = tuple(x.size for x in nos)
+    total = math.prod(formato)
+    for inicio in range(0, total, tamanho_bloco):
+        indices = np.unravel_index(np.arange(inicio, min(inicio + tamanho_bloco, total)), formato)
+        X = np.stack([x[i] for x, i in zip(nos, indices)], axis=-1)
+        W = fator * np.prod([w[i] for w, i in zip(pesos, indices)], axis=0)
+        yield X, W
+
+
+def _indices_smolyak(d, q):
+
+    """Multi-índices i (i_k >= 1) com max(d, q - d + 1) <= |i| <= q."""
+    def gerar(prefixo, restantes, soma):
+        if restantes == 0:
+            if max(d, q - d + 1) <= soma:
+                yield prefixo
+            return
+        for i in range(1, q - soma - restantes + 2):
+            yield from gerar(prefixo + (i,), restantes - 1, soma + i)
+    return gerar((), d, 0)
+
+
+def _grade_smolyak(a, b, nivel):
+
+    """
+    Nós e pesos da grade esparsa de Smolyak (técnica de combinação) com
+    regras de Gauss-Legendre de i pontos em cada direção:
+
+        A(q, d) = sum (-1)^(q - |i|) * C(d - 1, q - |i|) * U^(i_1) x ... x U^(i_d),
+
+    com q = nivel + d - 1. Nós repetidos entre as grades são unidos e
+    seus pesos somados. A regra integra exatamente polinômios de grau
+    total até 2*nivel - 1.
+    """
+    d = a.size
+    q = nivel + d - 1
+    regras = {}
+    for i in range(1, nivel + 1):
+        t, w = _nos_gauss_legendre(i)
+        # nós simétricos exatos, para que o nó central coincida entre as ordens ímpares
+        t = (t - t[::-1]) / 2.0
+        w = (w + w[::-1]) / 2.0
+        regras[i] = (t, w)
+
+    pontos, pesos = [], []
+    for indice in _indices_smolyak(d, q):
+        k = q - sum(indice)
+        coeficiente = (-1)**k * math.comb(d - 1, k)
+        for T, W in _pecas_tensoriais([regras[i][0] for i in indice], [regras[i][1] for i in indice],
+                                      coeficiente, 2**62):
+            pontos.append(T)
+            pesos.append(W)
+    pontos, inverso = np.unique(np.concatenate(pontos), axis=0, return_inverse=True)
+    pesos = np.bincount(inverso.ravel(), weights=np.concatenate(pesos))
+    metade = (b - a) / 2.0
+    return (a + b) / 2.0 + metade * pontos, pesos * np.prod(metade)
+
+
+def integral_nd(f, a, b, n = 10, metodo = "trapezio", ordem = 5, nivel = 4, tamanho_bloco = 2**16, vetorizado = None):
+
+    """
+    Aproxima a integral de f sobre o retângulo [a_1, b_1] x ... x [a_d, b_d].
+
+    Com 'trapezio', 'simpson' ou 'gauss', usa o produto tensorial das
+    regras compostas unidimensionais de 'integral' (n subintervalos por
+    dimensão). A grade não é montada inteira: os pontos são gerados e f
+    é avaliada em blocos de até 'tamanho_bloco' pontos, então a memória
+    usada não depende do total de nós, e as somas de cada bloco são
+    acumuladas com 'soma_de_kahan_lista'.
+
+    O número de nós do produto tensorial cresce como n^d. Para dimensões
+    maiores (até d ~ 10), 'smolyak' usa uma grade esparsa de Smolyak com
+    regras de Gauss-Legendre, cujo número de nós cresce polinomialmente
+    em d para um 'nivel' fixo e que é exata para polinômios de grau total
+    até 2*nivel - 1.
+
+    Parametres:
+      f : callable
+        Função a ser integrada. Recebe um array (m, d) e devolve m
+        valores (ou, no caminho escalar, uma linha de tamanho d por vez).
+
+      a, b : sequência de floats
+        Limites de integração em cada dimensão.
+
+      n : int ou sequência de ints, optional
+        Subintervalos por dimensão (ignorado em 'smolyak').
+
+      metodo : string, optional
+        'trapezio', 'simpson', 'gauss' ou 'smolyak'.
+
+      ordem : int, optional
+        Pontos de Gauss-Legendre por subintervalo no método 'gauss'.
+
+      nivel : int, optional
+        Nível da grade esparsa no método 'smolyak'.
+
+      tamanho_bloco : int, optional
+        Número máximo de pontos avaliados por vez.
+
+      vetorizado : bool ou None, optional
+        Igual a 'integral'.
+
+    Returns:
+      soma : ResultadoIntegral
+        Aproximação da integral, com 'n_avaliacoes'.
+
+    Exemplos:
+      >>> f = lambda x: np.exp(-np.sum(x**2, axis=1))
+      >>> integral_nd(f, [0, 0, 0], [1, 1, 1], 20, metodo="gauss", ordem=3)
+      >>> integral_nd(f, [0]*8, [1]*8, metodo="smolyak", nivel=5)
+    """
+    a, b = _validar_caixa(f, a, b)
+    d = a.size
+
+    if metodo not in ['trapezio', 'simpson', 'gauss', 'smolyak']:
+      raise NameError('O método deve ser trapezio, simpson, gauss ou smolyak')
+
+    if not isinstance(tamanho_bloco, (int, np.integer)) or tamanho_bloco <= 0:
+      raise TypeError("O tamanho do bloco deve ser um inteiro positivo.")
+
+    if metodo == 'smolyak':
+      if not isinstance(nivel, (int, np.integer)) or nivel <= 0:
+        raise TypeError("O nível da grade esparsa deve ser um inteiro positivo.")
+    else:
+      n = np.broadcast_to(np.asarray(n, dtype=object), (d,))
+      if not all(isinstance(n_j, (int, np.integer)) and n_j > 0 for n_j in n):
+        raise TypeError("O número de partições deve ser um inteiro positivo (ou um por dimensão).")
+      if metodo == 'gauss' and (not isinstance(ordem, (int, np.integer)) or ordem <= 0):
+        raise TypeError("A ordem de Gauss-Legendre deve ser um inteiro positivo.")
+
+    if np.any(a == b):
+      return ResultadoIntegral(0.0, metodo=metodo)
+
+    if metodo == 'smolyak':
+        X, W = _grade_smolyak(a, b, nivel)
+        pecas = ((X[i:i + tamanho_bloco], W[i:i + tamanho_bloco]) for i in range(0, W.size, tamanho_bloco))
+    else:
+        regras = [_regra_1d(metodo, a_j, b_j, int(n_j), ordem) for a_j, b_j, n_j in zip(a, b, n)]
+        pecas = _pecas_tensoriais([x for x, _ in regras], [w for _, w in regras], 1.0, tamanho_bloco)
+
+    partes = []
+    n_avaliacoes = 0
+    for pontos, pesos in pecas:
+        valores, vetorizado = _avaliar_pontos(f, pontos[:, 0] if d == 1 else pontos, vetorizado)
+        partes.append(np.dot(pesos, valores))
+        n_avaliacoes += pesos.size
 
-    return soma 
\ No newline at end of file
+    return ResultadoIntegral(soma_de_kahan_lista(partes), n_avaliacoes=n_avaliacoes, metodo=metodo)
@@ -1,6 +1,89 @@
 import numpy as np
 import matplotlib.pyplot as plt
 import math
+from functools import lru_cache
+
+def _pecas_em_cache(calcular):
+
+  """
+  Calcula ``calcular()`` só na primeira chamada e guarda o resultado.
+
+  Parameters
+  ----------
+  calcular : callable
+      Função sem argumentos que devolve a tupla ``(quebras, coeficientes)``.
+
+  Returns
+  -------
+  pecas : callable
+      Função sem argumentos que devolve sempre a mesma tupla, com os
+      arrays marcados como somente leitura para que quem os recebe não
+      altere as chamadas seguintes.
+  """
+  @lru_cache(maxsize=None)
+  def pecas():
+    arrays = calcular()
+    for v in arrays:
+      v.setflags(write=False)
+    return arrays
+  return pecas
+
+def _diferencas_divididas(x, y):
+
+  """
+  Calcula os coeficientes da forma de Newton por diferenças divididas.
+
+  Parameters
+  ----------
+  x : np.ndarray
+      Nós de interpolação (distintos).
+
+  y : np.ndarray
+      Valores nos nós.
+
+  Returns
+  -------
+  coeficientes : np.ndarray
+      Coeficientes ``c_0, ..., c_(n-1)`` com ``c_j = f[x_0, ..., x_j]``.
+
+  Notes
+  -----
+  A tabela é atualizada em um único vetor, coluna a coluna:
+  tempo O(n²) e memória O(n).
+  """
+  coeficientes = np.array(y, dtype=float)
+  for j in range(1, len(x)):
+    coeficientes[j:] = (coeficientes[j:] - coeficientes[j-1:-1]) / (x[j:] - x[:-j])
+  return coeficientes
+
+def _forma_de_potencias(coeficientes, centros, origem):
+
+  """
+  Reescreve um polinômio na forma de Newton em potências de ``(x - origem)``.
+
+  Parameters
+  ----------
+  coeficientes : array_like
+      Coeficientes ``c_0, ..., c_m`` da forma de Newton
+      ``c_0 + c_1 (x - z_0) + ... + c_m (x - z_0)...(x - z_(m-1))``.
+
+  centros : array_like
+      Nós ``z_0, ..., z_(m-1)`` da forma de Newton.
+
+  origem : float
+      Origem das novas potências.
+
+  Returns
+  -------
+  p : np.ndarray
+      Coeficientes em ordem crescente: ``p(x) = sum p[j] (x - origem)**j``.
+  """
+  p = np.array([coeficientes[-1]], dtype=float)
+  # Horner simbólico: p <- p*(x - z_i) + c_i, com (x - z_i) = (x - origem) - (z_i - origem)
+  for i in range(len(coeficientes) - 2, -1, -1):
+    p = np.concatenate(([0.0], p)) - (centros[i] - origem) * np.concatenate((p, [0.0]))
+    p[0] += coeficientes[i]
+  return p
 
 def linear_interp(X_coord: list, Y_coord: list, plot: bool = True, title: str = ""):
 
@@ -38,6 +121,9 @@ def linear_interp(X_coord: list, Y_coord: list, plot: bool = True, title: str =
   - Fora do intervalo definido pelos pontos, o comportamento é de extrapolação
     linear com base nos dois primeiros ou dois últimos pontos.
   - Utiliza ``matplotlib`` para plotar.
+  - ``f.pecas()`` devolve a tupla ``(quebras, coeficientes)`` do polinômio
+    por partes (ver ``integracao.integral_interpolante``); ela só é calculada
+    na primeira chamada.
   """
 
   pontos = [(X_coord[i],Y_coord[i]) for i in range(len(X_coord))]
@@ -113,6 +199,15 @@ def linear_interp(X_coord: list, Y_coord: list, plot: bool = True, title: str =
 
     plt.show()
 
+  # Representação por partes: em [x_i, x_(i+1)], y_i + inclinação_i * (x - x_i).
+  # As partes extremas também valem fora do intervalo (extrapolação linear).
+  @_pecas_em_cache
+  def pecas():
+    quebras = np.array([p[0] for p in pontos], dtype=float)
+    alturas = np.array([p[1] for p in pontos], dtype=float)
+    return quebras, np.column_stack((alturas[:-1], np.diff(alturas) / np.diff(quebras)))
+  f.pecas = pecas
+
   # Retornando a função.
   return f
 
@@ -154,6 +249,9 @@ def poly_interp(X, Y, method = "lagrange", plot = True, title = "" ):
   - Todos os métodos de interpolação produzem o mesmo polinômio teórico,
     embora possam diferir numericamente em estabilidade.
   - Requer `numpy` e `matplotlib`.
+  - ``pol.pecas()`` devolve a tupla ``(quebras, coeficientes)``, com uma única
+    parte em potências de ``(x - min(X))`` (ver ``integracao.integral_interpolante``);
+    ela só é calculada na primeira chamada.
   """
   if not isinstance(X, (list, np.ndarray)) or not isinstance(Y, (list, np.ndarray)):
     raise TypeError
@@ -224,14 +322,7 @@ def poly_interp(X, Y, method = "lagrange", plot = True, title = "" ):
   if method == "newton":
     # Cálculo dos coeficientes do polinômio de Newton
     # (Diferenças divididas)
-    coef = np.zeros((n, n))
-    coef[:,0] = y  # primeira coluna recebe os valores y_i
-    # Calcula as diferenças divididas
-    for j in range(1, n):
-        for i in range(n - j):
-            coef[i][j] = (coef[i+1][j-1] - coef[i][j-1]) / (x[i+j] - x[i])
-    # Retorna apenas a primeira linha (coeficientes do polinômio)
-    coeficientes = coef[0, :]
+    coeficientes = _diferencas_divididas(x, y)
 
     # Avaliação do polinômio de Newton em um ponto (ou vetor)
     def newton_eval(ponto):
@@ -317,6 +408,19 @@ def poly_interp(X, Y, method = "lagrange", plot = True, title = "" ):
       return p
     pol = eval_vandermonde
 
+  # Representação em potências de (x - min(x)), calculada só se for pedida
+  @_pecas_em_cache
+  def pecas():
+    if method == "vandermonde":
+      # a forma de Newton com todos os nós em zero é a forma usual a_0 + a_1 x + ...
+      potencias = _forma_de_potencias(coeficientes, np.zeros(n), min(x))
+    elif method == "newton":
+      potencias = _forma_de_potencias(coeficientes, x, min(x))
+    else:
+      potencias = _forma_de_potencias(_diferencas_divididas(x, y), x, min(x))
+    return np.array([min(x), max(x)]), potencias[None, :]
+  pol.pecas = pecas
+
   # Plotando o Gráfico
   if plot:
     # Gera pontos igualmente espaçados para desenhar a curva
@@ -371,6 +475,10 @@ def hermite_interp(x: list, deriv: list, plot=True, title=""):
 
     - Demais entradas da tabela são calculadas usando 
       diferenças divididas convencionais.
+
+    - ``H.pecas()`` devolve a tupla ``(quebras, coeficientes)``, com uma única
+      parte em potências de ``(x - min(x))`` (ver ``integracao.integral_interpolante``);
+      ela só é calculada na primeira chamada.
     """
     deriv = [
     d if isinstance(d, (list, tuple, np.ndarray)) else [d]
@@ -434,6 +542,12 @@ def hermite_interp(x: list, deriv: list, plot=True, title=""):
       else:
           return np.array([H(x_i) for x_i in t])
 
+    @_pecas_em_cache
+    def pecas():
+        return (np.array([min(x), max(x)], dtype=float),
+                _forma_de_potencias(coeff, Z, min(x))[None, :])
+    H.pecas = pecas
+
     # Plot do dos pontos e o polinômio interpolador
     if plot:
         if min(x) == max(x):    # Caso onde só é dado um ponto
@@ -2,9 +2,13 @@
 Módulo para cálculo de raízes de funções reais. Feito por: Anizio S. C. Júnior (aka AnZ)
 
 Este módulo implementa métodos numéricos para encontrar raízes (zeros) de funções reais.
-Implementações: Método da Bisseção, Método de Bisseção para múltiplas raízes, Método de Secante e Método de Newton-Raphson.
+Implementações: Método da Bisseção, Método de Bisseção para múltiplas raízes, Método de Secante, Método de Brent, Método de Newton-Raphson
+(escalar e em lote) e Método de Halley.
 """
 
+import numpy as np
+
+from CB2325NumericaG3.diferenciacao_automatica import derivadas
 from CB2325NumericaG3.visualizacao_raizes import VisualizadorRaizes
 
 def bissecao(f, a, b, tol=1e-6, max_iter=100, graf=True, retornar_historico=False):
@@ -106,11 +110,150 @@ def bissecao(f, a, b, tol=1e-6, max_iter=100, graf=True, retornar_historico=Fals
     
     raise RuntimeError(f"Método da bisseção não convergiu após {max_iter} iterações.")
 
+def _avaliar_vetorial(f, x, vetorizado=None):
+    """
+    Avalia f em todos os pontos do array x.
+
+    Com vetorizado=None, tenta uma única chamada f(x); se f não aceitar
+    arrays (lança exceção ou devolve algo com formato diferente de x),
+    avalia ponto a ponto. A decisão é devolvida para que as avaliações
+    seguintes da mesma busca não repitam a tentativa.
+
+    Parameters
+    ----------
+    f : callable
+        Função a ser avaliada.
+    x : np.ndarray
+        Pontos de avaliação.
+    vetorizado : bool or None, optional
+        True chama f(x) diretamente, False avalia ponto a ponto e
+        None (padrão) decide como descrito acima.
+
+    Returns
+    -------
+    y : np.ndarray
+        Valores f(x) como floats, no mesmo formato de x.
+    vetorizado : bool
+        Se f foi avaliada sobre o array inteiro.
+    """
+    if vetorizado is None:
+        try:
+            with np.errstate(all='ignore'):
+                y = np.asarray(f(x), dtype=float)
+            if y.shape == x.shape:
+                return y, True
+        except Exception:
+            pass
+        vetorizado = False
+    if vetorizado:
+        with np.errstate(all='ignore'):
+            return np.asarray(f(x), dtype=float).reshape(x.shape), True
+    return np.array([f(float(x_i)) for x_i in x.ravel()], dtype=float).reshape(x.shape), False
+
+
+def _bissecao_em_lote(f, a, b, fa, fb, tol=1e-6, max_iter=100, guardar_historico=False, vetorizado=None):
+    """
+    Aplica o método da bisseção a vários intervalos [a_k, b_k] ao mesmo tempo.
+
+    Todos os intervalos ainda ativos avançam juntos, como arrays do NumPy,
+    com uma única avaliação (vetorizada, se possível) de f por iteração.
+    Os critérios de parada são os de `bissecao`: |f(c)| < tol ou
+    (b - a)/2 < tol. Um intervalo que estagna (ponto médio igual ao da
+    iteração anterior) ou não converge em max_iter iterações é
+    marcado como falha.
+
+    Parameters
+    ----------
+    f : callable
+        Função cujo zero será procurado.
+    a, b : np.ndarray
+        Extremos dos intervalos, com f(a_k) e f(b_k) de sinais opostos.
+    fa, fb : np.ndarray
+        Valores já conhecidos de f nos extremos.
+    tol : float, optional
+        Tolerância da bisseção.
+    max_iter : int, optional
+        Iterações máximas.
+    guardar_historico : bool, optional
+        Se True, guarda os pontos médios de cada intervalo.
+    vetorizado : bool or None, optional
+        Se f aceita arrays (ver `_avaliar_vetorial`); com None, é
+        decidido na primeira iteração e mantido nas demais.
+
+    Returns
+    -------
+    raizes : np.ndarray
+        Aproximação da raiz de cada intervalo (NaN nas falhas).
+    convergiu : np.ndarray of bool
+        Se cada intervalo convergiu.
+    historicos : list of list or None
+        Pontos médios e o intervalo final de cada intervalo
+        (apenas com guardar_historico=True).
+    """
+    a, b = np.array(a, dtype=float), np.array(b, dtype=float)
+    fa, fb = np.array(fa, dtype=float), np.array(fb, dtype=float)
+    m = a.size
+    raizes = np.full(m, np.nan)
+    historicos = [[] for _ in range(m)] if guardar_historico else None
+    finais = [None] * m
+    ultimo_c = np.full(m, np.nan)
+
+    # Como em `bissecao`, extremos que já são raízes encerram o intervalo
+    fim_a = np.abs(fa) < tol
+    fim_b = ~fim_a & (np.abs(fb) < tol)
+    raizes[fim_a] = a[fim_a]
+    raizes[fim_b] = b[fim_b]
+    convergiu = fim_a | fim_b
+    if guardar_historico:
+        for k in np.flatnonzero(convergiu):
+            historicos[k].append(float(raizes[k]))
+            finais[k] = (float(a[k]), float(b[k]))
+    ativos = np.flatnonzero(~convergiu)
+    a, b, fa, fb = a[ativos], b[ativos], fa[ativos], fb[ativos]
+
+    for _ in range(max_iter):
+        if ativos.size == 0:
+            break
+        c = (a + b) / 2.0
+        fc, vetorizado = _avaliar_vetorial(f, c, vetorizado)
+        if guardar_historico:
+            for k, c_k in zip(ativos, c):
+                historicos[k].append(float(c_k))
+
+        fim = (np.abs(fc) < tol) | ((b - a) / 2.0 < tol)
+        raizes[ativos[fim]] = c[fim]
+        convergiu[ativos[fim]] = True
+        if guardar_historico:
+            for k, a_k, b_k in zip(ativos[fim], a[fim], b[fim]):
+                finais[k] = (float(a_k), float(b_k))
+
+        # Mesmo critério de estagnação de `bissecao`
+        continua = ~fim & ~(np.abs(c - ultimo_c) < 1e-15)
+
+        troca_b = fa * fc < 0
+        b = np.where(troca_b, c, b)
+        fb = np.where(troca_b, fc, fb)
+        a = np.where(troca_b, a, c)
+        fa = np.where(troca_b, fa, fc)
+
+        ativos, a, b, fa, fb, ultimo_c = (v[continua] for v in (ativos, a, b, fa, fb, c))
+
+    if guardar_historico:
+        historicos = [(h, finais[k]) for k, h in enumerate(historicos)]
+    return raizes, convergiu, historicos
+
+
 def bissecao_multiraizes(f, a, b, tol=1e-6, max_iter=100, max_raizes=10, subdivisoes=1000, graf=False):
     """
     Encontra até 'max_raizes' raízes de f(x) no intervalo [a, b] usando o método da bisseção.
     Se o número de raízes ultrapassar 'max_raizes', lança um aviso e interrompe.
 
+    A varredura avalia f uma única vez em cada ponto da malha e os
+    intervalos com mudança de sinal são refinados todos ao mesmo tempo
+    (ver `_bissecao_em_lote`), reaproveitando os valores já conhecidos
+    nos extremos e com uma única avaliação de f por iteração para todos
+    eles; se f aceitar arrays do NumPy, essas avaliações são vetorizadas.
+
     Parameters
     ----------
     f : callable
@@ -134,36 +277,81 @@ def bissecao_multiraizes(f, a, b, tol=1e-6, max_iter=100, max_raizes=10, subdivi
         Lista com as raízes encontradas.
     """
 
+    # Varredura: f é avaliada uma única vez em cada ponto da malha
+    x_vals = a + np.arange(subdivisoes + 1)*(b - a)/subdivisoes
+    y_vals, vetorizado = _avaliar_vetorial(f, x_vals)
+
+    # Detecta mudança de sinal
+    mudancas = np.flatnonzero(y_vals[:-1] * y_vals[1:] < 0)
+
     raizes = []
-    x_vals = [a + i*(b-a)/subdivisoes for i in range(subdivisoes+1)]
-
-    for i in range(subdivisoes):
-        x0, x1 = x_vals[i], x_vals[i+1]
-        f0, f1 = f(x0), f(x1)
-
-        # Detecta mudança de sinal
-        if f0 * f1 < 0:
-            try:
-                raiz = bissecao(f, x0, x1, tol=tol, max_iter=max_iter, graf=graf, retornar_historico=False)
-                raizes.append(raiz)
-            except Exception:
-                continue  # Se der erro numérico, ignora o subintervalo
-
-            # Se atingir o limite de raízes, interrompe
-            if len(raizes) >= max_raizes:
-                print( f"Atenção: limite de {max_raizes} raízes atingido. Interrompendo busca em [{a}, {b}].\n"
-                       f"{len(raizes)} Raízes encontradas antes do limite:\n"
-                       f"{raizes}")
-                break
+    i = 0
+    while i < mudancas.size and len(raizes) < max_raizes:
+        # Próximos intervalos (no máximo os que ainda faltam para chegar a max_raizes)
+        lote = mudancas[i:i + max_raizes - len(raizes)]
+        i += lote.size
+
+        # Refina todos os intervalos de uma vez, reaproveitando os valores
+        # da varredura nos extremos; os que falharem são ignorados
+        encontradas, convergiu, historicos = _bissecao_em_lote(f, x_vals[lote], x_vals[lote + 1],
+                                                               y_vals[lote], y_vals[lote + 1], tol=tol,
+                                                               max_iter=max_iter, guardar_historico=graf,
+                                                               vetorizado=vetorizado)
+        for k in np.flatnonzero(convergiu):
+            raizes.append(float(encontradas[k]))
+            if graf:
+                historico, (a_k, b_k) = historicos[k]
+                viz = VisualizadorRaizes(f)
+                viz.visualizar(historico, a=a_k, b=b_k, titulo="Método da Bisseção")
+
+    # Se atingir o limite de raízes, interrompe
+    if len(raizes) >= max_raizes:
+        print( f"Atenção: limite de {max_raizes} raízes atingido. Interrompendo busca em [{a}, {b}].\n"
+               f"{len(raizes)} Raízes encontradas antes do limite:\n"
+               f"{raizes}")
 
     return raizes
 
+
+def _derivadas_automaticas(f, x, ordem, args=()):
+    """
+    Tenta obter f(x) e as derivadas até `ordem` por diferenciação automática.
+
+    Parameters
+    ----------
+    f : callable
+        Função f(x, *args).
+    x : float ou np.ndarray
+        Ponto (ou pontos) de avaliação.
+    ordem : int
+        Maior ordem de derivada desejada.
+    args : tuple, optional
+        Parâmetros extras de f.
+
+    Returns
+    -------
+    tuple ou None
+        (f(x), f'(x), ...) ou None se f não aceitar números duais (por
+        exemplo, por usar funções de `math`); nesse caso quem chama recai
+        nas diferenças finitas.
+    """
+    try:
+        return derivadas(lambda t: f(t, *args), x, ordem)
+    except Exception:
+        return None
+
+
 def newton_raphson(f, x0, df=None, tol=1e-6, max_iter=100, h=1e-8, graf=True, retornar_historico=False):
     """
     Encontra uma raiz da função f usando o Método de Newton-Raphson.
     
     O método de Newton-Raphson converge rapidamente quando próximo da raiz,
-    mas requer o cálculo ou aproximação da derivada.
+    mas requer o cálculo ou aproximação da derivada. Se df não for fornecida,
+    f e f' são calculadas juntas, numa única avaliação, por diferenciação
+    automática (ver `diferenciacao_automatica`); só se f não aceitar números
+    duais (por exemplo, por usar funções de `math` em vez das do NumPy) a
+    derivada é aproximada por diferenças centrais, com três avaliações de f
+    por iteração.
 
     Esse metodo utiliza de retas tangentes, definimos um ponto x_0 para começarmos
     e extraimos a reta tangente df(x_0)/dx daquele ponto utilizando de derivadas,
@@ -180,13 +368,16 @@ def newton_raphson(f, x0, df=None, tol=1e-6, max_iter=100, h=1e-8, graf=True, re
     x0 : float
         Aproximação inicial da raiz.
     df : callable, optional
-        Derivada da função f. Se não fornecida, será aproximada numericamente.
+        Derivada da função f. Se não fornecida, será calculada por
+        diferenciação automática ou, se isso não for possível, aproximada
+        numericamente.
     tol : float, optional
         Tolerância para o critério de parada (padrão: 1e-6).
     max_iter : int, optional
         Número máximo de iterações (padrão: 100).
     h : float, optional
-        Passo para aproximação numérica da derivada (padrão: 1e-8).
+        Passo para aproximação numérica da derivada (padrão: 1e-8), usado
+        apenas se f não aceitar números duais.
     graf : bool, optional
         Se mostra o gráfico da função ou não.
     retornar_historico : bool, optional
@@ -217,16 +408,23 @@ def newton_raphson(f, x0, df=None, tol=1e-6, max_iter=100, h=1e-8, graf=True, re
     """
     x = x0
     historico = [x0]
+    # Sem df, tenta obter f e f' juntas por diferenciação automática
+    automatica = df is None
     
     for i in range(max_iter):
-        fx = f(x)
-        
-        # Calcula a derivada
-        if df is not None:
-            dfx = df(x)
+        valores = _derivadas_automaticas(f, x, 1) if automatica else None
+        if valores is not None:
+            fx, dfx = valores
         else:
-            # Aproximação numérica da derivada (diferenças finitas)
-            dfx = (f(x + h) - f(x - h)) / (2 * h)
+            automatica = False
+            fx = f(x)
+            
+            # Calcula a derivada
+            if df is not None:
+                dfx = df(x)
+            else:
+                # Aproximação numérica da derivada (diferenças finitas)
+                dfx = (f(x + h) - f(x - h)) / (2 * h)
         
         # Verifica se a derivada é muito pequena
         if abs(dfx) < 1e-12:
@@ -261,6 +459,222 @@ def newton_raphson(f, x0, df=None, tol=1e-6, max_iter=100, h=1e-8, graf=True, re
         raise RuntimeError(f"Método de Newton-Raphson não convergiu após {max_iter} iterações.")
 
 
+def newton_raphson_lote(f, x0, df=None, args=(), tol=1e-6, max_iter=100, h=1e-8):
+    """
+    Resolve f(x; p) = 0 para muitos pontos iniciais e parâmetros de uma vez
+    usando o Método de Newton-Raphson.
+
+    Todos os problemas são iterados juntos com operações de arrays do NumPy:
+    a cada iteração f (e df) é chamada uma única vez sobre os problemas que
+    ainda não terminaram. Os que convergem ou falham são retirados do lote,
+    e uma falha não interrompe os demais: em vez de lançar RuntimeError, o
+    resultado de cada problema é indicado em `convergiu`.
+
+    Os critérios de parada são os de `newton_raphson`: |f(x)| < tol*1e-2 ou
+    |x_novo - x| < tol. Um problema falha se a derivada ficar muito próxima
+    de zero, se f ou f' deixarem de ser finitos ou se atingir `max_iter`.
+
+    Parameters
+    ----------
+    f : callable
+        Função f(x, *args), que deve aceitar arrays do NumPy em x e nos
+        parâmetros e devolver um array do mesmo formato.
+    x0 : float ou array_like
+        Aproximações iniciais.
+    df : callable, optional
+        Derivada df(x, *args) em relação a x. Se não fornecida, será
+        calculada por diferenciação automática ou, se f não aceitar números
+        duais, aproximada numericamente.
+    args : tuple, optional
+        Parâmetros extras de f (escalares ou arrays). São combinados com
+        x0 por broadcasting, então um mesmo x0 pode ser usado para vários
+        parâmetros e vice-versa.
+    tol : float, optional
+        Tolerância para o critério de parada (padrão: 1e-6).
+    max_iter : int, optional
+        Número máximo de iterações (padrão: 100).
+    h : float, optional
+        Passo para aproximação numérica da derivada (padrão: 1e-8), usado
+        apenas se f não aceitar números duais.
+
+    Returns
+    -------
+    raizes : np.ndarray
+        Última aproximação de cada problema (a raiz, se convergiu).
+    iteracoes : np.ndarray
+        Número de passos de Newton dados por cada problema.
+    convergiu : np.ndarray
+        True para os problemas que convergiram.
+
+    Exemplos
+    --------
+    >>> f = lambda x, c: x**2 - c
+    >>> raizes, iteracoes, convergiu = newton_raphson_lote(f, 1.0, args=([2.0, 9.0],))
+    >>> print(np.round(raizes, 6), convergiu)
+    [1.414214 3.      ] [ True  True]
+    """
+    x0, *params = np.broadcast_arrays(np.asarray(x0, dtype=float), *(np.asarray(p) for p in args))
+    forma = x0.shape
+    x = x0.astype(float).ravel()
+    params = [p.ravel() for p in params]
+
+    iteracoes = np.zeros(x.size, dtype=int)
+    convergiu = np.zeros(x.size, dtype=bool)
+    ativos = np.arange(x.size)
+    # Sem df, tenta obter f e f' juntas por diferenciação automática
+    automatica = df is None
+
+    with np.errstate(all='ignore'):
+        for i in range(max_iter):
+            if ativos.size == 0:
+                break
+            xa = x[ativos]
+            pa = [p[ativos] for p in params]
+
+            valores = _derivadas_automaticas(f, xa, 1, pa) if automatica else None
+            if valores is not None:
+                fx, dfx = valores
+            else:
+                automatica = False
+                fx = f(xa, *pa)
+
+                # Calcula a derivada
+                if df is not None:
+                    dfx = df(xa, *pa)
+                else:
+                    # Aproximação numérica da derivada (diferenças finitas)
+                    dfx = (np.asarray(f(xa + h, *pa), dtype=float) - np.asarray(f(xa - h, *pa), dtype=float)) / (2 * h)
+            fx = np.broadcast_to(np.asarray(fx, dtype=float), xa.shape)
+            dfx = np.broadcast_to(np.asarray(dfx, dtype=float), xa.shape)
+
+            # Verifica convergência
+            pronto = np.abs(fx) < tol * 1e-2
+            convergiu[ativos[pronto]] = True
+
+            # Derivada muito pequena ou valores não finitos: o problema falha
+            falhou = ~pronto & ((np.abs(dfx) < 1e-12) | ~np.isfinite(fx) | ~np.isfinite(dfx))
+
+            # Atualização de Newton nos demais
+            passo = ~(pronto | falhou)
+            ativos, xa = ativos[passo], xa[passo]
+            x_new = xa - fx[passo] / dfx[passo]
+            x[ativos] = x_new
+            iteracoes[ativos] += 1
+
+            # Verifica convergência pela mudança em x
+            fim = np.abs(x_new - xa) < tol
+            convergiu[ativos[fim]] = True
+            ativos = ativos[~fim]
+
+    return x.reshape(forma), iteracoes.reshape(forma), convergiu.reshape(forma)
+
+
+def halley(f, x0, df=None, d2f=None, tol=1e-6, max_iter=100, h=1e-5, graf=True, retornar_historico=False):
+    """
+    Encontra uma raiz da função f usando o Método de Halley.
+
+    Variante do método de Newton-Raphson que usa também a segunda derivada:
+
+        x_novo = x - 2 f(x) f'(x) / (2 f'(x)² - f(x) f''(x))
+
+    A convergência perto de uma raiz simples é cúbica (contra quadrática no
+    de Newton), então costuma precisar de menos iterações. As derivadas que
+    não forem fornecidas são calculadas junto com f, numa única avaliação, por
+    diferenciação automática (ver `diferenciacao_automatica`); só se f não
+    aceitar números duais elas são aproximadas por diferenças centrais.
+
+    Parameters
+    ----------
+    f : callable
+        Função da qual se deseja encontrar a raiz.
+    x0 : float
+        Aproximação inicial da raiz.
+    df : callable, optional
+        Primeira derivada de f.
+    d2f : callable, optional
+        Segunda derivada de f.
+    tol : float, optional
+        Tolerância para o critério de parada (padrão: 1e-6).
+    max_iter : int, optional
+        Número máximo de iterações (padrão: 100).
+    h : float, optional
+        Passo para aproximação numérica das derivadas (padrão: 1e-5), usado
+        apenas se f não aceitar números duais.
+    graf : bool, optional
+        Se mostra o gráfico da função ou não.
+    retornar_historico : bool, optional
+        Se retorna o historico de pontos ou não.
+
+    Returns
+    -------
+    float
+        Aproximação da raiz da função.
+
+    Raises
+    ------
+    RuntimeError
+        Se o método não convergir ou se a derivada for zero.
+
+    Exemplos
+    --------
+    >>> f = lambda x: x**3 - 9*x + 5
+    >>> raiz = halley(f, 3.0, graf=False)
+    >>> print(f"{raiz:.6f}")
+    2.669664
+    """
+    x = x0
+    historico = [x0]
+    # Sem alguma das derivadas, tenta obter f e as que faltam juntas por
+    # diferenciação automática; as fornecidas são sempre usadas
+    automatica = df is None or d2f is None
+    ordem = 2 if d2f is None else 1
+
+    for i in range(max_iter):
+        valores = _derivadas_automaticas(f, x, ordem) if automatica else None
+        if valores is not None:
+            fx = valores[0]
+            dfx = df(x) if df is not None else valores[1]
+            d2fx = d2f(x) if d2f is not None else valores[2]
+        else:
+            automatica = False
+            fx = f(x)
+
+            # Calcula as derivadas (diferenças finitas para as que faltam)
+            dfx = df(x) if df is not None else (f(x + h) - f(x - h)) / (2 * h)
+            d2fx = d2f(x) if d2f is not None else (f(x + h) - 2 * fx + f(x - h)) / h**2
+
+        # Verifica se a derivada é muito pequena
+        if abs(dfx) < 1e-12:
+            raise RuntimeError(f"Derivada muito próxima de zero na iteração {i}. "
+                               f"x={x:.6f}, f'(x)={dfx:.2e}")
+
+        # Verifica convergência
+        if abs(fx) < tol * 1e-2:
+            if graf:
+                viz = VisualizadorRaizes(f)
+                viz.visualizar(historico, titulo="Método de Halley")
+            return (x, historico) if retornar_historico else x
+
+        # Atualização de Halley (recai na de Newton se o denominador se anular)
+        denominador = 2 * dfx**2 - fx * d2fx
+        if abs(denominador) < 1e-12:
+            x_new = x - fx / dfx
+        else:
+            x_new = x - 2 * fx * dfx / denominador
+        historico.append(x_new)
+
+        # Verifica convergência pela mudança em x
+        if abs(x_new - x) < tol:
+            if graf:
+                viz = VisualizadorRaizes(f)
+                viz.visualizar(historico, titulo="Método de Halley")
+            return (x_new, historico) if retornar_historico else x_new
+
+        x = x_new
+
+    raise RuntimeError(f"Método de Halley não convergiu após {max_iter} iterações.")
+
+
 def secante(f, a, b, tol=1e-6, max_iter=100, graf=True, retornar_historico=False):
     """
     Encontra uma raiz da função f(x) = 0 usando o Método da Secante.
@@ -334,7 +748,130 @@ def secante(f, a, b, tol=1e-6, max_iter=100, graf=True, retornar_historico=False
     raise RuntimeError(f"Método da secante não convergiu após {max_iter} iterações.")
 
 
-def raiz(f, a=None, b=None, x0=None, df=None, tol=1e-6, max_iter=100, max_raizes=10, subdivisoes=1000, method="bissecao", graf=True, retornar_historico=False):
+def brent(f, a, b, tol=1e-6, max_iter=100, graf=True, retornar_historico=False):
+    """
+    Encontra uma raiz da função f no intervalo [a, b] usando o Método de Brent.
+
+    O método de Brent (ou Brent-Dekker) combina interpolação quadrática
+    inversa, secante e bisseção. A cada iteração ele tenta o passo de
+    interpolação, que converge tão rápido quanto a secante, mas só o aceita
+    se o novo ponto ficar dentro do intervalo e o reduzir o suficiente; caso
+    contrário faz um passo de bisseção. Assim mantém a garantia da bisseção
+    (a raiz continua sempre cercada por uma mudança de sinal) e, em funções
+    suaves, costuma precisar de poucas avaliações de f, o que importa quando
+    cada avaliação é cara.
+
+    Parameters
+    ----------
+    f : callable
+        Função da qual se deseja encontrar a raiz.
+    a : float
+        Limite inferior do intervalo.
+    b : float
+        Limite superior do intervalo.
+    tol : float, optional
+        Tolerância para o critério de parada (padrão: 1e-6).
+    max_iter : int, optional
+        Número máximo de iterações (padrão: 100).
+    graf : bool, optional
+        Se mostra o gráfico da função ou não.
+    retornar_historico : bool, optional
+        Se retorna o historico de pontos avaliados ou não.
+
+    Returns
+    -------
+    float
+        Aproximação da raiz da função.
+
+    Raises
+    ------
+    ValueError
+        Se f(a) e f(b) não têm sinais opostos.
+    RuntimeError
+        Se o método não convergir dentro do número máximo de iterações.
+
+    Exemplos
+    --------
+    >>> f = lambda x: x**3 - 9*x + 5
+    >>> raiz = brent(f, 0, 2, graf=False)
+    >>> print(f"{raiz:.6f}")
+    0.576888
+    """
+    fa = f(a)
+    fb = f(b)
+
+    # Verifica se há mudança de sinal
+    if fa * fb > 0:
+        raise ValueError(f"A função deve ter sinais opostos em a={a} e b={b}. "
+                        f"f(a)={fa:.6f}, f(b)={fb:.6f}")
+
+    # Verifica se os extremos já são raízes
+    if abs(fa) < tol:
+        return (a, [a]) if retornar_historico else a
+    if abs(fb) < tol:
+        return (b, [b]) if retornar_historico else b
+
+    historico = [a, b]
+    eps = np.finfo(float).eps
+
+    # b é a melhor aproximação, c o ponto que cerca a raiz junto com b
+    # e a a aproximação anterior
+    c, fc = a, fa
+    d = e = b - a
+
+    for i in range(max_iter):
+        if fb * fc > 0:
+            c, fc = a, fa
+            d = e = b - a
+        if abs(fc) < abs(fb):
+            a, b, c = b, c, b
+            fa, fb, fc = fb, fc, fb
+
+        tol1 = 2.0 * eps * abs(b) + 0.5 * tol
+        xm = 0.5 * (c - b)
+
+        # Verifica convergência
+        if abs(xm) <= tol1 or abs(fb) < tol:
+            if graf:
+                viz = VisualizadorRaizes(f)
+                viz.visualizar(historico, a=min(b, c), b=max(b, c), titulo="Método de Brent")
+            return (b, historico) if retornar_historico else b
+
+        if abs(e) >= tol1 and abs(fa) > abs(fb):
+            # Tenta interpolação: secante se só há dois pontos distintos,
+            # quadrática inversa se há três
+            s = fb / fa
+            if a == c:
+                p = 2.0 * xm * s
+                q = 1.0 - s
+            else:
+                q = fa / fc
+                r = fb / fc
+                p = s * (2.0 * xm * q * (q - r) - (b - a) * (r - 1.0))
+                q = (q - 1.0) * (r - 1.0) * (s - 1.0)
+            if p > 0:
+                q = -q
+            p = abs(p)
+
+            # Aceita o passo só se ele cair dentro do intervalo e reduzir o
+            # passo o suficiente; senão, bisseção
+            if 2.0 * p < min(3.0 * xm * q - abs(tol1 * q), abs(e * q)):
+                e = d
+                d = p / q
+            else:
+                d = e = xm
+        else:
+            d = e = xm
+
+        a, fa = b, fb
+        b = b + d if abs(d) > tol1 else b + (tol1 if xm > 0 else -tol1)
+        fb = f(b)
+        historico.append(b)
+
+    raise RuntimeError(f"Método de Brent não convergiu após {max_iter} iterações.")
+
+
+def raiz(f, a=None, b=None, x0=None, df=None, tol=1e-6, max_iter=100, max_raizes=10, subdivisoes=1000, method="brent", graf=True, retornar_historico=False):
     """
     Interface unificada para encontrar raízes de funções.
     
@@ -346,13 +883,13 @@ def raiz(f, a=None, b=None, x0=None, df=None, tol=1e-6, max_iter=100, max_raizes
     f : callable
         Função da qual se deseja encontrar a raiz.
     a : float, optional
-        Limite inferior do intervalo (necessário para bisseção e secante).
+        Limite inferior do intervalo (necessário para Brent, bisseção e secante).
     b : float, optional
-        Limite superior do intervalo (necessário para bisseção e secante).
+        Limite superior do intervalo (necessário para Brent, bisseção e secante).
     x0 : float, optional
-        Aproximação inicial (necessário para Newton-Raphson).
+        Aproximação inicial (necessário para Newton-Raphson e Halley).
     df : callable, optional
-        Derivada da função (opcional para Newton-Raphson).
+        Derivada da função (opcional para Newton-Raphson e Halley).
     tol : float, optional
         Tolerância para o critério de parada (padrão: 1e-6).
     max_iter : int, optional
@@ -362,7 +899,9 @@ def raiz(f, a=None, b=None, x0=None, df=None, tol=1e-6, max_iter=100, max_raizes
     subdivisoes : int
         Número de divisões do intervalo para detectar mudanças de sinal. (necessário para mult-bisseção)
     method : str, optional
-        Método a ser usado: "secante", "bissecao" ou "newton" (padrão: "bissecao").
+        Método a ser usado: "brent", "secante", "bissecao", "multbissecao",
+        "newton" ou "halley" (padrão: "brent", que mantém a garantia da bisseção com
+        bem menos avaliações de f).
     graf : bool, optional
         Se mostra o gráfico da função ou não.
     retornar_historico : bool, optional
@@ -393,7 +932,12 @@ def raiz(f, a=None, b=None, x0=None, df=None, tol=1e-6, max_iter=100, max_raizes
 
     method = method.lower()
     
-    if method in ["bissecao", "bisseção", "bisseccao", "bissecção", "bissec", "bisec", "bi", "b"]:
+    if method in ["brent", "brent-dekker", "dekker", "br"]:
+        if a is None or b is None:
+            raise ValueError("O método de Brent requer os parâmetros 'a' e 'b'.")
+        return brent(f, a, b, tol, max_iter, graf=graf, retornar_historico=retornar_historico)
+
+    elif method in ["bissecao", "bisseção", "bisseccao", "bissecção", "bissec", "bisec", "bi", "b"]:
         if a is None or b is None:
             raise ValueError("O método da bisseção requer os parâmetros 'a' e 'b'.")
         return bissecao(f, a, b, tol, max_iter, graf=graf, retornar_historico=retornar_historico)
@@ -413,6 +957,16 @@ def raiz(f, a=None, b=None, x0=None, df=None, tol=1e-6, max_iter=100, max_raizes
                                "ou os parâmetros 'a' e 'b' para estimativa inicial.")
         return newton_raphson(f, x0, df, tol, max_iter, graf=graf, retornar_historico=retornar_historico)
 
+    elif method in ["halley", "hal", "h"]:
+        if x0 is None:
+            # Como em Newton, usa o ponto médio de [a,b] se disponível
+            if a is not None and b is not None:
+                x0 = (a + b) / 2.0
+            else:
+                raise ValueError("O método de Halley requer o parâmetro 'x0' "
+                               "ou os parâmetros 'a' e 'b' para estimativa inicial.")
+        return halley(f, x0, df, tol=tol, max_iter=max_iter, graf=graf, retornar_historico=retornar_historico)
+
     elif method in ["bisseção-multiraizes", "multbissecao", "mult-bissecao", "multbissec", "multbis", "multraizes", "mb"]:
         if a is None or b is None:
             raise ValueError("O método da bisseção de múltiplas raízes requer os parâmetros 'a' e 'b'.")
@@ -420,4 +974,4 @@ def raiz(f, a=None, b=None, x0=None, df=None, tol=1e-6, max_iter=100, max_raizes
     
     else:
         raise ValueError(f"Método '{method}' não reconhecido. "
-                        f"Use 'bissecao', 'multbissecao' 'secante' ou 'newton'.")
+                        f"Use 'brent', 'bissecao', 'multbissecao', 'secante', 'newton' ou 'halley'.")
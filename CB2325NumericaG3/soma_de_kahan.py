@@ -7,6 +7,8 @@ cancelamento. A soma de kahan busca minimizar esses erros de cancelamento ao
 "salvar" em comp_erro as partes "pequenas" que seriam normalmente descartadas 
 '''
 
+import numpy as np
+
 def soma_normal_lista(x):
     """
     Faz a soma  da maneira usual dos números da lista.
@@ -30,3 +32,48 @@ def soma_de_kahan_lista(x):
     return soma_acumulada
 
 
+def soma_de_kahan_array(x, linhas=256):
+    """
+    Faz a soma com compensação de erro de um array grande, sem laço por elemento.
+
+    O array é dividido em 'linhas' blocos de mesmo tamanho, que são somados
+    elemento a elemento com compensação (variante de Neumaier, que também
+    trata parcelas maiores que a soma acumulada). Isso deixa uma soma e uma
+    compensação por coluna, que são somadas da mesma forma até restarem
+    poucos números, finalizados por soma_de_kahan_lista.
+    """
+    x = np.asarray(x, dtype=float).ravel()
+    if x.size <= linhas:
+        return soma_de_kahan_lista(x.tolist())
+
+    largura = x.size // linhas
+    blocos = x[:linhas*largura].reshape(linhas, largura)
+    soma_acumulada = blocos[0].copy()
+    comp_erro = np.zeros(largura)
+    for bloco in blocos[1:]:
+        t = soma_acumulada + bloco
+        comp_erro += np.where(np.abs(soma_acumulada) >= np.abs(bloco),
+                              (soma_acumulada - t) + bloco, (bloco - t) + soma_acumulada)
+        soma_acumulada = t
+    return soma_de_kahan_array(np.concatenate((soma_acumulada, comp_erro, x[linhas*largura:])), linhas)
+
+
+def soma_de_kahan_acumulada(x):
+    """
+    Somas parciais s_k = x_0 + ... + x_k com compensação de erro, sem laço por elemento.
+
+    Primeiro calcula as somas parciais usuais com np.cumsum. O erro de
+    arredondamento de cada adição s_k = s_(k-1) + x_k é recuperado
+    exatamente (algoritmo TwoSum), e as somas parciais desses erros são
+    somadas de volta ao resultado.
+    """
+    x = np.asarray(x, dtype=float).ravel()
+    s = np.cumsum(x)
+    if x.size < 2:
+        return s
+    anterior, parcela, t = s[:-1], x[1:], s[1:]
+    parcela_virtual = t - anterior
+    anterior_virtual = t - parcela_virtual
+    erros = (anterior - anterior_virtual) + (parcela - parcela_virtual)
+    s[1:] += np.cumsum(erros)
+    return s
@@ -0,0 +1,68 @@
+# tests/test_diferenciacao_automatica.py
+import sys, os, math, pytest
+import numpy as np
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from CB2325NumericaG3.diferenciacao_automatica import Dual, derivadas
+
+
+class TestDual:
+    def test_aritmetica(self):
+        x = Dual(2.0, 1.0)
+        y = (3 * x**2 - x / 4 + 1) / (x - 5) + 2**x
+        f = lambda t: (3 * t**2 - t / 4 + 1) / (t - 5) + 2**t
+        h = 1e-6
+        assert math.isclose(y.valor, f(2.0))
+        assert math.isclose(y.derivada, (f(2.0 + h) - f(2.0 - h)) / (2 * h), rel_tol=1e-8)
+
+    def test_ufuncs(self):
+        casos = [(np.sin, np.cos), (np.exp, np.exp), (np.log, lambda u: 1 / u),
+                 (np.sqrt, lambda u: 0.5 / np.sqrt(u)), (np.arctan, lambda u: 1 / (1 + u**2)),
+                 (np.tanh, lambda u: 1 - np.tanh(u)**2), (np.abs, np.sign)]
+        for ufunc, derivada in casos:
+            y = ufunc(Dual(0.3, 1.0))
+            assert math.isclose(y.valor, ufunc(0.3))
+            assert math.isclose(y.derivada, derivada(0.3))
+
+    def test_binarias_com_numpy(self):
+        x = Dual(0.5, 1.0)
+        y = np.float64(2.0) * x + np.arctan2(x, 1.0) + np.hypot(x, 1.0)
+        assert math.isclose(y.derivada, 2 + 1 / 1.25 + 0.5 / math.sqrt(1.25))
+
+    def test_comparacoes(self):
+        f = lambda x: x**2 if x > 0 else -x
+        assert derivadas(f, 3.0) == (9.0, 6.0)
+        assert derivadas(f, -3.0) == (3.0, -1.0)
+
+    def test_funcao_de_math(self):
+        with pytest.raises(TypeError):
+            math.sin(Dual(1.0, 1.0))
+
+
+class TestDerivadas:
+    def test_polinomio(self):
+        assert derivadas(lambda x: x**3 - 2*x, 2.0, ordem=3) == (4.0, 10.0, 12.0, 6.0)
+
+    def test_ordem_zero_e_constante(self):
+        assert derivadas(lambda x: np.exp(x), 0.0, ordem=0) == (1.0,)
+        assert derivadas(lambda x: 5, 1.0, ordem=2) == (5.0, 0.0, 0.0)
+
+    def test_exata(self):
+        # Segunda derivada de exp(sin x): (cos² x - sin x) exp(sin x)
+        x = 0.7
+        _, d1, d2 = derivadas(lambda t: np.exp(np.sin(t)), x, ordem=2)
+        assert math.isclose(d1, math.cos(x) * math.exp(math.sin(x)), rel_tol=1e-15)
+        assert math.isclose(d2, (math.cos(x)**2 - math.sin(x)) * math.exp(math.sin(x)), rel_tol=1e-14)
+
+    def test_arrays(self):
+        x = np.linspace(0.1, 3, 50)
+        valor, derivada = derivadas(lambda t: np.log(t) * t, x)
+        assert np.allclose(valor, np.log(x) * x)
+        assert np.allclose(derivada, np.log(x) + 1)
+
+    def test_erros(self):
+        with pytest.raises(TypeError):
+            derivadas(lambda x: math.exp(x), 1.0)
+        with pytest.raises(TypeError):
+            derivadas(lambda x: x, 1.0, ordem=-1)
+        with pytest.raises(TypeError):
+            derivadas(lambda x: x, 1.0, ordem=1.5)
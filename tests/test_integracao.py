@@ -1,6 +1,12 @@
-import sys, os, math, pytest
+import sys, os, math, asyncio, pytest
+import numpy as np
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-from CB2325NumericaG3.integracao import integral
+from CB2325NumericaG3.integracao import integral, integral_romberg, integral_lote, CacheAvaliacoes, integral_amostras, integral_cumulativa, integral_async, integral_monte_carlo, integral_nd, integral_tanh_sinh, integral_clenshaw_curtis, integral_oscilatoria, integral_interpolante
+import CB2325NumericaG3.integracao as integracao
+from concurrent.futures import ThreadPoolExecutor
 
 class TestIntegral:
     """Testes para o módulo de integração numérica."""
@@ -71,7 +77,8 @@ class TestIntegral:
 
         assert math.isclose(area1, 62.917, abs_tol=0.01)
         assert math.isclose(area2, 62.917, abs_tol=0.001)
-        assert abs(area2 - 62.917) < abs(area1 - 62.917)  # convergência
+        # Simpson é exato para cúbicas: as duas aproximações podem coincidir até o último bit.
+        assert abs(area2 - 62.917) <= abs(area1 - 62.917)  # convergência
 
     @pytest.mark.parametrize(
         "funcao, a, b, n, metodo, condicao",
@@ -152,4 +159,911 @@ class TestIntegral:
     )
     def test_metodo(self, funcao, a, b, n, metodo):
         with pytest.raises(NameError):
-            integral(funcao, a, b, n, plotar=False, metodo=metodo)
\ No newline at end of file
+            integral(funcao, a, b, n, plotar=False, metodo=metodo)
+
+    @pytest.mark.parametrize("metodo", ["trapezio", "ponto_medio", "simpson"])
+    def test_vetorizado_igual_escalar(self, metodo):
+        vetorial = integral(lambda x: np.sin(x) * x**2, 0, 3, 1000, plotar=False, metodo=metodo)
+        escalar = integral(lambda x: math.sin(x) * x**2, 0, 3, 1000, plotar=False, metodo=metodo)
+        assert math.isclose(vetorial, escalar, rel_tol=1e-12)
+
+    def test_vetorizado_uma_chamada(self):
+        chamadas = []
+        def f(x):
+            chamadas.append(x)
+            return x**2
+        area = integral(f, 0, 1, 1000, plotar=False, metodo="simpson", vetorizado=True)
+        assert math.isclose(area, 1/3, rel_tol=1e-12)
+        # uma única chamada recebe todos os 2n+1 nós de uma vez
+        assert len(chamadas) == 1
+        assert isinstance(chamadas[0], np.ndarray) and chamadas[0].size == 2001
+
+    def test_vetorizado_exigido(self):
+        with pytest.raises(TypeError):
+            integral(lambda x: math.sin(x), 0, 1, 10, plotar=False, vetorizado=True)
+
+    @pytest.mark.parametrize(
+        "metodo, n, esperado",
+        [
+            ("trapezio", 100, 101),
+            ("ponto_medio", 100, 100),
+            ("simpson", 100, 201),
+        ],
+    )
+    def test_avaliacoes_unicas(self, metodo, n, esperado):
+        pontos = []
+        def f(x):
+            pontos.append(x)
+            return math.exp(x)
+        area = integral(f, 0, 1, n, plotar=False, metodo=metodo, vetorizado=False)
+        assert area.n_avaliacoes == esperado
+        assert len(pontos) == esperado
+        assert len(set(pontos)) == esperado
+        assert math.isclose(area, math.e - 1, rel_tol=1e-4)
+
+    def test_plot_sem_avaliacoes_extras(self, monkeypatch):
+        monkeypatch.setattr(plt, "show", lambda: None)
+        pontos = []
+        def f(x):
+            pontos.append(x)
+            return x**2
+        area = integral(f, 0, 1e5, 10, plotar=True, metodo="trapezio", vetorizado=False)
+        assert len(pontos) == area.n_avaliacoes == 11
+
+    def test_plot_sob_demanda(self, monkeypatch):
+        monkeypatch.setattr(plt, "show", lambda: None)
+        plt.close("all")
+        area = integral(lambda x: np.cos(x), 0, 1, 20, plotar=False, metodo="simpson")
+        assert len(plt.gcf().axes) == 0
+        area.plotar()
+        ax = plt.gca()
+        assert len(ax.lines) == 1
+        assert np.array_equal(ax.lines[0].get_xdata(), area.nos)
+
+    @pytest.mark.parametrize("metodo", ["trapezio", "ponto_medio", "simpson", "gauss"])
+    def test_plot_uma_colecao_de_areas(self, monkeypatch, metodo):
+        monkeypatch.setattr(plt, "show", lambda: None)
+        for n, areas in ((20, 20), (10**5, integracao._MAX_AREAS)):
+            plt.close("all")
+            integral(lambda x: np.cos(x), 0, 1, n, metodo=metodo)
+            ax = plt.gca()
+            assert len(ax.collections) == 1 and len(ax.patches) == 0
+            caminhos = ax.collections[0].get_paths()
+            if metodo != "gauss" or n > 20:
+                assert len(caminhos) == areas
+            assert sum(len(c.vertices) for c in caminhos) <= integracao._MAX_AREAS * (integracao._MAX_VERTICES_AREA + 4)
+        plt.close("all")
+
+    def test_adaptativo_pico(self):
+        f = lambda x: 1 / (1e-4 + (x - 0.3)**2)
+        exato = 100 * (math.atan(70) + math.atan(30))
+        area = integral(f, 0, 1, 4, plotar=False, metodo="adaptativo", tol=1e-6)
+        assert math.isclose(area, exato, abs_tol=1e-6)
+        assert area.erro_estimado <= 1e-6
+        # o trapézio uniforme precisa de ~10^4 avaliações para um erro de 1e-7
+        assert area.n_avaliacoes < 2000
+
+    def test_adaptativo_escalar_e_vetorizado(self):
+        vetorial = integral(lambda x: np.sqrt(x), 0, 1, 1, plotar=False, metodo="adaptativo", tol=1e-10)
+        escalar = integral(lambda x: math.sqrt(x), 0, 1, 1, plotar=False, metodo="adaptativo", tol=1e-10)
+        assert math.isclose(vetorial, 2/3, abs_tol=1e-10)
+        assert vetorial == escalar
+        assert vetorial.n_avaliacoes == escalar.n_avaliacoes == vetorial.nos.size
+
+    def test_escalar_uma_tentativa_com_array(self):
+        # f só escalar: a tentativa com o array é feita uma única vez por
+        # chamada, não a cada nível (adaptativo, Romberg, Clenshaw-Curtis)
+        for calcular in (lambda f: integral(f, 0, 1, 4, plotar=False, metodo="adaptativo", tol=1e-8),
+                         lambda f: integral_romberg(f, 0, 1, plotar=False),
+                         lambda f: integral_clenshaw_curtis(f, 0, 1, plotar=False),
+                         lambda f: integral_tanh_sinh(f, 0, 1, plotar=False)):
+            chamadas = []
+            def f(x):
+                chamadas.append(x)
+                return math.sqrt(x + 1)
+            area = calcular(f)
+            assert isinstance(chamadas[0], np.ndarray)
+            assert not any(isinstance(x, np.ndarray) for x in chamadas[1:])
+            assert len(chamadas) == area.n_avaliacoes + 1
+
+    def test_adaptativo_tol_inalcancavel(self):
+        with pytest.raises(RuntimeError):
+            integral(lambda x: np.where(x < 1/3, 0.0, 1.0), 0, 1, 1, plotar=False, metodo="adaptativo", tol=1e-300)
+
+    @pytest.mark.parametrize("tol", [0, -1e-6, "tol"])
+    def test_adaptativo_tol_invalida(self, tol):
+        with pytest.raises(ValueError):
+            integral(lambda x: x, 0, 1, 1, plotar=False, metodo="adaptativo", tol=tol)
+
+
+class TestGauss:
+    """Testes para a regra composta de Gauss-Legendre."""
+
+    @pytest.mark.parametrize("ordem", [1, 2, 5, 20])
+    def test_exata_para_polinomios(self, ordem):
+        grau = 2*ordem - 1
+        area = integral(lambda x: (grau + 1) * x**grau, 0, 1, 1, plotar=False, metodo="gauss", ordem=ordem)
+        assert math.isclose(area, 1.0, rel_tol=1e-12)
+        assert area.n_avaliacoes == ordem
+
+    def test_nos_e_pesos(self):
+        t, w = integracao._nos_gauss_legendre(20)
+        t_ref, w_ref = np.polynomial.legendre.leggauss(20)
+        assert np.allclose(t, t_ref, atol=1e-14)
+        assert np.allclose(w, w_ref, atol=1e-14)
+
+    def test_cache(self):
+        integracao._CACHE_GAUSS.pop(7, None)
+        integral(lambda x: np.exp(x), 0, 1, 3, plotar=False, metodo="gauss", ordem=7)
+        nos_pesos = integracao._CACHE_GAUSS[7]
+        integral(lambda x: np.exp(x), 0, 1, 3, plotar=False, metodo="gauss", ordem=7)
+        assert integracao._CACHE_GAUSS[7] is nos_pesos
+        assert not nos_pesos[0].flags.writeable
+
+    def test_composta(self):
+        exato = math.sqrt(math.pi) / 2 * math.erf(2)
+        area = integral(lambda x: math.exp(-x**2), 0, 2, 4, plotar=False, metodo="gauss", ordem=20)
+        assert math.isclose(area, exato, abs_tol=1e-14)
+        assert area.n_avaliacoes == 80
+
+    @pytest.mark.parametrize("ordem", [0, -3, 2.5, "ordem"])
+    def test_ordem_invalida(self, ordem):
+        with pytest.raises(TypeError):
+            integral(lambda x: x, 0, 1, 10, plotar=False, metodo="gauss", ordem=ordem)
+
+
+class TestRomberg:
+    """Testes para o método de Romberg."""
+
+    def test_precisao_poucas_avaliacoes(self):
+        exato = math.sqrt(math.pi) / 2 * math.erf(2)
+        area = integral_romberg(lambda x: np.exp(-x**2), 0, 2, tol=1e-12, plotar=False)
+        assert math.isclose(area, exato, abs_tol=1e-12)
+        assert area.n_avaliacoes < 500
+
+    def test_reaproveita_avaliacoes(self):
+        pontos = []
+        def f(x):
+            pontos.append(x)
+            return math.cos(x)
+        area = integral_romberg(f, 0, 1, plotar=False, vetorizado=False)
+        niveis = len(area.tabela) - 1
+        assert len(pontos) == len(set(pontos)) == area.n_avaliacoes == 2**niveis + 1
+        assert math.isclose(area, math.sin(1), abs_tol=1e-12)
+
+    def test_tabela(self):
+        area = integral_romberg(lambda x: x**2, 0, 3, plotar=False)
+        assert [len(linha) for linha in area.tabela] == list(range(1, len(area.tabela) + 1))
+        assert area.tabela[0][0] == pytest.approx(13.5)
+        assert area.tabela[-1][-1] == area
+        assert area.erro_estimado <= 1e-12
+
+    def test_zeros_nos_primeiros_niveis(self):
+        area = integral_romberg(lambda x: math.sin(2*math.pi*x)**2, 0, 1, plotar=False)
+        assert math.isclose(area, 0.5, abs_tol=1e-10)
+
+    def test_nao_converge(self):
+        with pytest.raises(RuntimeError):
+            integral_romberg(lambda x: np.sqrt(x), 0, 1, tol=1e-15, max_niveis=5, plotar=False)
+
+    @pytest.mark.parametrize("funcao, max_niveis", [(lambda x: 2*x, 1), (lambda x: 3*x**2, 2), (lambda x: 3*x**2, 3)])
+    def test_poucos_niveis(self, funcao, max_niveis):
+        # duas diagonais seguidas já são exatas: converge no último nível permitido
+        area = integral_romberg(funcao, 0, 1, max_niveis=max_niveis, plotar=False)
+        assert math.isclose(area, 1.0, abs_tol=1e-14)
+        assert len(area.tabela) == max_niveis + 1
+        with pytest.raises(RuntimeError):
+            integral_romberg(lambda x: np.exp(x), 0, 1, max_niveis=max_niveis, plotar=False)
+
+    def test_entradas_invalidas(self):
+        with pytest.raises(TypeError):
+            integral_romberg(lambda x: x, "a", 1, plotar=False)
+        with pytest.raises(OverflowError):
+            integral_romberg(lambda x: x, 0, math.inf, plotar=False)
+        with pytest.raises(ValueError):
+            integral_romberg(lambda x: x, 0, 1, tol=-1, plotar=False)
+
+
+class TestLote:
+    """Testes para a integração em lote."""
+
+    def test_varios_intervalos(self):
+        a = np.array([0.0, 1.0, -2.0])
+        b = np.array([1.0, 3.0, 2.0])
+        resultados, status = integral_lote(lambda x: x**2, a, b, 10, metodo="simpson")
+        assert np.allclose(resultados, (b**3 - a**3) / 3, rtol=1e-12)
+        assert status.tolist() == [0, 0, 0]
+
+    @pytest.mark.parametrize("metodo", ["trapezio", "ponto_medio", "simpson", "gauss"])
+    def test_igual_a_integral(self, metodo):
+        resultados, _ = integral_lote(lambda x: np.exp(-x**2), [0, 1], [1, 4], 50, metodo=metodo)
+        for r, (a, b) in zip(resultados, [(0, 1), (1, 4)]):
+            area = integral(lambda x: np.exp(-x**2), a, b, 50, plotar=False, metodo=metodo)
+            assert math.isclose(r, area, rel_tol=1e-12)
+
+    def test_parametros(self):
+        chamadas = []
+        def f(x, p):
+            chamadas.append(x.shape)
+            return p[0] * np.sin(p[1] * x)
+        parametros = [[1.0, 1.0], [2.0, 3.0], [0.5, 2.0]]
+        resultados, status = integral_lote(f, 0, np.pi, 20, metodo="gauss", parametros=parametros)
+        assert np.allclose(resultados, [2.0, 4/3, 0.0], atol=1e-12)
+        assert chamadas == [(3, 100)]
+        assert (status == 0).all()
+
+    def test_parametros_escalar(self):
+        resultados, status = integral_lote(lambda x, p: p[0] * math.sin(p[1] * x), 0, np.pi, 20,
+                                           metodo="gauss", parametros=[[1.0, 1.0], [2.0, 3.0]])
+        assert np.allclose(resultados, [2.0, 4/3], atol=1e-12)
+
+    def test_status_por_item(self):
+        a = [0.0, math.nan, 1.0, -1.0, 2.0]
+        b = [1.0, 1.0, math.inf, 1.0, 2.0]
+        resultados, status = integral_lote(lambda x: 1 / x, a[:1] + [1.0] + a[2:], b, 10, metodo="simpson")
+        assert status.tolist() == [2, 0, 1, 2, 0]
+        assert math.isnan(resultados[0]) and resultados[4] == 0.0
+        resultados, status = integral_lote(lambda x: x, a, b, 10)
+        assert status.tolist() == [0, 1, 1, 0, 0]
+        assert np.allclose(resultados[[0, 3, 4]], [0.5, 0.0, 0.0])
+
+    def test_falha_de_avaliacao_escalar(self):
+        f = lambda x: math.log(x)
+        resultados, status = integral_lote(f, [-1.0, 1.0], [1.0, 2.0], 10, vetorizado=False)
+        assert status.tolist() == [3, 0]
+        assert math.isclose(resultados[1], 2*math.log(2) - 1, rel_tol=1e-2)
+
+    def test_entradas_invalidas(self):
+        with pytest.raises(TypeError):
+            integral_lote(lambda x: x, 0, 1, 0)
+        with pytest.raises(NameError):
+            integral_lote(lambda x: x, 0, 1, 10, metodo="adaptativo")
+        with pytest.raises(ValueError):
+            integral_lote(lambda x: x, [0, 1], [1, 2, 3], 10)
+
+
+class TestCompensada:
+    """Testes para a acumulação compensada em 'integral'."""
+
+    @pytest.mark.parametrize("metodo", ["trapezio", "ponto_medio", "simpson", "gauss"])
+    def test_soma_correta_dos_termos(self, metodo):
+        area = integral(lambda x: 1e8 * (x == x) + np.sin(x), 0, 1, 200000, plotar=False,
+                        metodo=metodo, compensada=True)
+        termos = {
+            "trapezio": lambda v: (v[:-1] + v[1:]) * (area.delta_x / 2.0),
+            "ponto_medio": lambda v: area.delta_x * v,
+            "simpson": lambda v: (v[:-1:2] + 4.0*v[1::2] + v[2::2]) * (area.delta_x / 6.0),
+            "gauss": lambda v: v.reshape(-1, 5) @ integracao._nos_gauss_legendre(5)[1] * (area.delta_x / 2.0),
+        }[metodo](area.valores)
+        exata = math.fsum(termos)
+        assert abs(area - exata) <= math.ulp(exata)
+
+    def test_adaptativo(self):
+        area = integral(lambda x: np.sqrt(x), 0, 1, 1, plotar=False, metodo="adaptativo", tol=1e-10, compensada=True)
+        assert math.isclose(area, 2/3, abs_tol=1e-10)
+
+
+class TestParalelo:
+    """Testes para a avaliação paralela em 'integral'."""
+
+    @pytest.mark.parametrize("metodo", ["trapezio", "simpson", "gauss", "adaptativo"])
+    def test_independente_do_numero_de_workers(self, metodo):
+        resultados = [integral(lambda x: math.exp(-x) * math.sin(5*x), 0, 3, 500, plotar=False,
+                               metodo=metodo, workers=w, executor="threads") for w in (2, 3, 8)]
+        sequencial = integral(lambda x: math.exp(-x) * math.sin(5*x), 0, 3, 500, plotar=False, metodo=metodo)
+        assert resultados[0] == resultados[1] == resultados[2] == sequencial
+
+    def test_processos(self):
+        area = integral(math.sin, 0, math.pi, 1000, plotar=False, metodo="simpson", workers=2)
+        assert math.isclose(area, 2.0, rel_tol=1e-10)
+        assert area.n_avaliacoes == 2001
+
+    def test_executor_existente(self):
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            area = integral(lambda x: x**2, 0, 1, 1000, plotar=False, executor=pool)
+            # o pool fornecido não é encerrado por 'integral'
+            assert pool.submit(lambda: 1).result() == 1
+        assert math.isclose(area, 1/3, rel_tol=1e-6)
+
+    def test_erros_propagados(self):
+        with pytest.raises(OverflowError):
+            integral(lambda x: math.inf, 0, 1, 100, plotar=False, workers=2, executor="threads")
+
+    def test_argumentos_invalidos(self):
+        with pytest.raises(TypeError):
+            integral(lambda x: x, 0, 1, 100, plotar=False, workers=0)
+        with pytest.raises(NameError):
+            integral(lambda x: x, 0, 1, 100, plotar=False, workers=2, executor="gpu")
+
+
+class TestCache:
+    """Testes para o cache de avaliações."""
+
+    def test_refinamentos_sucessivos(self):
+        pontos = []
+        def f(x):
+            pontos.append(x)
+            return math.exp(-x**2)
+        g = CacheAvaliacoes(f, vetorizado=False)
+        areas = [integral(g, 0, 1, n, plotar=False, metodo="simpson") for n in (50, 100, 200, 400)]
+        assert g.falhas == len(pontos) == 801
+        assert g.acertos == 101 + 201 + 401
+        assert areas[-1] == integral(f, 0, 1, 400, plotar=False, metodo="simpson")
+
+    def test_vetorizado_uma_chamada_por_refinamento(self):
+        chamadas = []
+        def f(x):
+            chamadas.append(np.size(x))
+            return np.cos(x)
+        g = CacheAvaliacoes(f)
+        integral(g, 0, 1, 100, plotar=False)
+        integral(g, 0, 1, 200, plotar=False)
+        assert chamadas == [101, 100]
+        assert math.isclose(g.taxa_acertos, 101 / 302)
+
+    def test_lru(self):
+        g = CacheAvaliacoes(lambda x: 2 * x, max_itens=3)
+        for x in (1.0, 2.0, 3.0, 1.0, 4.0):
+            g(x)
+        assert len(g) == 3
+        assert (g.acertos, g.falhas) == (1, 4)
+        g(1.0)
+        g(2.0)
+        assert (g.acertos, g.falhas) == (2, 5)
+
+    def test_escalar_e_array(self):
+        g = CacheAvaliacoes(lambda x: x**2)
+        assert g(3.0) == 9.0 and isinstance(g(3.0), float)
+        assert np.array_equal(g(np.array([[1.0, 3.0], [3.0, 2.0]])), [[1.0, 9.0], [9.0, 4.0]])
+        assert (g.acertos, g.falhas) == (3, 3)
+        g.limpar()
+        assert len(g) == 0 and g.acertos == g.falhas == 0
+
+    def test_argumentos_invalidos(self):
+        with pytest.raises(TypeError):
+            CacheAvaliacoes("f")
+        with pytest.raises(TypeError):
+            CacheAvaliacoes(lambda x: x, max_itens=0)
+
+
+class TestAmostras:
+
+    def test_coincide_com_integral(self):
+        x = np.linspace(0, np.pi, 1001)
+        for metodo in ("trapezio", "simpson"):
+            esperado = integral(np.sin, 0, np.pi, 1000 if metodo == "trapezio" else 500, plotar=False, metodo=metodo)
+            assert math.isclose(integral_amostras(np.sin(x), dx=x[1] - x[0], metodo=metodo), esperado, rel_tol=1e-12)
+
+    def test_blocos_nao_alteram_resultado(self):
+        x = np.linspace(0, 2, 1000)
+        y = np.exp(x)
+        for metodo in ("trapezio", "simpson"):
+            inteiro = integral_amostras(y, dx=x[1] - x[0], metodo=metodo)
+            for bloco in (1, 2, 3, 7, 999):
+                assert math.isclose(integral_amostras(y, dx=x[1] - x[0], metodo=metodo, tamanho_bloco=bloco),
+                                    inteiro, rel_tol=1e-13)
+
+    def test_irregular_e_numero_impar_de_intervalos(self):
+        x = np.sort(np.random.default_rng(1).uniform(0, 3, 2000))
+        x[0], x[-1] = 0.0, 3.0
+        # Simpson irregular é exato para quadráticas, inclusive no último subintervalo isolado
+        assert math.isclose(integral_amostras(x**2, x=x, metodo="simpson", tamanho_bloco=5), 9.0, rel_tol=1e-12)
+        assert math.isclose(integral_amostras(x[:-1]**2, x=x[:-1], metodo="simpson"), x[-2]**3 / 3, rel_tol=1e-12)
+        assert math.isclose(integral_amostras(x, x=x), 4.5, rel_tol=1e-12)
+
+    def test_iterador_de_blocos(self):
+        x = np.linspace(0, 1, 501)
+        blocos = (np.cos(x[i:i+64]) for i in range(0, x.size, 64))
+        assert math.isclose(integral_amostras(blocos, dx=x[1] - x[0], metodo="simpson"), math.sin(1), rel_tol=1e-10)
+        pares = ((x[i:i+64], np.cos(x[i:i+64])) for i in range(0, x.size, 64))
+        assert math.isclose(integral_amostras(pares), integral_amostras(np.cos(x), x=x), rel_tol=1e-13)
+
+    def test_lista_de_blocos(self):
+        # blocos de tamanhos diferentes numa lista (e não num gerador)
+        x = np.linspace(0, 1, 501)
+        blocos = [np.cos(x[i:i+64]) for i in range(0, x.size, 64)]
+        assert math.isclose(integral_amostras(blocos, dx=x[1] - x[0], metodo="simpson"), math.sin(1), rel_tol=1e-10)
+        pares = [(x[i:i+64], np.cos(x[i:i+64])) for i in range(0, x.size, 64)]
+        assert math.isclose(integral_amostras(pares), integral_amostras(np.cos(x), x=x), rel_tol=1e-13)
+        assert integral_amostras([[1.0, 3.0], [5.0]]) == integral_amostras([1.0, 3.0, 5.0])
+
+    def test_memmap_e_arquivo_npy(self, tmp_path):
+        x = np.linspace(0, 1, 10001)
+        caminho = tmp_path / "amostras.npy"
+        np.save(caminho, x**3)
+        assert math.isclose(integral_amostras(str(caminho), dx=1e-4, metodo="simpson", tamanho_bloco=1000), 0.25, rel_tol=1e-12)
+        bruto = np.memmap(tmp_path / "amostras.bin", dtype=np.float32, mode="w+", shape=x.shape)
+        bruto[:] = x**3
+        bruto.flush()
+        lido = np.memmap(tmp_path / "amostras.bin", dtype=np.float32, mode="r")
+        assert math.isclose(integral_amostras(lido, dx=1e-4, metodo="simpson", tamanho_bloco=1000), 0.25, rel_tol=1e-6)
+
+    def test_poucas_amostras(self):
+        assert integral_amostras([]) == 0.0
+        assert integral_amostras([5.0]) == 0.0
+        assert integral_amostras([1.0, 3.0], metodo="simpson") == 2.0
+
+    def test_entradas_invalidas(self):
+        with pytest.raises(NameError):
+            integral_amostras([1, 2], metodo="gauss")
+        with pytest.raises(TypeError):
+            integral_amostras([1, float("nan")])
+        with pytest.raises(OverflowError):
+            integral_amostras([1, float("inf")])
+        with pytest.raises(ValueError):
+            integral_amostras([1, 2], dx=0)
+        with pytest.raises(ValueError):
+            integral_amostras([1, 2, 3], x=[0, 1])
+        with pytest.raises(TypeError):
+            integral_amostras([1, 2], tamanho_bloco=0)
+
+
+class TestCumulativa:
+
+    @pytest.mark.parametrize("metodo", ["trapezio", "simpson", "ponto_medio", "gauss"])
+    def test_coincide_com_integral_em_cada_ponto(self, metodo):
+        x, F = integral_cumulativa(np.cos, 0, np.pi, 40, metodo=metodo)
+        assert x.shape == F.shape == (41,) and F[0] == 0.0
+        for k in (1, 17, 40):
+            assert math.isclose(F[k], integral(np.cos, 0, x[k], k, plotar=False, metodo=metodo), abs_tol=1e-14)
+
+    def test_uma_avaliacao_por_no(self):
+        chamadas = []
+        def f(x):
+            chamadas.append(np.size(x))
+            return np.exp(x)
+        x, F = integral_cumulativa(f, 0, 1, 1000, metodo="simpson")
+        assert chamadas == [2001]
+        assert np.allclose(F, np.exp(x) - 1, atol=1e-12)
+
+    def test_tabela_para_linear_interp(self):
+        from CB2325NumericaG3.interpolacao import linear_interp
+        seno = linear_interp(*integral_cumulativa(np.cos, 0, np.pi, 2000, metodo="simpson"), plot=False)
+        assert math.isclose(seno(1.0), math.sin(1.0), abs_tol=1e-6)
+
+    def test_compensada(self):
+        x, F = integral_cumulativa(lambda x: np.ones_like(x), 0, 1, 10**6, metodo="ponto_medio")
+        for k in (10**5, 10**6):
+            assert F[k] == math.fsum([1e-6] * k)
+        _, F_usual = integral_cumulativa(lambda x: np.ones_like(x), 0, 1, 10**6, metodo="ponto_medio", compensada=False)
+        assert F_usual[-1] != F[-1]
+
+    def test_entradas_invalidas(self):
+        with pytest.raises(NameError):
+            integral_cumulativa(np.cos, 0, 1, 10, metodo="adaptativo")
+        with pytest.raises(TypeError):
+            integral_cumulativa(np.cos, 0, 1, 0)
+        with pytest.raises(OverflowError):
+            integral_cumulativa(np.cos, 0, math.inf, 10)
+
+
+class TestAsync:
+
+    @pytest.mark.parametrize("metodo", ["trapezio", "simpson", "ponto_medio", "gauss"])
+    def test_mesmo_resultado_que_integral(self, metodo):
+        async def f(x):
+            await asyncio.sleep(0)
+            return math.exp(-x * x)
+        area = asyncio.run(integral_async(f, 0, 2, 30, metodo=metodo, plotar=False))
+        esperado = integral(lambda x: math.exp(-x * x), 0, 2, 30, plotar=False, metodo=metodo)
+        assert area == esperado
+        assert area.n_avaliacoes == esperado.n_avaliacoes
+
+    def test_limite_de_concorrencia(self):
+        em_andamento = [0, 0]
+        async def f(x):
+            em_andamento[0] += 1
+            em_andamento[1] = max(em_andamento[1], em_andamento[0])
+            await asyncio.sleep(0.001)
+            em_andamento[0] -= 1
+            return x
+        area = asyncio.run(integral_async(f, 0, 1, 100, concorrencia=8, plotar=False))
+        assert math.isclose(area, 0.5)
+        assert em_andamento[1] == 8
+
+    def test_avaliacoes_simultaneas(self):
+        # com concorrência suficiente, as 100 avaliações ficam em andamento
+        # ao mesmo tempo (em vez de uma após a outra)
+        em_andamento = [0, 0]
+        async def f(x):
+            em_andamento[0] += 1
+            em_andamento[1] = max(em_andamento[1], em_andamento[0])
+            await asyncio.sleep(0.001)
+            em_andamento[0] -= 1
+            return x
+        asyncio.run(integral_async(f, 0, 1, 99, concorrencia=100))
+        assert em_andamento[1] == 100
+
+    def test_funcao_sincrona_e_erros(self):
+        assert math.isclose(asyncio.run(integral_async(lambda x: 2 * x, 0, 1, 10, plotar=False)), 1.0)
+        async def falha(x):
+            raise RuntimeError("serviço indisponível")
+        with pytest.raises(TypeError) as erro:
+            asyncio.run(integral_async(falha, 0, 1, 10, plotar=False))
+        assert isinstance(erro.value.__cause__, RuntimeError)
+        async def nan(x):
+            return math.nan
+        with pytest.raises(TypeError):
+            asyncio.run(integral_async(nan, 0, 1, 10, plotar=False))
+        with pytest.raises(TypeError):
+            asyncio.run(integral_async(lambda x: x, 0, 1, 10, concorrencia=0, plotar=False))
+        with pytest.raises(NameError):
+            asyncio.run(integral_async(lambda x: x, 0, 1, 10, metodo="adaptativo", plotar=False))
+
+
+class TestMonteCarlo:
+
+    GAUSS_5D = (math.sqrt(math.pi) / 2 * math.erf(1))**5
+
+    @staticmethod
+    def gaussiana(x):
+        return np.exp(-np.sum(x**2, axis=1))
+
+    def test_sobol_primeiros_pontos_e_estratificacao(self):
+        P = integracao._pontos_sobol(0, 64, 21) * 2.0**-32
+        assert np.array_equal(P[:4, :3], [[0, 0, 0], [0.5, 0.5, 0.5], [0.75, 0.25, 0.25], [0.25, 0.75, 0.75]])
+        for j in range(21):
+            assert len(set((P[:, j] * 64).astype(int))) == 64
+        # as duas primeiras dimensões formam uma (0, 6, 2)-rede
+        for i in range(7):
+            assert len(set(zip((P[:, 0] * 2**i).astype(int), (P[:, 1] * 2**(6 - i)).astype(int)))) == 64
+
+    @pytest.mark.parametrize("metodo", ["monte_carlo", "sobol", "halton"])
+    def test_erro_estimado_compativel(self, metodo):
+        area = integral_monte_carlo(self.gaussiana, [0]*5, [1]*5, metodo=metodo, n_max=2**17, semente=7)
+        assert area.n_avaliacoes == 2**17
+        assert abs(area - self.GAUSS_5D) < 5 * area.erro_estimado
+
+    def test_quasi_monte_carlo_mais_preciso(self):
+        mc = integral_monte_carlo(self.gaussiana, [0]*5, [1]*5, n_max=2**16, semente=1)
+        qmc = integral_monte_carlo(self.gaussiana, [0]*5, [1]*5, metodo="sobol", n_max=2**16, semente=1)
+        assert qmc.erro_estimado < mc.erro_estimado / 10
+
+    def test_para_ao_atingir_tol(self):
+        area = integral_monte_carlo(self.gaussiana, [0]*5, [1]*5, metodo="sobol", tol=1e-5, semente=1)
+        assert area.erro_estimado <= 1e-5
+        assert area.n_avaliacoes < 10**6
+        with pytest.raises(RuntimeError):
+            integral_monte_carlo(self.gaussiana, [0]*5, [1]*5, tol=1e-9, n_max=10**4, semente=1)
+
+    @pytest.mark.parametrize("metodo, n_max, esperado", [
+        ("monte_carlo", 1001, 1001), ("monte_carlo", 7, 7), ("sobol", 1001, 1000), ("halton", 87, 80),
+    ])
+    def test_orcamento_nunca_ultrapassado(self, metodo, n_max, esperado):
+        avaliacoes = []
+        def f(x):
+            avaliacoes.append(len(x))
+            return self.gaussiana(x)
+        area = integral_monte_carlo(f, [0]*3, [1]*3, metodo=metodo, n_max=n_max, lote=64, semente=2,
+                                    workers=3, executor="threads")
+        assert area.n_avaliacoes == sum(avaliacoes) == esperado <= n_max
+
+    @pytest.mark.parametrize("metodo", ["monte_carlo", "sobol", "halton"])
+    def test_reprodutivel_por_semente_e_workers(self, metodo):
+        f = lambda x: np.cos(x[:, 0]) * x[:, 1]
+        args = (f, [0, 0], [1, 2])
+        sequencial = integral_monte_carlo(*args, metodo=metodo, n_max=50000, semente=3, workers=4, executor=ThreadPoolExecutor(1))
+        threads = integral_monte_carlo(*args, metodo=metodo, n_max=50000, semente=3, workers=4, executor="threads")
+        assert sequencial == threads
+        assert integral_monte_carlo(*args, metodo=metodo, n_max=50000, semente=4, workers=4, executor="threads") != threads
+
+    def test_processos_e_uma_dimensao(self):
+        area = integral_monte_carlo(np.cos, 0, math.pi / 2, metodo="halton", n_max=2**14, semente=0, workers=2)
+        assert math.isclose(area, 1.0, abs_tol=1e-3)
+        escalar = integral_monte_carlo(math.cos, 0, math.pi / 2, metodo="halton", n_max=2**14, semente=0, workers=2,
+                                       executor="threads")
+        assert math.isclose(escalar, area, rel_tol=1e-14)
+
+    def test_entradas_invalidas(self):
+        with pytest.raises(NameError):
+            integral_monte_carlo(np.cos, 0, 1, metodo="grade")
+        with pytest.raises(TypeError):
+            integral_monte_carlo(np.cos, [0, 0], [1])
+        with pytest.raises(OverflowError):
+            integral_monte_carlo(np.cos, 0, math.inf)
+        with pytest.raises(ValueError):
+            integral_monte_carlo(np.cos, [0]*22, [1]*22, metodo="sobol")
+        with pytest.raises(ValueError):
+            integral_monte_carlo(np.cos, 0, 1, tol=-1)
+        with pytest.raises(TypeError):
+            integral_monte_carlo(np.cos, 0, 1, metodo="sobol", replicas=1)
+        with pytest.raises(TypeError):
+            integral_monte_carlo(np.cos, 0, 1, metodo="halton", n_max=7, replicas=8)
+
+
+class TestND:
+
+    @staticmethod
+    def gaussiana(x):
+        return np.exp(-np.sum(x**2, axis=1))
+
+    @staticmethod
+    def exato(d):
+        return (math.sqrt(math.pi) / 2 * math.erf(1))**d
+
+    @pytest.mark.parametrize("metodo", ["trapezio", "simpson", "gauss"])
+    def test_uma_dimensao_igual_a_integral(self, metodo):
+        area = integral_nd(np.sin, 0, np.pi, 40, metodo=metodo, ordem=3)
+        esperado = integral(np.sin, 0, np.pi, 40, plotar=False, metodo=metodo, ordem=3)
+        assert math.isclose(area, esperado, rel_tol=1e-14)
+        assert area.n_avaliacoes == esperado.n_avaliacoes
+
+    def test_produto_tensorial_em_blocos(self):
+        inteiro = integral_nd(self.gaussiana, [0]*3, [1]*3, 12, metodo="simpson")
+        em_blocos = integral_nd(self.gaussiana, [0]*3, [1]*3, 12, metodo="simpson", tamanho_bloco=1000)
+        assert inteiro.n_avaliacoes == em_blocos.n_avaliacoes == 25**3
+        assert math.isclose(inteiro, em_blocos, rel_tol=1e-14)
+        assert math.isclose(inteiro, self.exato(3), rel_tol=1e-7)
+
+    def test_chamadas_limitadas_pelo_bloco(self):
+        tamanhos = []
+        def f(x):
+            tamanhos.append(len(x))
+            return x[:, 0] * x[:, 1]
+        area = integral_nd(f, [0, 0], [1, 2], [10, 20], tamanho_bloco=50)
+        assert max(tamanhos) == 50 and sum(tamanhos) == 11 * 21
+        assert math.isclose(area, 1.0, rel_tol=1e-14)
+
+    def test_gauss_exato_para_polinomios(self):
+        f = lambda x: x[:, 0]**5 * x[:, 1]**3
+        assert math.isclose(integral_nd(f, [0, -1], [1, 2], 1, metodo="gauss", ordem=3), (16 - 1) / 24, rel_tol=1e-13)
+
+    def test_smolyak_exato_para_grau_total(self):
+        nivel = 4
+        f = lambda x: x[:, 0]**3 * x[:, 1]**2 * x[:, 2]**2 + x[:, 3]**(2*nivel - 1)
+        area = integral_nd(f, [0]*6, [1]*6, metodo="smolyak", nivel=nivel)
+        assert math.isclose(area, 1/36 + 1/8, rel_tol=1e-12)
+
+    def test_smolyak_dimensao_alta(self):
+        area = integral_nd(self.gaussiana, [0]*10, [1]*10, metodo="smolyak", nivel=5)
+        assert math.isclose(area, self.exato(10), rel_tol=1e-4)
+        # o produto tensorial com 5 nós por direção usaria 5^10 ~ 10^7 pontos
+        assert area.n_avaliacoes < 10**4
+
+    def test_caminho_escalar(self):
+        area = integral_nd(lambda x: math.exp(x[0] + x[1]), [0, 0], [1, 1], 4, metodo="gauss", ordem=4, vetorizado=False)
+        assert math.isclose(area, (math.e - 1)**2, rel_tol=1e-12)
+
+    def test_entradas_invalidas(self):
+        with pytest.raises(NameError):
+            integral_nd(self.gaussiana, [0, 0], [1, 1], metodo="romberg")
+        with pytest.raises(TypeError):
+            integral_nd(self.gaussiana, [0, 0], [1, 1], [4, 0])
+        with pytest.raises(TypeError):
+            integral_nd(self.gaussiana, [0, 0], [1, 1], metodo="smolyak", nivel=0)
+        with pytest.raises(OverflowError):
+            integral_nd(self.gaussiana, [0, 0], [1, math.inf])
+        assert integral_nd(self.gaussiana, [0, 0], [1, 0]) == 0.0
+
+
+class TestTanhSinh:
+
+    @pytest.mark.parametrize("f, a, b, exato", [
+        (lambda x: 1 / np.sqrt(x), 0, 1, 2.0),
+        (np.log, 0, 1, -1.0),
+        (lambda x: x**-0.9, 0, 1, 10.0),
+        (lambda x: np.log(x - 2), 2, 3, -1.0),
+        (lambda x: 1 / (1 + x*x), 0, math.inf, math.pi / 2),
+        (lambda x: np.exp(-x) / np.sqrt(x), 0, math.inf, math.sqrt(math.pi)),
+        (np.exp, -math.inf, 0, 1.0),
+        (lambda x: np.exp(-x*x), -math.inf, math.inf, math.sqrt(math.pi)),
+    ])
+    def test_singularidades_e_intervalos_infinitos(self, f, a, b, exato):
+        area = integral_tanh_sinh(f, a, b, plotar=False)
+        assert math.isclose(area, exato, rel_tol=1e-13)
+        assert area.n_avaliacoes < 700
+
+    @pytest.mark.parametrize("f, a, b, exato", [
+        (lambda x, da, db: 1 / np.sqrt(da), 1, 2, 2.0),
+        (lambda x, da, db: 1 / np.sqrt(da * db), 1, 3, math.pi),
+        (lambda x, da, db: np.log(db), 5, 6, -1.0),
+        (lambda x, da, db: np.exp(-da) / np.sqrt(da), 3, math.inf, math.sqrt(math.pi)),
+    ])
+    def test_singularidade_deslocada_com_distancias(self, f, a, b, exato):
+        # x - a calculado dentro de f perderia dígitos perto de a = 1
+        with pytest.raises(RuntimeError):
+            integral_tanh_sinh(lambda x: 1 / np.sqrt(x - 1), 1, 2, plotar=False)
+        area = integral_tanh_sinh(f, a, b, plotar=False, distancias=True)
+        assert math.isclose(area, exato, rel_tol=1e-13)
+        escalar = integral_tanh_sinh(lambda x, da, db: float(f(x, da, db)), a, b, plotar=False, distancias=True)
+        assert escalar == area
+
+    def test_ponto_medio_precisaria_de_muito_mais_avaliacoes(self):
+        f = lambda x: 1 / np.sqrt(x)
+        area = integral_tanh_sinh(f, 0, 1, plotar=False)
+        medio = integral(f, 0, 1, 10**4, plotar=False, metodo="ponto_medio")
+        assert area.n_avaliacoes < 100
+        assert abs(area - 2) < 1e-14 < 1e-3 < abs(medio - 2)
+
+    def test_extremos_nunca_avaliados_e_niveis_em_cache(self):
+        pontos = []
+        def f(x):
+            pontos.append(x)
+            return 1 / math.sqrt(x) + math.log(1 - x)
+        area = integral_tanh_sinh(f, 0, 1, plotar=False, vetorizado=False)
+        assert math.isclose(area, 1.0, rel_tol=1e-12)
+        assert 0 < min(pontos) and max(pontos) < 1
+        assert len(set(pontos)) == len(pontos) == area.n_avaliacoes
+        assert ("tanh_sinh", 0) in integracao._CACHE_TANH_SINH
+        t, s, w = integracao._nivel_tanh_sinh("tanh_sinh", 1)
+        assert t is integracao._nivel_tanh_sinh("tanh_sinh", 1)[0]
+        assert np.all(np.abs(t * 2) % 2 == 1)
+
+    def test_orientacao_e_intervalo_vazio(self):
+        assert math.isclose(integral_tanh_sinh(np.sin, math.pi, 0, plotar=False), -2.0, rel_tol=1e-14)
+        assert integral_tanh_sinh(np.sin, 1, 1, plotar=False) == 0.0
+
+    def test_um_nivel(self):
+        # com max_niveis=1 a comparação entre os níveis 0 e 1 decide a convergência
+        area = integral_tanh_sinh(lambda x: 1.0, 0, 1, plotar=False, max_niveis=1, tol=0.1)
+        assert math.isclose(area, 1.0, rel_tol=1e-5) and area.n_avaliacoes == 19
+        with pytest.raises(RuntimeError):
+            integral_tanh_sinh(lambda x: 1.0, 0, 1, plotar=False, max_niveis=1)
+
+    def test_nao_convergencia_e_entradas_invalidas(self):
+        with pytest.raises(RuntimeError):
+            integral_tanh_sinh(np.sin, 0, math.inf, plotar=False, max_niveis=3)
+        with pytest.raises(TypeError):
+            integral_tanh_sinh(np.sin, math.nan, 1, plotar=False)
+        with pytest.raises(ValueError):
+            integral_tanh_sinh(np.sin, 0, 1, tol=0, plotar=False)
+        with pytest.raises(TypeError):
+            integral_tanh_sinh(np.sin, 0, 1, max_niveis=0, plotar=False)
+
+
+class TestClenshawCurtis:
+
+    def test_pesos(self):
+        for n in (2, 4, 16, 256):
+            w = integracao._pesos_clenshaw_curtis(n)
+            x = np.cos(np.arange(n + 1) * math.pi / n)
+            assert math.isclose(w.sum(), 2.0, rel_tol=1e-14)
+            # exata para polinômios de grau até n
+            assert math.isclose(w @ x**n, 2 / (n + 1), rel_tol=1e-12)
+            assert np.allclose(w, w[::-1])
+        assert np.allclose(integracao._pesos_clenshaw_curtis(2), [1/3, 4/3, 1/3])
+        assert integracao._pesos_clenshaw_curtis(16) is integracao._pesos_clenshaw_curtis(16)
+
+    def test_convergencia_espectral(self):
+        exato = math.sqrt(math.pi) / 2 * math.erf(2)
+        area = integral_clenshaw_curtis(lambda x: np.exp(-x**2), 0, 2, plotar=False)
+        assert math.isclose(area, exato, rel_tol=1e-14)
+        assert area.erro_estimado <= 1e-12
+        assert area.n_avaliacoes < integral_romberg(lambda x: np.exp(-x**2), 0, 2, plotar=False).n_avaliacoes
+
+    def test_reaproveita_avaliacoes(self):
+        pontos = []
+        def f(x):
+            pontos.append(x)
+            return math.cos(3 * x)
+        area = integral_clenshaw_curtis(f, -1, 2, plotar=False, vetorizado=False)
+        assert math.isclose(area, (math.sin(6) + math.sin(3)) / 3, rel_tol=1e-13)
+        assert len(pontos) == len(set(pontos)) == area.n_avaliacoes
+        assert np.all(np.diff(area.nos) > 0) and area.nos[0] == -1 and area.nos[-1] == 2
+
+    def test_plot(self, monkeypatch):
+        monkeypatch.setattr(plt, "show", lambda: None)
+        plt.close("all")
+        area = integral_clenshaw_curtis(np.cos, 0, 1)
+        assert np.array_equal(plt.gca().lines[0].get_xdata(), area.nos)
+        plt.close("all")
+
+    def test_um_nivel(self):
+        # a primeira comparação já é exata: converge no único nível permitido
+        area = integral_clenshaw_curtis(lambda x: 1.0, 0, 1, plotar=False, max_niveis=1)
+        assert math.isclose(area, 1.0, rel_tol=1e-15) and area.n_avaliacoes == 5
+        assert math.isclose(integral_clenshaw_curtis(lambda x: x**3, 0, 2, plotar=False, max_niveis=1), 4.0, rel_tol=1e-15)
+        with pytest.raises(RuntimeError):
+            integral_clenshaw_curtis(np.exp, 0, 1, plotar=False, max_niveis=1)
+
+    def test_nao_convergencia_e_entradas_invalidas(self):
+        with pytest.raises(RuntimeError):
+            integral_clenshaw_curtis(np.sqrt, 0, 1, plotar=False, max_niveis=4)
+        with pytest.raises(OverflowError):
+            integral_clenshaw_curtis(np.cos, 0, math.inf, plotar=False)
+        with pytest.raises(ValueError):
+            integral_clenshaw_curtis(np.cos, 0, 1, tol=-1, plotar=False)
+        assert integral_clenshaw_curtis(np.cos, 1, 1, plotar=False) == 0.0
+
+
+class TestOscilatoria:
+
+    @staticmethod
+    def exato(omega):
+        # ∫_0^1 e^x e^{iωx} dx
+        return (complex(math.e) * complex(math.cos(omega), math.sin(omega)) - 1) / complex(1, omega)
+
+    @pytest.mark.parametrize("omega", [0, 1, 50, 1000, 5000, 1e6])
+    def test_custo_independente_de_omega(self, omega):
+        exato = self.exato(omega)
+        cosseno = integral_oscilatoria(np.exp, 0, 1, omega, n=8)
+        seno = integral_oscilatoria(np.exp, 0, 1, omega, n=8, oscilador="sin")
+        assert cosseno.n_avaliacoes == seno.n_avaliacoes == 8 * 8 + 1
+        assert abs(cosseno - exato.real) < 1e-13 * max(1.0, abs(exato))
+        assert abs(seno - exato.imag) < 1e-13 * max(1.0, abs(exato))
+
+    def test_trapezio_precisaria_resolver_as_oscilacoes(self):
+        exato = self.exato(2000).real
+        filon = integral_oscilatoria(np.exp, 0, 1, 2000, n=4)
+        trapezio = integral(lambda x: np.exp(x) * np.cos(2000 * x), 0, 1, filon.n_avaliacoes - 1, plotar=False)
+        assert abs(filon - exato) < 1e-15 < 1e-4 < abs(trapezio - exato)
+
+    def test_escalar_e_intervalo_invertido(self):
+        g = lambda x: 1 / (1 + x * x)
+        vetorial = integral_oscilatoria(g, -2, 3, 300, n=20)
+        escalar = integral_oscilatoria(lambda x: 1 / (1 + x * x), -2, 3, 300, n=20, vetorizado=False)
+        assert math.isclose(vetorial, escalar, rel_tol=1e-12)
+        assert math.isclose(integral_oscilatoria(g, 3, -2, 300, n=20), -vetorial, rel_tol=1e-12)
+        assert math.isclose(vetorial, integral_oscilatoria(g, -2, 3, 300, n=80, grau=12), rel_tol=1e-10)
+
+    def test_entradas_invalidas(self):
+        with pytest.raises(NameError):
+            integral_oscilatoria(np.exp, 0, 1, 10, oscilador="tan")
+        with pytest.raises(OverflowError):
+            integral_oscilatoria(np.exp, 0, 1, math.inf)
+        with pytest.raises(TypeError):
+            integral_oscilatoria(np.exp, 0, 1, 10, grau=0)
+        with pytest.raises(TypeError):
+            integral_oscilatoria(np.exp, 0, 1, 10, n=0)
+        assert integral_oscilatoria(np.exp, 1, 1, 10) == 0.0
+
+
+class TestInterpolante:
+
+    def test_linear_por_partes(self):
+        from CB2325NumericaG3.interpolacao import linear_interp
+        p = linear_interp([3, 0, 1, 2.5, 5], [1, 2, -1, 4, 0], plot=False)
+        # soma dos trapézios entre os pontos ordenados
+        assert math.isclose(integral_interpolante(p, 0, 5), 0.5 + 2.25 + 1.25 + 1.0, rel_tol=1e-15)
+        # dentro de uma parte e com extrapolação linear nas partes extremas
+        assert math.isclose(integral_interpolante(p, 1, 2), 2 / 3, rel_tol=1e-15)
+        assert math.isclose(integral_interpolante(p, -1, 0), 3.5, rel_tol=1e-15)
+        assert math.isclose(integral_interpolante(p, 5, 6), -0.25, rel_tol=1e-15)
+        assert integral_interpolante(p, 4, 2) == -integral_interpolante(p, 2, 4)
+
+    @pytest.mark.parametrize("metodo", ["lagrange", "newton", "vandermonde"])
+    def test_polinomial(self, metodo):
+        from CB2325NumericaG3.interpolacao import poly_interp
+        p = poly_interp([0, 1, 2, 3], [0, 1, 8, 27], method=metodo, plot=False)
+        assert math.isclose(integral_interpolante(p, -1, 2), 15 / 4, rel_tol=1e-13)
+        assert isinstance(integral_interpolante(p, 0, 1), float)
+
+    def test_hermite(self):
+        from CB2325NumericaG3.interpolacao import hermite_interp
+        H = hermite_interp([0, 1], [[0, 0], [1, 3]], plot=False)   # x^3
+        assert math.isclose(integral_interpolante(H, 0, 2), 4.0, rel_tol=1e-14)
+        H = hermite_interp([0.5], [[1, 2, 2]], plot=False)          # 1 + 2(x-0.5) + (x-0.5)^2
+        assert math.isclose(integral_interpolante(H, 0, 1), 1 + 1/12, rel_tol=1e-14)
+
+    def test_pecas_calculadas_uma_vez_e_somente_leitura(self):
+        from CB2325NumericaG3.interpolacao import linear_interp, poly_interp, hermite_interp
+        for p in (linear_interp([0, 1, 2], [1, 3, 2], plot=False),
+                  poly_interp([0, 1, 2], [1, 3, 2], method="lagrange", plot=False),
+                  hermite_interp([0, 1], [[0, 0], [1, 3]], plot=False)):
+            quebras, coeficientes = p.pecas()
+            assert p.pecas()[1] is coeficientes
+            with pytest.raises(ValueError):
+                coeficientes[0, 0] = 100.0
+            with pytest.raises(ValueError):
+                quebras[0] = -1.0
+
+    def test_vetorizado_sobre_intervalos(self):
+        from CB2325NumericaG3.interpolacao import linear_interp
+        x = np.linspace(0, np.pi, 1001)
+        p = linear_interp(list(x), list(np.sin(x)), plot=False)
+        inicios = np.linspace(0, 3, 10**5)
+        areas = integral_interpolante(p, inicios, inicios + 0.1)
+        assert areas.shape == inicios.shape
+        assert np.allclose(areas, np.cos(inicios) - np.cos(inicios + 0.1), atol=1e-6)
+        assert math.isclose(areas[123], integral(p, inicios[123], inicios[123] + 0.1, 20000, plotar=False,
+                                                 vetorizado=False), rel_tol=1e-7)
+
+    def test_entradas_invalidas(self):
+        from CB2325NumericaG3.interpolacao import poly_interp
+        with pytest.raises(TypeError):
+            integral_interpolante(np.sin, 0, 1)
+        p = poly_interp([0, 1], [0, 1], plot=False)
+        with pytest.raises(TypeError):
+            integral_interpolante(p, math.nan, 1)
+        with pytest.raises(OverflowError):
+            integral_interpolante(p, 0, math.inf)
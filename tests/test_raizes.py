@@ -1,9 +1,10 @@
 # tests/test_raizes.py
 import sys, os, pytest, matplotlib, math
 import matplotlib.pyplot as plt
+import numpy as np
 from matplotlib.collections import PathCollection
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-from CB2325NumericaG3.raizes import bissecao, newton_raphson, secante, raiz
+from CB2325NumericaG3.raizes import bissecao, newton_raphson, newton_raphson_lote, halley, secante, brent, raiz, bissecao_multiraizes, _bissecao_em_lote
 matplotlib.use("Agg") 
 import CB2325NumericaG3.visualizacao_raizes as vg
 
@@ -177,6 +178,116 @@ class TestNewtonRaphson:
         assert math.isclose(r, 3.0, abs_tol=1e-10)
         assert isinstance(hist, list)
 
+    def test_derivada_automatica(self):
+        # Com funções do NumPy, f e f' saem de uma única avaliação por iteração
+        chamadas = []
+        f = lambda x: chamadas.append(x) or np.cos(x) - x
+        r, hist = newton_raphson(f, x0=0.5, tol=1e-12, graf=False, retornar_historico=True)
+        assert math.isclose(r, 0.7390851332151607, abs_tol=1e-14)
+        # Uma chamada por iteração (antes eram três: f(x), f(x+h) e f(x-h))
+        assert len(chamadas) <= len(hist)
+
+    def test_derivada_automatica_em_lote(self):
+        chamadas = []
+        def f(x, c):
+            chamadas.append(x)
+            return np.exp(x) - c
+        c = np.array([2.0, 3.0, 10.0])
+        raizes, iteracoes, convergiu = newton_raphson_lote(f, 0.0, args=(c,), tol=1e-12)
+        assert convergiu.all()
+        assert np.allclose(raizes, np.log(c), rtol=1e-14)
+        assert len(chamadas) <= iteracoes.max() + 1
+
+
+class TestHalley:
+    def test_convergencia(self):
+        r = halley(lambda x: x**3 - 9*x + 5, 3.0, tol=1e-12, graf=False)
+        assert math.isclose(r, 2.6696638406422255, abs_tol=1e-12)
+
+    def test_menos_iteracoes_que_newton(self):
+        f = lambda x: np.exp(x) - 10
+        _, hist_newton = newton_raphson(f, 5.0, tol=1e-12, graf=False, retornar_historico=True)
+        _, hist_halley = halley(f, 5.0, tol=1e-12, graf=False, retornar_historico=True)
+        assert len(hist_halley) < len(hist_newton)
+
+    def test_derivadas_fornecidas(self):
+        f = lambda x: math.cos(x) - x
+        df = lambda x: -math.sin(x) - 1
+        d2f = lambda x: -math.cos(x)
+        r = halley(f, 0.5, df=df, d2f=d2f, tol=1e-12, graf=False)
+        assert math.isclose(r, 0.7390851332151607, abs_tol=1e-12)
+
+    def test_so_primeira_derivada_fornecida(self):
+        # f'' vem da diferenciação automática, mas a df fornecida é usada
+        chamadas = []
+        def df(x):
+            chamadas.append(x)
+            return -np.sin(x) - 1
+        r, h = halley(lambda x: np.cos(x) - x, 0.5, df=df, tol=1e-12, graf=False, retornar_historico=True)
+        assert math.isclose(r, 0.7390851332151607, abs_tol=1e-12)
+        assert len(chamadas) >= len(h) - 1 and chamadas == h[:len(chamadas)]
+
+    def test_diferencas_finitas(self):
+        # math.cos não aceita números duais: recai nas diferenças centrais
+        r = halley(lambda x: math.cos(x) - x, 0.5, tol=1e-10, graf=False)
+        assert math.isclose(r, 0.7390851332151607, abs_tol=1e-9)
+
+    def test_derivada_zero(self):
+        with pytest.raises(RuntimeError):
+            halley(lambda x: x**2 + 1, 0.0, graf=False)
+
+    def test_nao_converge(self):
+        with pytest.raises(RuntimeError):
+            halley(lambda x: x**2 - 2, 10.0, max_iter=1, graf=False)
+
+    def test_interface(self):
+        r = raiz(lambda x: x**2 - 2, x0=1.0, method="halley", graf=False)
+        assert math.isclose(r, math.sqrt(2), abs_tol=1e-6)
+        with pytest.raises(ValueError):
+            raiz(lambda x: x, method="halley", graf=False)
+
+
+class TestNewtonRaphsonLote:
+    def test_parametros(self):
+        c = np.linspace(1, 100, 10**5)
+        raizes, iteracoes, convergiu = newton_raphson_lote(lambda x, c: x**2 - c, c, args=(c,), tol=1e-12)
+        assert convergiu.all()
+        assert np.allclose(raizes, np.sqrt(c), rtol=1e-12)
+        assert iteracoes.shape == c.shape and iteracoes.max() < 15
+
+    def test_igual_escalar(self):
+        f = lambda x: np.cos(x) - x
+        x0 = [0.5, 3.0, -2.0]
+        raizes, iteracoes, convergiu = newton_raphson_lote(f, x0)
+        assert convergiu.all()
+        for x, r, n in zip(x0, raizes, iteracoes):
+            r_escalar, h = newton_raphson(lambda t: math.cos(t) - t, x, graf=False, retornar_historico=True)
+            assert math.isclose(r, r_escalar, abs_tol=1e-12)
+            assert n == len(h) - 1
+
+    def test_derivada_e_broadcasting(self):
+        f = lambda x, a, b: a * x - b
+        df = lambda x, a, b: a
+        raizes, _, convergiu = newton_raphson_lote(f, [[0.0], [10.0]], df=df, args=([1.0, 2.0, 4.0], 8.0))
+        assert raizes.shape == (2, 3)
+        assert convergiu.all()
+        assert np.allclose(raizes, [[8, 4, 2], [8, 4, 2]])
+
+    def test_falhas_nao_interrompem(self):
+        # x0 = √(2/3) tem derivada nula e x0 = 0 entra em ciclo (0 -> 1 -> 0); -2 converge
+        f = lambda x: x**3 - 2*x + 2
+        df = lambda x: 3*x**2 - 2
+        raizes, iteracoes, convergiu = newton_raphson_lote(f, [math.sqrt(2/3), 0.0, -2.0], df=df, max_iter=50)
+        assert convergiu.tolist() == [False, False, True]
+        assert iteracoes[0] == 0
+        assert iteracoes[1] == 50
+        assert math.isclose(raizes[2], -1.7692923542386314, abs_tol=1e-6)
+
+    def test_valores_nao_finitos(self):
+        raizes, iteracoes, convergiu = newton_raphson_lote(lambda x: np.sqrt(x) - 1, [-1.0, 0.5])
+        assert not convergiu[0] and iteracoes[0] == 0
+        assert convergiu[1] and math.isclose(raizes[1], 1.0, abs_tol=1e-6)
+
 
 class TestSecante:
     def test_divisao_zero(self):
@@ -235,12 +346,66 @@ class TestSecante:
         assert math.isclose(r, 2.0, abs_tol=1e-6)
 
 
+class TestBrent:
+    def test_sinais_iguais(self):
+        with pytest.raises(ValueError):
+            brent(lambda x: x**2 + 1, -1, 1, graf=False)
+
+    def test_extremo_raiz(self):
+        assert brent(lambda x: x - 1, 1, 3, graf=False) == 1
+        assert brent(lambda x: x - 3, 1, 3, graf=False) == 3
+
+    def test_funcao_cubica(self):
+        r = brent(lambda x: x**3 - 9*x + 5, 0, 2, tol=1e-10, graf=False)
+        assert math.isclose(r, 0.5768875239163404, abs_tol=1e-9)
+
+    def test_trigonometrica(self):
+        r = brent(math.sin, 2, 4, tol=1e-12, graf=False)
+        assert math.isclose(r, math.pi, abs_tol=1e-12)
+
+    def test_poucas_avaliacoes(self):
+        for f, a, b in [(lambda x: x**3 - 9*x + 5, 0, 2),
+                        (lambda x: math.cos(x) - x, 0, 1),
+                        (lambda x: x**2 - 2, 1, 2)]:
+            chamadas_brent, chamadas_bissecao = [], []
+            brent(lambda x: chamadas_brent.append(x) or f(x), a, b, graf=False)
+            bissecao(lambda x: chamadas_bissecao.append(x) or f(x), a, b, graf=False)
+            assert len(chamadas_brent) <= 8
+            assert len(chamadas_brent) < len(chamadas_bissecao) / 2
+
+    def test_mantem_intervalo(self):
+        # Função muito plana perto da raiz: a interpolação é ruim e o
+        # método recai na bisseção, sem sair de [a, b]
+        r, h = brent(lambda x: (x - 1)**5, 0, 3, tol=1e-12, graf=False, retornar_historico=True)
+        assert all(0 <= x <= 3 for x in h)
+        assert abs(r - 1) < 1e-2
+
+    def test_nao_converge(self):
+        with pytest.raises(RuntimeError):
+            brent(lambda x: x**3 - 9*x + 5, 0, 2, tol=1e-14, max_iter=2, graf=False)
+
+    def test_historico(self):
+        r, h = brent(lambda x: x - 2, 0, 3, graf=False, retornar_historico=True)
+        assert math.isclose(r, 2.0, abs_tol=1e-6)
+        assert isinstance(h, list)
+        assert h[-1] == r
+
+
 class TestInterfaceRaiz:
-    def test_bissecao_padrao(self):
+    def test_metodo_padrao(self):
         f = lambda x: x**2 - 2
         r = raiz(f, a=1, b=2, tol=1e-10, graf=False)
         assert math.isclose(r, math.sqrt(2), abs_tol=1e-9)
 
+    def test_brent_padrao(self):
+        chamadas = []
+        f = lambda x: chamadas.append(x) or x**2 - 2
+        r = raiz(f, a=1, b=2, graf=False)
+        assert math.isclose(r, brent(lambda x: x**2 - 2, 1, 2, graf=False))
+        assert len(chamadas) <= 8
+        with pytest.raises(ValueError):
+            raiz(f, x0=1, graf=False)
+
     def test_alias_bissecao(self):
         f = lambda x: x - 3
         r = raiz(f, a=0, b=5, method="b", graf=False)
@@ -272,3 +437,86 @@ class TestInterfaceRaiz:
     def test_metodo_invalido(self):
         with pytest.raises(ValueError):
             raiz(lambda x: x, a=0, b=1, method="invalido", graf=False)
+
+
+class TestBissecaoMultiraizes:
+    def test_raizes_cubica(self):
+        f = lambda x: (x - 1) * (x + 2) * (x - 3.5)
+        raizes = bissecao_multiraizes(f, -5.003, 5, tol=1e-10)
+        assert len(raizes) == 3
+        for r, esperado in zip(raizes, [-2, 1, 3.5]):
+            assert math.isclose(r, esperado, abs_tol=1e-9)
+
+    def test_igual_bissecao_escalar(self):
+        f = lambda x: math.cos(3 * x) - x / 4
+        raizes = bissecao_multiraizes(f, -4, 4, subdivisoes=200, max_raizes=50)
+        h = 8 / 200
+        for r in raizes:
+            k = int((r + 4) // h)
+            esperado = bissecao(f, -4 + k * h, -4 + (k + 1) * h, graf=False)
+            assert math.isclose(r, esperado, abs_tol=1e-12)
+
+    def test_muitas_raizes_poucas_chamadas(self, capsys):
+        n = 10**4
+        chamadas = []
+        def f(x):
+            chamadas.append(np.shape(x))
+            return np.sin(x)
+        raizes = bissecao_multiraizes(f, 0.5, n * math.pi + 0.5, tol=1e-10,
+                                      max_raizes=n, subdivisoes=2 * n)
+        # Uma chamada na varredura e uma por iteração para todos os intervalos
+        assert chamadas[0] == (2 * n + 1,)
+        assert all(forma != () for forma in chamadas)
+        assert len(chamadas) <= 1 + 40
+        assert len(raizes) == n
+        assert np.allclose(raizes, np.pi * np.arange(1, n + 1), atol=1e-8)
+
+    def test_limite_de_raizes(self, capsys):
+        raizes = bissecao_multiraizes(math.sin, 0.5, 20.5, max_raizes=3)
+        assert len(raizes) == 3
+        assert "limite de 3 raízes" in capsys.readouterr().out
+
+    def test_funcao_so_escalar(self):
+        # math.sin não aceita arrays: a avaliação recai no laço escalar
+        raizes = bissecao_multiraizes(math.sin, -7, 7, tol=1e-10)
+        assert np.allclose(raizes, [-2 * math.pi, -math.pi, math.pi, 2 * math.pi], atol=1e-9)
+
+    def test_uma_avaliacao_por_iteracao(self):
+        chamadas = []
+        def f(x):
+            chamadas.append(np.shape(x))
+            return x**2 - 2
+        a = np.array([1.0, -2.0])
+        b = np.array([2.0, -1.0])
+        raizes, convergiu, _ = _bissecao_em_lote(f, a, b, f(a), f(b), tol=1e-12)
+        assert convergiu.all()
+        assert np.allclose(raizes, [math.sqrt(2), -math.sqrt(2)], atol=1e-11)
+        # Duas avaliações iniciais mais uma por iteração para o lote todo
+        assert all(forma in ((2,), (1,)) for forma in chamadas)
+        assert len(chamadas) <= 2 + 45
+
+    def test_varredura_avalia_cada_ponto_uma_vez(self):
+        pontos = []
+        def f(x):
+            pontos.append(x)
+            return math.sin(x)
+        subdivisoes = 500
+        bissecao_multiraizes(f, 0.5, 10, tol=1e-8, subdivisoes=subdivisoes)
+        # f só escalar: a primeira tentativa com o array inteiro falha
+        assert isinstance(pontos[0], np.ndarray)
+        varredura = pontos[1:subdivisoes + 2]
+        assert varredura == sorted(set(varredura))
+        # A tentativa não se repete no refinamento
+        refinamento = pontos[subdivisoes + 2:]
+        assert not any(isinstance(x, np.ndarray) for x in refinamento)
+        # Os extremos dos intervalos não são reavaliados na bisseção
+        assert set(refinamento).isdisjoint(varredura)
+
+    def test_varredura_vetorizada(self):
+        chamadas = []
+        def f(x):
+            chamadas.append(np.shape(x))
+            return np.cos(x)
+        bissecao_multiraizes(f, 0, 10, subdivisoes=10**5)
+        assert chamadas[0] == (10**5 + 1,)
+        assert all(forma != () for forma in chamadas)
@@ -1,6 +1,7 @@
-import sys, os, pytest
+import sys, os, math, pytest
+import numpy as np
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-from CB2325NumericaG3.soma_de_kahan import soma_normal_lista, soma_de_kahan_lista
+from CB2325NumericaG3.soma_de_kahan import soma_normal_lista, soma_de_kahan_lista, soma_de_kahan_array, soma_de_kahan_acumulada
 
 
 def test_soma_valores_discrepantes():
@@ -12,4 +13,21 @@ def test_soma_serie_harmonica():
     X = [1/(i+1) for i in range(10**6)]
     soma_ideal = 14.3927267228657236
     assert soma_normal_lista(X) != pytest.approx(soma_ideal, abs=1e-13)
-    assert soma_de_kahan_lista(X) == pytest.approx(soma_ideal, abs=1e-20)
\ No newline at end of file
+    assert soma_de_kahan_lista(X) == pytest.approx(soma_ideal, abs=1e-20)
+
+
+def test_soma_array_valores_discrepantes():
+    X = np.array([100000000] + [10**(-6) for i in range(10**6)])
+    assert X.sum() != 100000001
+    assert soma_de_kahan_array(X) == 100000001
+
+def test_soma_array_igual_fsum():
+    X = np.random.default_rng(0).standard_normal(10**6) * 10.0**np.arange(-8, 8).repeat(62500)
+    assert abs(soma_de_kahan_array(X) - math.fsum(X)) <= math.ulp(math.fsum(X))
+
+
+def test_soma_de_kahan_acumulada():
+    x = np.full(10**6, 0.1)
+    s = soma_de_kahan_acumulada(x)
+    assert s[-1] == 1e5 and s[9] == math.fsum(x[:10])
+    assert soma_de_kahan_acumulada([]).size == 0